@@ -1,20 +1,94 @@
 """A package contains a set of interfaces for `search-words-puzzle` app."""
-from typing import Tuple
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
-from puzzle.grids import (  # noqa: F401
-    Content,
-    Grid,
-    GridContent,
-    RandomWordsGrid,
-)
-from puzzle.puzzles import SearchPuzzle, SearchWordPuzzle  # noqa: F401
-from puzzle.properties import (
-    Coordinate,
-    GridSize,
-    LetterCoordinates,
-)
-from puzzle.words import HiddenWord, HiddenWords
-from puzzle.tools import start_word_search_puzzle, start_words_search_puzzle
+if TYPE_CHECKING:  # pragma: no cover
+    from puzzle.bitmasks import BitMaskSearchPuzzle  # noqa: F401
+    from puzzle.budgets import (  # noqa: F401
+        MemoryEstimate,
+        SearchMode,
+        estimate_search_memory,
+        peak_memory,
+        plan_search_memory,
+    )
+    from puzzle.costs import AutoSearchPuzzle, SearchCostModel  # noqa: F401
+    from puzzle.differential import (  # noqa: F401
+        DifferentialCase,
+        Mismatch,
+        check_case,
+        shrink,
+        soak,
+    )
+    from puzzle.engines import (  # noqa: F401
+        SearchEngine,
+        register_engine,
+        search_engine,
+        search_engines,
+    )
+    from puzzle.executors import (  # noqa: F401
+        Executor,
+        InlineExecutor,
+        ProcessExecutor,
+        ThreadExecutor,
+        create_executor,
+        is_free_threaded,
+    )
+    from puzzle.grids import (  # noqa: F401
+        CompactRows,
+        Content,
+        Grid,
+        GridContent,
+        MappedGrid,
+        ProceduralGrid,
+        RandomWordsGrid,
+    )
+    from puzzle.indexes import (  # noqa: F401
+        DictionarySearchPuzzle,
+        NGramSearchPuzzle,
+        SuffixArraySearchPuzzle,
+    )
+    from puzzle.placements import PlantedWordsGrid  # noqa: F401
+    from puzzle.puzzles import (  # noqa: F401
+        AxialSearchWordPuzzle,
+        BoundedSearchWordPuzzle,
+        SearchPuzzle,
+        SearchWordPuzzle,
+        is_word_pattern,
+    )
+    from puzzle.properties import (  # noqa: F401
+        Coordinate,
+        GridSize,
+        LetterCoordinates,
+        WordPlacement,
+    )
+    from puzzle.servers import (  # noqa: F401
+        SearchPuzzleClient,
+        SearchPuzzleServer,
+        ServerLimits,
+    )
+    from puzzle.sinks import (  # noqa: F401
+        CallbackSink,
+        CsvSink,
+        JsonLinesSink,
+        LogSink,
+        Sink,
+    )
+    from puzzle.words import HiddenWord, HiddenWords  # noqa: F401
+    from puzzle.tools import (  # noqa: F401
+        SearchBounds,
+        start_all_words_search_puzzle,
+        start_batch_search_puzzle,
+        start_tiled_search_puzzle,
+        start_word_search_puzzle,
+        start_words_search_puzzle,
+    )
+    from puzzle.tuning import (  # noqa: F401
+        calibrate,
+        compiled_modules,
+        load_cost_model,
+        plan_executor,
+        save_cost_model,
+    )
 
 
 __author__: str = 'Vladimir Yahello'
@@ -24,16 +98,164 @@ __copyright__: str = f'Copyright 2021, {__author__}'
 __version__: str = '0.0.2'
 __package_name__: str = 'search-words-puzzle'
 __all__: Tuple[str, ...] = (
+    'AutoSearchPuzzle',
+    'AxialSearchWordPuzzle',
+    'BitMaskSearchPuzzle',
+    'BoundedSearchWordPuzzle',
+    'CallbackSink',
+    'CompactRows',
     'Content',
     'Coordinate',
+    'CsvSink',
+    'DictionarySearchPuzzle',
+    'DifferentialCase',
+    'Executor',
     'Grid',
     'GridContent',
     'GridSize',
     'HiddenWord',
     'HiddenWords',
+    'InlineExecutor',
+    'JsonLinesSink',
     'LetterCoordinates',
+    'LogSink',
+    'MappedGrid',
+    'MemoryEstimate',
+    'Mismatch',
+    'NGramSearchPuzzle',
+    'PlantedWordsGrid',
+    'ProceduralGrid',
+    'ProcessExecutor',
+    'SearchBounds',
+    'SearchCostModel',
+    'SearchEngine',
+    'SearchMode',
     'SearchPuzzle',
+    'SearchPuzzleClient',
+    'SearchPuzzleServer',
     'SearchWordPuzzle',
+    'ServerLimits',
+    'Sink',
+    'SuffixArraySearchPuzzle',
+    'ThreadExecutor',
+    'WordPlacement',
+    'calibrate',
+    'check_case',
+    'compiled_modules',
+    'create_executor',
+    'estimate_search_memory',
+    'is_free_threaded',
+    'is_word_pattern',
+    'load_cost_model',
+    'peak_memory',
+    'plan_executor',
+    'plan_search_memory',
+    'register_engine',
+    'save_cost_model',
+    'search_engine',
+    'search_engines',
+    'shrink',
+    'soak',
+    'start_all_words_search_puzzle',
+    'start_batch_search_puzzle',
+    'start_tiled_search_puzzle',
     'start_word_search_puzzle',
     'start_words_search_puzzle',
 )
+_LAZY_INTERFACES: Dict[str, str] = {
+    'AutoSearchPuzzle': 'puzzle.costs',
+    'AxialSearchWordPuzzle': 'puzzle.puzzles',
+    'BitMaskSearchPuzzle': 'puzzle.bitmasks',
+    'BoundedSearchWordPuzzle': 'puzzle.puzzles',
+    'CallbackSink': 'puzzle.sinks',
+    'CompactRows': 'grids',
+    'Content': 'puzzle.grids',
+    'Coordinate': 'puzzle.properties',
+    'CsvSink': 'puzzle.sinks',
+    'DictionarySearchPuzzle': 'puzzle.indexes',
+    'DifferentialCase': 'puzzle.differential',
+    'Executor': 'puzzle.executors',
+    'Grid': 'puzzle.grids',
+    'GridContent': 'puzzle.grids',
+    'GridSize': 'puzzle.properties',
+    'HiddenWord': 'puzzle.words',
+    'HiddenWords': 'puzzle.words',
+    'InlineExecutor': 'puzzle.executors',
+    'JsonLinesSink': 'puzzle.sinks',
+    'LetterCoordinates': 'puzzle.properties',
+    'LogSink': 'puzzle.sinks',
+    'MappedGrid': 'puzzle.grids',
+    'MemoryEstimate': 'puzzle.budgets',
+    'Mismatch': 'puzzle.differential',
+    'NGramSearchPuzzle': 'puzzle.indexes',
+    'PlantedWordsGrid': 'puzzle.placements',
+    'ProceduralGrid': 'puzzle.grids',
+    'ProcessExecutor': 'puzzle.executors',
+    'RandomWordsGrid': 'puzzle.grids',
+    'SearchBounds': 'puzzle.tools',
+    'SearchCostModel': 'puzzle.costs',
+    'SearchEngine': 'puzzle.engines',
+    'SearchMode': 'puzzle.budgets',
+    'SearchPuzzle': 'puzzle.puzzles',
+    'SearchPuzzleClient': 'puzzle.servers',
+    'SearchPuzzleServer': 'puzzle.servers',
+    'SearchWordPuzzle': 'puzzle.puzzles',
+    'ServerLimits': 'puzzle.servers',
+    'Sink': 'puzzle.sinks',
+    'SuffixArraySearchPuzzle': 'puzzle.indexes',
+    'ThreadExecutor': 'puzzle.executors',
+    'WordPlacement': 'puzzle.properties',
+    'calibrate': 'puzzle.tuning',
+    'check_case': 'puzzle.differential',
+    'compiled_modules': 'puzzle.tuning',
+    'create_executor': 'puzzle.executors',
+    'estimate_search_memory': 'puzzle.budgets',
+    'is_free_threaded': 'puzzle.executors',
+    'is_word_pattern': 'puzzle.puzzles',
+    'load_cost_model': 'puzzle.tuning',
+    'peak_memory': 'puzzle.budgets',
+    'plan_executor': 'puzzle.tuning',
+    'plan_search_memory': 'puzzle.budgets',
+    'register_engine': 'puzzle.engines',
+    'save_cost_model': 'puzzle.tuning',
+    'search_engine': 'puzzle.engines',
+    'search_engines': 'puzzle.engines',
+    'shrink': 'puzzle.differential',
+    'soak': 'puzzle.differential',
+    'start_all_words_search_puzzle': 'puzzle.tools',
+    'start_batch_search_puzzle': 'puzzle.tools',
+    'start_tiled_search_puzzle': 'puzzle.tools',
+    'start_word_search_puzzle': 'puzzle.tools',
+    'start_words_search_puzzle': 'puzzle.tools',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a package interface on its first access (PEP 562).
+
+    Submodules are not imported along with a package, so a command line
+    tool does not pay for interfaces it does not use.
+
+    Args:
+        name: (str) a name of an interface e.g `SearchWordPuzzle`.
+
+    Returns:
+        any: a package interface.
+
+    Raises:
+        AttributeError: if a package does not contain an interface.
+    """
+    if name not in _LAZY_INTERFACES:
+        raise AttributeError(f'module "{__name__}" has no attribute "{name}"')
+    interface: Any = getattr(import_module(_LAZY_INTERFACES[name]), name)
+    globals()[name] = interface
+    return interface
+
+
+def __dir__() -> List[str]:
+    """Return package attributes along with lazily imported interfaces.
+
+    Returns:
+        list: a list of package attributes.
+    """
+    return sorted(set(globals()) | set(_LAZY_INTERFACES))
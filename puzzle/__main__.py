@@ -1,126 +1,576 @@
 """A module represents an entrypoint for `search-words-puzzle` app."""
-import random
-import re
+import json
+import signal
+import sys
 import textwrap
+import threading
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Generator, IO
+from typing import (
+    Any,
+    Generator,
+    IO,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
 
-from typer import Option, run
+from typer import Argument, Context, Option, Typer
 
-from puzzle.grids import Grid, RandomWordsGrid
-from puzzle.properties import GridSize
-from puzzle.tools import start_word_search_puzzle, start_words_search_puzzle
-from puzzle.words import HiddenWord, HiddenWords
+from puzzle.options import (
+    _GridOptions,
+    _grouped_options,
+    _options,
+    _OutputOptions,
+    _SearchOptions,
+    _ServerOptions,
+    _validate_puzzle_executor,
+    _validate_puzzle_grid_size,
+    _validate_puzzle_manifest_path,
+    _validate_puzzle_word,
+    _validate_puzzle_words_path,
+    _WordsOptions,
+)
 
+if TYPE_CHECKING:  # pragma: no cover
+    from puzzle.budgets import MemoryEstimate  # noqa: F401
+    from puzzle.differential import Mismatch  # noqa: F401
+    from puzzle.engines import SearchEngine  # noqa: F401
+    from puzzle.executors import Executor  # noqa: F401
+    from puzzle.grids import Grid  # noqa: F401
+    from puzzle.properties import GridSize  # noqa: F401
+    from puzzle.costs import SearchCostModel  # noqa: F401
+    from puzzle.sinks import Sink  # noqa: F401
+    from puzzle.tools import BatchGrid, PuzzleType, SearchBounds  # noqa: F401
 
-def _validate_puzzle_grid_size(grid_size: str) -> None:
-    """Validate puzzle grid size input parameter.
+# Puzzle interfaces are imported within commands to start the tool fast,
+# e.g. `--help` option should not pay for a search engine to be imported.
+# pylint:disable=import-outside-toplevel
+_app: Typer = Typer()
+
+
+@contextmanager
+def _output_sink(
+    output_format: str, output_path: Optional[Path]
+) -> Iterator['Sink']:
+    """Open a sink to stream found words to.
 
     Args:
-        grid_size: (str) the size of a grid.
+        output_format: (str) a format to stream found words with.
+        output_path: (Path) a path to a file, stdout is used if unset.
 
-    Raises:
-        ValueError: in case invalid input parameter.
+    Returns:
+        iterator: an opened sink.
     """
-    if not re.findall(string=grid_size, pattern=r'-?\d+x-?\d+'):
-        raise ValueError(
-            f'Specified "{grid_size}" grid size value is invalid. '
-            'It should match "NxN" pattern e e.g "10x10"!.'
-        )
+    from puzzle.sinks import CsvSink, JsonLinesSink, LogSink
+
+    if output_format == 'log':
+        yield LogSink()
+        return
+    with (
+        output_path.open('w', newline='')
+        if output_path
+        else nullcontext(sys.stdout)
+    ) as stream:  # type: IO[str]
+        with (
+            JsonLinesSink(stream)
+            if output_format == 'jsonl'
+            else CsvSink(stream)
+        ) as sink:  # type: Sink
+            yield sink
 
 
-def _validate_puzzle_word(word: str) -> None:
-    """Validate puzzle custom word input parameter.
+def _batch_grids(path: Path) -> Generator['BatchGrid', None, None]:
+    """Read grids from a batch manifest file path.
+
+    Every line of a manifest is a JSON object with grid identifier and rows
+    e.g `{"id": "grid-1", "rows": ["abc", "def"]}`.
 
     Args:
-        word: (str) a word to search.
+        path: (Path) a path to a manifest of grids.
 
-    Raises:
-        ValueError: in case invalid input parameter.
+    Returns:
+        generator: a generator of grid identifiers and rows.
     """
-    if not re.findall(string=word, pattern=r'^[a-z]+$'):
-        raise ValueError(
-            f'Specified "{word}" word value is invalid. It '
-            'should match "only lowercase letters" pattern e.g "foo"!.'
-        )
+    with path.open() as manifest:  # type: IO[str]
+        for line in manifest:  # type: str
+            if line.strip():
+                grid = json.loads(line)
+                yield str(grid['id']), grid['rows']
+
+
+@dataclass(frozen=True)
+class _SearchPlan:
+    """The class represents a resolved search of words in a grid."""
+
+    memory: 'MemoryEstimate'
+    executor_kind: str
+    executor: 'Executor'
+    puzzle_type: 'PuzzleType'
+    bounds: 'SearchBounds'
+
+
+def _search_puzzle_type(
+    engine: str, cost_model: 'SearchCostModel'
+) -> 'PuzzleType':
+    """Return a search puzzle of a registered search engine.
+
+    An `auto` engine picks a search puzzle for every word with costs of
+    a machine.
+
+    Args:
+        engine: (str) a name of a search engine.
+        cost_model: (SearchCostModel) costs of search engines of a machine.
+
+    Returns:
+        callable: a search puzzle to search words with.
+    """
+    from functools import partial
+
+    from puzzle.engines import search_engine
+    from puzzle.costs import AutoSearchPuzzle
+
+    puzzle_type = search_engine(engine).puzzle_type
+    if engine == 'auto':
+        return partial(AutoSearchPuzzle, cost_model=cost_model)
+    return puzzle_type
+
+
+def _search_executor(
+    size: 'GridSize',
+    words: Sequence[str],
+    executor_kind: str,
+    max_worker_tasks: int,
+    cost_model: 'SearchCostModel',
+) -> Tuple[str, 'Executor']:
+    """Return an executor of a search picked for a grid and words.
+
+    Args:
+        size: (GridSize) the size of a grid.
+        words: (sequence) words to search.
+        executor_kind: (str) a kind of an executor (see `create_executor`).
+        max_worker_tasks: (int) the amount of tasks to replace a worker after.
+        cost_model: (SearchCostModel) costs of search engines of a machine.
+
+    Returns:
+        tuple: a kind of an executor and a lazily started executor.
+    """
+    from loguru import logger
+
+    from puzzle.executors import create_executor
+    from puzzle.tuning import plan_executor
 
+    executor_kind, workers = plan_executor(
+        size.height * size.width, words, cost_model, executor_kind
+    )
+    logger.info(f'Words are searched with {workers} {executor_kind} workers')
+    return executor_kind, create_executor(
+        executor_kind, workers, max_tasks=max_worker_tasks
+    )
 
-def _validate_puzzle_words_path(path: Path) -> None:
-    """Validate puzzle words filepath input parameter.
+
+def _plan_search_memory(
+    grid: _GridOptions, words: Sequence[str], executor_kind: str, tiled: bool
+) -> 'MemoryEstimate':
+    """Return a storage and an engine of a search fitting a memory budget.
 
     Args:
-        path: (Path) a path to words to search.
+        grid: (_GridOptions) options of a grid.
+        words: (sequence) words to search.
+        executor_kind: (str) a kind of an executor (see `create_executor`).
+        tiled: (bool) whether a grid is able to be searched tile by tile.
+
+    Returns:
+        MemoryEstimate: an estimate of a picked storage and engine.
 
     Raises:
-        ValueError: in case invalid input parameter.
+        ValueError: if neither storage nor engine fit a budget.
     """
-    if path.suffix not in ('.txt', '.log'):
-        raise ValueError(
-            f'"{path}" file has invalid suffix ' f'"{path.suffix}"'
+    from loguru import logger
+
+    from puzzle.budgets import parse_memory_size, plan_search_memory
+
+    plan = plan_search_memory(
+        grid.size,
+        budget=parse_memory_size(grid.max_memory) if grid.max_memory else 0,
+        executor_kind=executor_kind,
+        procedural=grid.seed is not None,
+        tiled=tiled,
+        halo=max(map(len, words), default=1) - 1,
+    )
+    logger.info(f'Estimated memory usage: {plan}')
+    return plan
+
+
+def _plan_search(
+    grid: _GridOptions,
+    search_words: _WordsOptions,
+    search: _SearchOptions,
+    words: Sequence[str],
+) -> _SearchPlan:
+    """Resolve a search of words in a grid of letters.
+
+    A grid is searched tile by tile only by an `auto` engine of plain words
+    whose search is bound by neither a limit nor timeouts.
+
+    Args:
+        grid: (_GridOptions) options of a grid.
+        search_words: (_WordsOptions) options of words to search.
+        search: (_SearchOptions) options of a search.
+        words: (sequence) words to search.
+
+    Returns:
+        _SearchPlan: a resolved search.
+    """
+    from puzzle.puzzles import is_word_pattern
+    from puzzle.tuning import load_cost_model
+
+    cost_model = load_cost_model()
+    puzzle_type = _search_puzzle_type(search.engine, cost_model)
+    executor_kind, executor = _search_executor(
+        grid.size,
+        words,
+        'inline' if search_words.all_words else search.executor,
+        search.max_worker_tasks,
+        cost_model,
+    )
+    tiled: bool = bool(words) and search.engine == 'auto'
+    tiled = tiled and not any(
+        (
+            search_words.all_words,
+            is_word_pattern(search_words.word),
+            search.limit,
+            search.timeout,
+            search.word_timeout,
         )
+    )
+    return _SearchPlan(
+        _plan_search_memory(grid, words, executor_kind, tiled),
+        executor_kind,
+        executor,
+        puzzle_type,
+        search.bounds,
+    )
 
 
-def _random_words(path: Path, limit: int = 5) -> Generator[str, None, None]:
-    """Read random N words from a text file path.
+def _search_grid(size: 'GridSize', seed: Optional[int], storage: str) -> 'Grid':
+    """Return a grid of letters to search words in.
+
+    A grid of a seed is computed lazily (see `ProceduralGrid`), rows are
+    not stored then.
 
     Args:
-        path: (Path) a path to text file.
-        limit: (int) the amount of words to invoke.
+        size: (GridSize) the size of a grid.
+        seed: (int) a seed of a procedural grid (a random grid if unset).
+        storage: (str) a storage of rows: `rows`, `packed` or `procedural`.
 
     Returns:
-        generator: a generator N random words.
+        Grid: a random grid.
     """
-    with path.open() as payload:  # type: IO[str]
-        words = payload.read().split()
-        for _ in range(limit):  # type: int
-            yield random.choice(words)
+    from puzzle.grids import RandomWordsGrid
 
+    return RandomWordsGrid(size, seed=seed, packed=storage == 'packed')
 
-def _tool_chain(
-    grid_size: str = Option(
-        default='50x50',
+
+def _start_search(
+    grid: 'Grid',
+    sink: 'Sink',
+    words: List[str],
+    word: str,
+    plan: _SearchPlan,
+) -> None:
+    """Start a search of words in a grid of letters with a search plan.
+
+    A grid is searched tile by tile if a plan picks a tiled engine, a single
+    custom word is searched by a caller unless it is bound by timeouts.
+
+    Args:
+        grid: (Grid) a grid of letters.
+        sink: (Sink) a sink to stream found words to.
+        words: (list) words to search.
+        word: (str) a custom word or pattern to search.
+        plan: (_SearchPlan) a resolved search.
+    """
+    from puzzle.tools import (
+        start_tiled_search_puzzle,
+        start_word_search_puzzle,
+        start_words_search_puzzle,
+    )
+    from puzzle.words import HiddenWord, HiddenWords
+
+    if plan.memory.engine == 'tiled':
+        start_tiled_search_puzzle(
+            grid, words, sink, plan.memory.tile_size, plan.executor_kind
+        )
+    elif word and not (plan.bounds.timeout or plan.bounds.word_timeout):
+        start_word_search_puzzle(
+            HiddenWord(grid.content.to_coordinates(), word),
+            sink,
+            plan.bounds.limit,
+            plan.puzzle_type,
+        )
+    else:
+        start_words_search_puzzle(
+            HiddenWords(grid.content.to_coordinates(), iter(words)),
+            sink,
+            plan.executor,
+            plan.puzzle_type,
+            plan.bounds,
+        )
+
+
+def _log_peak_memory() -> None:
+    """Log peak resident memory of the process and of its largest worker."""
+    from loguru import logger
+
+    from puzzle.budgets import format_memory_size, peak_memory
+
+    process_memory, worker_memory = peak_memory()
+    logger.info(
+        f'Peak memory usage: {format_memory_size(process_memory)} of '
+        f'the process, {format_memory_size(worker_memory)} of its largest '
+        'worker'
+    )
+
+
+@_app.callback(invoke_without_command=True)
+@_grouped_options(_GridOptions, _WordsOptions, _SearchOptions, _OutputOptions)
+def _tool_chain(ctx: Context, **options: Any) -> None:
+    """The tool searches words in a randomly generated grid of letters."""
+    if ctx.invoked_subcommand is not None:
+        return
+    from puzzle.tools import start_all_words_search_puzzle
+
+    grid = _options(_GridOptions, options)
+    search_words = _options(_WordsOptions, options)
+    search = _options(_SearchOptions, options)
+    output = _options(_OutputOptions, options)
+    for group in (grid, output, search):  # type: Any
+        group.validate()
+    search_words.validate()
+    words: List[str] = search_words.words()
+    plan = _plan_search(grid, search_words, search, words)
+    with _output_sink(
+        output.output_format, output.output_path
+    ) as sink, _search_grid(
+        grid.size, grid.seed, plan.memory.storage
+    ) as letters:  # type: Sink, Grid
+        if search_words.all_words:
+            start_all_words_search_puzzle(
+                letters.content.to_coordinates(),
+                words,
+                sink,
+                search_words.min_length,
+                search_words.top,
+            )
+        else:
+            _start_search(letters, sink, words, search_words.word, plan)
+    _log_peak_memory()
+
+
+@_app.command(name='batch')
+def _batch_tool_chain(
+    manifest_path: Path = Argument(
+        ...,
         help=textwrap.dedent(
-            'The size for a randomly created grid of letters (a-z only).'
+            'A path to a JSON lines manifest of grids to search '
+            'e.g {"id": "grid-1", "rows": ["abc", "def"]}.'
         ),
     ),
     words_file_path: Path = Option(
         default=Path('payload/words.txt'),
         help=textwrap.dedent(
-            'A path to a custom text file with words to search.'
+            'A path to a custom text file with words to search in every grid.'
         ),
     ),
-    words_limit: int = Option(
-        default=5,
-        help=textwrap.dedent('Search N random words from a given text file.'),
+    executor: str = Option(
+        default='auto',
+        help=textwrap.dedent(
+            'An executor to search words with: "process", "thread", "inline" '
+            'or "auto" (threads if the GIL is disabled, processes otherwise).'
+        ),
     ),
-    word: str = Option(
-        default='',
+    engine: str = Option(
+        default='word',
         help=textwrap.dedent(
-            'A custom word to search in a grid of letters e.g "foo".'
+            'A search engine to search every grid with e.g "dictionary" '
+            '(see "engines" command).'
         ),
     ),
 ) -> None:
-    """The tool searches words in a randomly generated grid of letters."""
-    grid_height, grid_width = tuple(map(int, grid_size.split('x')))
+    """The tool searches a set of words in every grid of a manifest.
+
+    Found words are streamed to the standard output as JSON lines.
+    """
+    from puzzle.engines import search_engine
+    from puzzle.tools import start_batch_search_puzzle
+
+    _validate_puzzle_manifest_path(manifest_path)
+    _validate_puzzle_words_path(words_file_path)
+    _validate_puzzle_executor(executor)
+    puzzle_type = search_engine(engine).puzzle_type
+    with words_file_path.open() as payload:  # type: IO[str]
+        words: List[str] = payload.read().split()
+    for word in words:  # type: str
+        _validate_puzzle_word(word)
+    start_batch_search_puzzle(
+        grids=_batch_grids(manifest_path),
+        words=words,
+        output=sys.stdout,
+        executor_kind=executor,
+        puzzle_type=puzzle_type,
+    )
+
+
+@_app.command(name='engines')
+def _engines_tool_chain() -> None:
+    """The tool lists registered search engines along with capabilities.
+
+    Engines of installed packages are registered with
+    `search_words_puzzle.engines` entry points.
+    """
+    from puzzle.engines import search_engines
+
+    for engine in search_engines():  # type: SearchEngine
+        sys.stdout.write(f'{engine}\n')
+
+
+@_app.command(name='calibrate')
+def _calibrate_tool_chain(
+    grid_size: str = Option(
+        default='300x300',
+        help=textwrap.dedent('The size of a random grid to measure with.'),
+    ),
+    output_path: Path = Option(
+        default=None,
+        help=textwrap.dedent(
+            'A path to a JSON file to store measured costs to '
+            '(~/.config/search-words-puzzle/calibration.json if unset).'
+        ),
+    ),
+) -> None:
+    """The tool measures costs of search engines on this machine.
+
+    Stored costs are used to pick a search engine of every word and
+    an executor of words without any tuning options.
+    """
+    from puzzle.properties import GridSize
+    from puzzle.tuning import CALIBRATION_PATH, calibrate, save_cost_model
+
     _validate_puzzle_grid_size(grid_size)
-    with RandomWordsGrid(
-        grid_size=GridSize(grid_height, grid_width)
-    ) as grid:  # type: Grid
-        board = grid.content.to_coordinates()
-        if word:
-            _validate_puzzle_word(word)
-            start_word_search_puzzle(HiddenWord(board, word))
-        else:
-            _validate_puzzle_words_path(words_file_path)
-            random_words = _random_words(
-                path=words_file_path, limit=words_limit
+    grid_height, grid_width = tuple(map(int, grid_size.split('x')))
+    save_cost_model(
+        calibrate(GridSize(grid_height, grid_width)),
+        output_path or CALIBRATION_PATH,
+    )
+
+
+@_app.command(name='verify')
+def _verify_tool_chain(
+    cases: int = Option(
+        default=1000,
+        help=textwrap.dedent('The amount of random cases to check.'),
+    ),
+    seed: int = Option(
+        default=0,
+        help=textwrap.dedent('A seed of the first random case.'),
+    ),
+    executors: str = Option(
+        default='inline,thread,process',
+        help=textwrap.dedent(
+            'Comma separated executors to search words with e.g "inline".'
+        ),
+    ),
+    engines: str = Option(
+        default='',
+        help=textwrap.dedent(
+            'Comma separated engines to check e.g "simd" of a third-party '
+            'package (every built-in engine if unset).'
+        ),
+    ),
+) -> None:
+    """The tool checks every search engine against a plain search.
+
+    Seeded random grids and words are searched by every engine and
+    executor, a failed case is shrunk to a minimal grid and reported.
+    """
+    from loguru import logger
+
+    from puzzle.differential import DIFFERENTIAL_ENGINES, soak
+    from puzzle.engines import search_engine
+
+    executor_kinds: List[str] = executors.split(',')
+    for executor_kind in executor_kinds:  # type: str
+        _validate_puzzle_executor(executor_kind)
+    engine_names: List[str] = (
+        engines.split(',') if engines else list(DIFFERENTIAL_ENGINES)
+    )
+    for engine in engine_names:  # type: str
+        if engine not in DIFFERENTIAL_ENGINES:
+            search_engine(engine)
+    mismatches = soak(cases, seed, engine_names, executor_kinds)
+    for mismatch in mismatches:  # type: Mismatch
+        logger.error(str(mismatch))
+    if mismatches:
+        raise ValueError(
+            f'{len(mismatches)} out of {cases} cases differ from a plain search'
+        )
+
+
+@_app.command(name='serve')
+@_grouped_options(_ServerOptions)
+def _serve_tool_chain(
+    socket_path: Path = Option(
+        default=None,
+        help=textwrap.dedent(
+            'A path to a Unix domain socket to listen to, '
+            'otherwise a localhost TCP port is listened to.'
+        ),
+    ),
+    port: int = Option(
+        default=8765,
+        help=textwrap.dedent('A localhost TCP port to listen to.'),
+    ),
+    words_file_path: Path = Option(
+        default=Path('payload/words.txt'),
+        help=textwrap.dedent(
+            'A path to a custom text file with words to search randomly.'
+        ),
+    ),
+    **options: Any,
+) -> None:
+    """The tool serves search requests with warm workers and dictionary.
+
+    Every request is a JSON line e.g {"rows": ["abc"], "words": ["ab"]}.
+    SIGINT or SIGTERM signal stops the server after requests in progress.
+    """
+    from puzzle.servers import SearchPuzzleServer
+
+    server_options = _options(_ServerOptions, options)
+    _validate_puzzle_words_path(words_file_path)
+    with words_file_path.open() as payload:  # type: IO[str]
+        words: List[str] = payload.read().split()
+    with SearchPuzzleServer(
+        address=str(socket_path) if socket_path else ('127.0.0.1', port),
+        words=words,
+        limits=server_options.limits,
+        engine=server_options.engine,
+    ) as server:  # type: SearchPuzzleServer
+        for signal_number in signal.SIGINT, signal.SIGTERM:  # type: int
+            signal.signal(
+                signal_number,
+                lambda *_: threading.Thread(target=server.shutdown).start(),
             )
-            start_words_search_puzzle(HiddenWords(board, random_words))
+        server.serve_forever()
 
 
 def easyrun() -> None:
     """Start the puzzle command line interface tool chain."""
-    run(_tool_chain)
+    _app()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,265 @@
+"""A module contains as set API for the puzzle bit-parallel search."""
+import heapq
+from itertools import islice, repeat
+from typing import ClassVar, Dict, Iterator, List, Sequence, Tuple
+
+from loguru import logger as _logger
+
+from puzzle.compat import mypyc_attr
+from puzzle.properties import Coordinate, LetterCoordinates
+from puzzle.puzzles import (
+    SearchPuzzle,
+    SearchWordPuzzle,
+    _word_range,
+    is_word_pattern,
+)
+
+
+def _letter_masks(board: LetterCoordinates, stride: int) -> Dict[str, int]:
+    """Return a bitset of cells for every letter in a board.
+
+    A cell bit index is `row * stride + column`.
+
+    Example:
+    >>> _letter_masks({'a': [Coordinate(0, 0)], 'b': [Coordinate(1, 0)]}, 2)
+    {'a': 1, 'b': 4}
+
+    Args:
+        board: (dict) a board of letters.
+        stride: (int) the amount of bits reserved for a single grid row.
+
+    Returns:
+        dict: a bitset of cells for every letter.
+    """
+    height: int = max(
+        coordinate.x_axis
+        for coordinates in board.values()
+        for coordinate in coordinates
+    )
+    masks: Dict[str, int] = {}
+    for letter, coordinates in board.items():  # type: str, List[Coordinate]
+        bits = bytearray((height + 1) * stride // 8 + 1)
+        for coordinate in coordinates:  # type: Coordinate
+            index = coordinate.x_axis * stride + coordinate.y_axis
+            bits[index >> 3] |= 1 << (index & 7)
+        masks[letter] = int.from_bytes(bits, byteorder='little')
+    return masks
+
+
+def _set_bits(bitset: int) -> Iterator[int]:
+    """Return indexes of all set bits of a bitset in ascending order.
+
+    Example:
+    >>> tuple(_set_bits(0b1010))
+    (1, 3)
+
+    Args:
+        bitset: (int) a bitset.
+
+    Returns:
+        iterator: indexes of set bits.
+    """
+    bits: str = bin(bitset)[:1:-1]
+    index: int = bits.find('1')
+    while index != -1:
+        yield index
+        index = bits.find('1', index + 1)
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class BitMaskSearchPuzzle(SearchPuzzle):
+    """The class represents a bit-parallel search word puzzle.
+
+    A grid is stored as a bitset of cells per letter, where every row is
+    followed by an empty padding bit so words cannot wrap between edges.
+
+    A word is searched in a given direction by intersecting letter bitsets
+    shifted towards a start cell by the position of a letter in a word:
+    ```
+    mask(w0) & shift(mask(w1), d) & shift(mask(w2), 2d) & ...
+    ```
+    Bits left set are exactly the start cells of a word, so the whole grid
+    is searched with word length x 8 big integer operations.
+    """
+
+    SUPPORTS_EARLY_EXIT: ClassVar[bool] = True
+    __slots__: Sequence[str] = ('_board', '_masks', '_stride', '_probes')
+
+    def __init__(self, board: LetterCoordinates) -> None:
+        self._board = board
+        self._masks: Dict[str, int] = {}
+        self._stride: int = 0
+        self._probes: int = 0
+
+    def coordinates(self, item: str, limit: int = 0) -> List[str]:
+        """Return all starting and ending coordinates of a given word item.
+
+        Start cells of every direction are merged in the order of a grid,
+        so only the first `limit` coordinates are ever converted.
+
+        Example:
+        >>> puzzle = BitMaskSearchPuzzle(board)
+        >>> puzzle.coordinates('foo')
+        ['Start at: (X13, Y36); End at: (X11, Y34)', ...]
+
+        Args:
+            item: (str) name of an item.
+            limit: (int) the amount of coordinates to stop a search at,
+                all coordinates are searched if it is `0`.
+
+        Returns:
+            list: a list of found coordinates of a given word.
+        """
+        if is_word_pattern(item):
+            return SearchWordPuzzle(self._board).coordinates(item, limit)
+        if not self._prepare(item):
+            return []
+        starts: Iterator[Tuple[int, int]] = heapq.merge(
+            *(
+                zip(
+                    _set_bits(self._matches(item, movement_coordinate)),
+                    repeat(direction),
+                )
+                for direction, movement_coordinate in enumerate(
+                    SearchWordPuzzle.MOVEMENT_COORDINATES
+                )
+            )
+        )
+        return [
+            self._word_range(item, *start)
+            for start in islice(starts, limit or None)
+        ]
+
+    def exists(self, item: str) -> bool:
+        """Return whether a given word item is present in a grid.
+
+        A search is stopped at the first direction with any start cell.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            bool: True if a word is present otherwise False.
+        """
+        if is_word_pattern(item):
+            return super().exists(item)
+        return self._prepare(item) and any(
+            self._matches(item, movement_coordinate)
+            for movement_coordinate in SearchWordPuzzle.MOVEMENT_COORDINATES
+        )
+
+    def _prepare(self, item: str) -> bool:
+        """Prepare letter bitsets of a grid to search a given word item.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            bool: False if a grid does not contain some letters of a word.
+
+        Raises:
+            ValueError: if the board of letters is empty.
+        """
+        if len(self._board) == 0:
+            raise ValueError('The board of letters is empty!')
+        _logger.info(f'Searching for "{item}" word in a grid of letters ...')
+        absent_letters = set(item) - self._board.keys()
+        if absent_letters:
+            _logger.warning(
+                f'Cannot find coordinates for "{item}" word as the board '
+                f'does not contain "{min(absent_letters)}" letter'
+            )
+            return False
+        self.prepare()
+        return True
+
+    def prepare(self) -> None:
+        """Build letter bitsets of a grid once.
+
+        Raises:
+            ValueError: if the board of letters is empty.
+        """
+        if len(self._board) == 0:
+            raise ValueError('The board of letters is empty!')
+        if not self._masks:
+            self._stride = 2 + max(
+                coordinate.y_axis
+                for coordinates in self._board.values()
+                for coordinate in coordinates
+            )
+            self._masks = _letter_masks(self._board, self._stride)
+
+    def probe_count(self, item: str) -> int:
+        """Return the amount of bitset machine words a search intersects.
+
+        A machine word of a bitset holds 64 cells of a grid, which are
+        probed at once.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            int: the amount of intersected machine words.
+        """
+        if is_word_pattern(item):
+            return SearchWordPuzzle(self._board).probe_count(item)
+        self._probes = 0
+        self.coordinates(item)
+        return self._probes
+
+    def _matches(self, item: str, movement_coordinate: Coordinate) -> int:
+        """Return a bitset of cells a word starts at in a given direction.
+
+        Args:
+            item: (str) name of an item.
+            movement_coordinate: (Coordinate) a direction of a word.
+
+        Returns:
+            int: a bitset of start cells.
+        """
+        row_step, column_step = movement_coordinate.as_tuple()
+        offset: int = row_step * self._stride + column_step
+        matches: int = self._masks[item[0]]
+        for step, letter in enumerate(item[1:], start=1):  # type: int, str
+            shift = step * offset
+            mask = self._masks[letter]
+            self._probes += (matches.bit_length() + 63) // 64
+            matches &= mask >> shift if shift >= 0 else mask << -shift
+            if not matches:
+                break
+        return matches
+
+    def _word_range(self, item: str, start: int, direction: int) -> str:
+        """Return starting and ending coordinates of a found word.
+
+        Args:
+            item: (str) name of an item.
+            start: (int) a bit index of a start cell.
+            direction: (int) an index of a movement direction.
+
+        Returns:
+            str: coordinates of a found word.
+        """
+        row_step, column_step = SearchWordPuzzle.MOVEMENT_COORDINATES[
+            direction
+        ].as_tuple()
+        row_point, column_point = divmod(start, self._stride)
+        last_step: int = len(item) - 1
+        first_coordinate = Coordinate(row_point, column_point)
+        last_coordinate = Coordinate(
+            row_point + row_step * last_step,
+            column_point + column_step * last_step,
+        )
+        _logger.debug(
+            f'Found "{item}" word at: {first_coordinate}; {last_coordinate}'
+        )
+        return _word_range(first_coordinate, last_coordinate)
+
+    @property
+    def name(self) -> str:
+        """Return name of a search word puzzle.
+
+        Returns:
+            str: a name of a search puzzle e.g `BitMaskSearchPuzzle`.
+        """
+        return self.__class__.__name__
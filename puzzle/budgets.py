@@ -0,0 +1,292 @@
+"""A module contains as set API for the puzzle search memory budgets."""
+import os
+import re
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from puzzle.executors import is_free_threaded
+from puzzle.properties import GridSize
+
+# Bytes a cell of a grid takes, measured with `tracemalloc` on CPython 3.11:
+# a `Coordinate` of a board of letters with its list slot, a pickled one
+# shipped to a worker process and rows of a content joined and split once.
+_BOARD_CELL_BYTES: int = 180
+_PICKLED_CELL_BYTES: int = 20
+_CONTENT_CELL_BYTES: int = 3
+_WORKER_BYTES: int = 32 * 1024**2
+_STORAGE_CELL_BYTES: Dict[str, float] = {
+    'rows': 1.0,
+    'packed': 0.625,
+    'procedural': 0.0,
+}
+_TILE_SIZES: Sequence[int] = (1024, 256, 64)
+_UNITS: str = 'KMGT'
+
+
+@dataclass(frozen=True)
+class SearchMode:
+    """The class represents a storage of rows and an engine of a search.
+
+    A `board` engine keeps a board of letters of a whole grid, a `tiled`
+    engine searches a grid tile by tile of `tile_size` rows and columns.
+
+    Example:
+    >>> SearchMode('packed', 'tiled', 64)
+    SearchMode(storage='packed', engine='tiled', tile_size=64)
+    """
+
+    storage: str = 'rows'
+    engine: str = 'board'
+    tile_size: int = 0
+
+
+@dataclass(frozen=True)
+class MemoryEstimate:
+    """The class represents estimated memory of a search of a grid.
+
+    Example:
+    >>> estimate = MemoryEstimate('rows', 'board', 100, 18000, 0)
+    >>> estimate.total
+    18100
+    """
+
+    storage: str
+    engine: str
+    grid_bytes: int
+    index_bytes: int
+    workers_bytes: int
+    tile_size: int = 0
+
+    @property
+    def total(self) -> int:
+        """Return the total amount of estimated bytes.
+
+        Returns:
+            int: the amount of bytes e.g `18100`.
+        """
+        return self.grid_bytes + self.index_bytes + self.workers_bytes
+
+    def __str__(self) -> str:
+        """Return user friendly estimate name.
+
+        Returns:
+            str: string representation of the estimate.
+        """
+        return (
+            f'{format_memory_size(self.total)} for {self.engine} search of '
+            f'{self.storage} grid (grid {format_memory_size(self.grid_bytes)}'
+            f', index {format_memory_size(self.index_bytes)}, '
+            f'workers {format_memory_size(self.workers_bytes)})'
+        )
+
+
+def parse_memory_size(value: str) -> int:
+    """Return the amount of bytes of a memory size.
+
+    Example:
+    >>> parse_memory_size('512M')
+    536870912
+
+    Args:
+        value: (str) a memory size of bytes or `K`, `M`, `G`, `T` units.
+
+    Returns:
+        int: the amount of bytes.
+
+    Raises:
+        ValueError: if a memory size is invalid.
+    """
+    size = re.fullmatch(string=value.upper(), pattern=r'(\d+)([KMGT]?)B?')
+    if not size or not int(size.group(1)):
+        raise ValueError(
+            f'Specified "{value}" memory size is invalid. It should be '
+            'a positive amount of bytes, "K", "M", "G" or "T" e.g "512M"!'
+        )
+    amount, unit = int(size.group(1)), size.group(2)
+    return amount * 1024 ** (_UNITS.index(unit) + 1) if unit else amount
+
+
+def format_memory_size(amount: int) -> str:
+    """Return user friendly memory size.
+
+    Example:
+    >>> format_memory_size(3 * 1024**3)
+    '3.0 GiB'
+
+    Args:
+        amount: (int) the amount of bytes.
+
+    Returns:
+        str: a memory size e.g `3.0 GiB`.
+    """
+    size: float = amount
+    unit: str = 'B'
+    for next_unit in _UNITS:  # type: str
+        if size < 1024:
+            break
+        size, unit = size / 1024, f'{next_unit}iB'
+    return f'{size:.1f} {unit}' if unit != 'B' else f'{amount} B'
+
+
+def estimate_search_memory(
+    grid_size: GridSize,
+    mode: SearchMode = SearchMode(),
+    workers: int = 1,
+    shared: bool = False,
+    halo: int = 0,
+) -> MemoryEstimate:
+    """Estimate memory of a search of a grid.
+
+    A `board` engine keeps a board of letters of a whole grid, and a copy
+    of it within every worker process. A `tiled` engine keeps a grid only,
+    and a board of a tile with its halo within every worker.
+
+    Args:
+        grid_size: (GridSize) the size of a grid.
+        mode: (SearchMode) a storage of rows (`rows`, `packed` or
+            `procedural`) and an engine (`board` or `tiled`) of a search.
+        workers: (int) the amount of workers.
+        shared: (bool) whether workers share memory (threads).
+        halo: (int) the amount of cells searched around a tile.
+
+    Returns:
+        MemoryEstimate: an estimate of a search.
+    """
+    cells: int = grid_size.height * grid_size.width
+    grid_bytes = int(cells * _STORAGE_CELL_BYTES[mode.storage])
+    if mode.engine == 'board':
+        index_bytes: int = cells * (_BOARD_CELL_BYTES + _CONTENT_CELL_BYTES)
+        worker_bytes: int = cells * (_BOARD_CELL_BYTES + _PICKLED_CELL_BYTES)
+    else:
+        index_bytes = 0
+        tile_cells: int = min(mode.tile_size + halo, grid_size.height) * min(
+            mode.tile_size + halo, grid_size.width
+        )
+        worker_bytes = tile_cells * _BOARD_CELL_BYTES
+        if not shared:
+            worker_bytes += grid_bytes
+    if not shared:
+        worker_bytes += _WORKER_BYTES
+    elif mode.engine == 'board':
+        worker_bytes = 0
+    return MemoryEstimate(
+        mode.storage,
+        mode.engine,
+        grid_bytes,
+        index_bytes,
+        worker_bytes * workers,
+        mode.tile_size if mode.engine == 'tiled' else 0,
+    )
+
+
+def plan_search_memory(
+    grid_size: GridSize,
+    budget: int = 0,
+    executor_kind: str = 'auto',
+    procedural: bool = False,
+    tiled: bool = True,
+    halo: int = 0,
+) -> MemoryEstimate:
+    """Pick a storage and an engine of a search fitting a memory budget.
+
+    A board of a whole grid is preferred as the fastest one, then a grid
+    is searched tile by tile with smaller and smaller tiles, rows of a grid
+    are packed before tiles get smaller.
+
+    Example:
+    >>> plan_search_memory(GridSize(10**5, 10**5), parse_memory_size('4G'))
+    MemoryEstimate(storage='packed', engine='tiled', ...)
+
+    Args:
+        grid_size: (GridSize) the size of a grid.
+        budget: (int) the amount of bytes to fit in (no budget if `0`).
+        executor_kind: (str) a kind of an executor (see `create_executor`).
+        procedural: (bool) whether a grid is computed procedurally.
+        tiled: (bool) whether a grid is able to be searched tile by tile.
+        halo: (int) the amount of cells searched around a tile.
+
+    Returns:
+        MemoryEstimate: an estimate of a picked storage and engine.
+
+    Raises:
+        ValueError: if neither storage nor engine fit a budget.
+    """
+    workers, shared = _executor_workers(executor_kind)
+    estimates: List[MemoryEstimate] = [
+        estimate_search_memory(grid_size, mode, workers, shared, halo)
+        for mode in _search_modes(procedural, tiled)
+    ]
+    for estimate in estimates:  # type: MemoryEstimate
+        if not budget or estimate.total <= budget:
+            return estimate
+    smallest = min(estimates, key=lambda item: item.total)
+    raise ValueError(
+        f'Cannot search {grid_size.height}x{grid_size.width} grid within '
+        f'{format_memory_size(budget)} memory budget. It needs at least '
+        f'{smallest}!'
+    )
+
+
+def _search_modes(procedural: bool, tiled: bool) -> Iterator[SearchMode]:
+    """Return storages and engines of a search in the order of preference.
+
+    Args:
+        procedural: (bool) whether a grid is computed procedurally.
+        tiled: (bool) whether a grid is able to be searched tile by tile.
+
+    Returns:
+        iterator: storages, engines and tile sizes.
+    """
+    if procedural:
+        yield SearchMode('procedural', 'board')
+    else:
+        yield SearchMode('rows', 'board')
+    if not tiled:
+        return
+    for tile_size in _TILE_SIZES:  # type: int
+        if procedural:
+            yield SearchMode('procedural', 'tiled', tile_size)
+        else:
+            yield SearchMode('rows', 'tiled', tile_size)
+            yield SearchMode('packed', 'tiled', tile_size)
+
+
+def _executor_workers(executor_kind: str) -> Tuple[int, bool]:
+    """Return the amount of workers of an executor and their memory sharing.
+
+    Args:
+        executor_kind: (str) a kind of an executor (see `create_executor`).
+
+    Returns:
+        tuple: the amount of workers and whether they share memory.
+    """
+    if executor_kind == 'inline':
+        return 1, True
+    if executor_kind == 'auto':
+        executor_kind = 'thread' if is_free_threaded() else 'process'
+    return os.cpu_count() or 1, executor_kind == 'thread'
+
+
+def peak_memory() -> Tuple[int, int]:
+    """Return peak resident memory of the process and of its largest worker.
+
+    Peaks are reported separately as they are not summed up to a peak of
+    a process tree: workers are not at their peaks at the same time, and
+    a peak of a worker process is known once it is finished only.
+
+    Returns:
+        tuple: the amount of bytes of the process and of its largest
+            finished worker process (`0` if it is not supported by a
+            platform).
+    """
+    try:
+        # pylint:disable=import-outside-toplevel
+        import resource
+    except ImportError:  # pragma: no cover
+        return 0, 0
+    unit: int = 1 if sys.platform == 'darwin' else 1024
+    return (
+        unit * resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        unit * resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
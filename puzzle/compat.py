@@ -0,0 +1,32 @@
+"""A module contains as set API for the puzzle optional dependencies."""
+from typing import TYPE_CHECKING, Any, Callable, Tuple, TypeVar
+
+_Class = TypeVar('_Class')
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mypy_extensions import mypyc_attr
+else:
+    try:
+        from mypy_extensions import mypyc_attr
+    except ImportError:  # pragma: no cover
+
+        def mypyc_attr(  # pylint:disable=unused-argument
+            *attrs: str, **kwattrs: Any
+        ) -> Callable[[_Class], _Class]:
+            """Return a class decorator keeping a class as is.
+
+            Attributes of a class are read by mypyc of a compiled build
+            only (`compiled` extra), a pure Python build does not need
+            `mypy-extensions` package.
+
+            Args:
+                attrs: (tuple) names of mypyc attributes.
+                kwattrs: (dict) values of mypyc attributes.
+
+            Returns:
+                callable: a decorator returning a class as is.
+            """
+            return lambda cls: cls
+
+
+__all__: Tuple[str, ...] = ('mypyc_attr',)
@@ -0,0 +1,250 @@
+"""A module contains as set API for the puzzle search costs."""
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from loguru import logger as _logger
+
+from puzzle.bitmasks import BitMaskSearchPuzzle
+from puzzle.compat import mypyc_attr
+from puzzle.indexes import DictionarySearchPuzzle
+from puzzle.properties import LetterCoordinates
+from puzzle.puzzles import SearchPuzzle, SearchWordPuzzle, is_word_pattern
+
+
+@mypyc_attr(native_class=False)
+@dataclass(frozen=True)
+class SearchCostModel:
+    """The class represents costs of search engines on a machine.
+
+    Every cost is seconds spent on a unit of work. Defaults are measured
+    on a commodity laptop, machine-specific costs are measured once with
+    `search-words-puzzle calibrate` command.
+
+    Example:
+    >>> model = SearchCostModel()
+    >>> model.walk_seconds(cells=10000, anchors=400) > 0
+    True
+    """
+
+    cell_index_cost: float = 7.0e-7
+    walk_cost: float = 7.0e-6
+    mask_index_cost: float = 1.0e-6
+    mask_cost: float = 4.0e-9
+    dispatch_cost: float = 3.0e-6
+    worker_cost: float = 1.0e-2
+    trie_cost: float = 3.0e-6
+
+    def walk_seconds(
+        self, cells: int, anchors: int, indexed: bool = False
+    ) -> float:
+        """Estimate seconds of a word walk from cells of its rarest letter.
+
+        Args:
+            cells: (int) the amount of cells of a grid.
+            anchors: (int) the amount of cells of the rarest letter.
+            indexed: (bool) whether cells of a grid are indexed already.
+
+        Returns:
+            float: estimated seconds.
+        """
+        return anchors * self.walk_cost + (
+            0 if indexed else cells * self.cell_index_cost
+        )
+
+    def bitmask_seconds(
+        self, cells: int, length: int, indexed: bool = False
+    ) -> float:
+        """Estimate seconds of a bit-parallel search of a word.
+
+        Args:
+            cells: (int) the amount of cells of a grid.
+            length: (int) the length of a word.
+            indexed: (bool) whether letter bitsets are built already.
+
+        Returns:
+            float: estimated seconds.
+        """
+        return cells * length * self.mask_cost + (
+            0 if indexed else cells * self.mask_index_cost
+        )
+
+    def dictionary_seconds(self, cells: int) -> float:
+        """Estimate seconds of a single trie walk of a grid for all words.
+
+        A grid is walked from every cell in 8 directions along a trie of
+        words, a walk stops as soon as letters are not a prefix of a word.
+
+        Args:
+            cells: (int) the amount of cells of a grid.
+
+        Returns:
+            float: estimated seconds.
+        """
+        walks: int = len(SearchWordPuzzle.MOVEMENT_COORDINATES)
+        return cells * (walks * self.trie_cost + self.cell_index_cost)
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class AutoSearchPuzzle(SearchPuzzle):
+    """The class represents a search puzzle picking an engine per word.
+
+    A word is searched by the engine of the least estimated cost:
+      - a walk from cells of the rarest letter of a word (`SearchWordPuzzle`)
+        for a word of a rare letter e.g `quiz`
+      - bit-parallel letter bitsets (`BitMaskSearchPuzzle`) for a word of
+        common letters in a big grid e.g `eerie`
+
+    A batch of words is searched by a single trie walk of a grid
+    (`DictionarySearchPuzzle`) if it costs less than a search of every word
+    with its own engine e.g for a large dictionary of words.
+
+    An index of an engine is built once and reused by next words. Both
+    engines return coordinates in the same order, so a picked engine does
+    not change results.
+
+    Example:
+    >>> puzzle = AutoSearchPuzzle(board)
+    >>> puzzle.engine('eerie').name
+    'BitMaskSearchPuzzle'
+    """
+
+    __slots__: Sequence[str] = (
+        '_board',
+        '_cost_model',
+        '_cells',
+        '_walk',
+        '_bitmask',
+        '_indexed',
+    )
+
+    def __init__(
+        self,
+        board: LetterCoordinates,
+        cost_model: Optional[SearchCostModel] = None,
+    ) -> None:
+        self._board = board
+        self._cost_model = cost_model or SearchCostModel()
+        self._cells: int = sum(map(len, board.values()))
+        self._walk = SearchWordPuzzle(board)
+        self._bitmask = BitMaskSearchPuzzle(board)
+        self._indexed: List[SearchPuzzle] = []
+
+    def coordinates(self, item: str, limit: int = 0) -> List[str]:
+        """Return all starting and ending coordinates of a given word item.
+
+        Args:
+            item: (str) name of an item.
+            limit: (int) the amount of coordinates to stop a search at,
+                all coordinates are searched if it is `0`.
+
+        Returns:
+            list: a list of found coordinates of a given word.
+        """
+        return self.engine(item).coordinates(item, limit)
+
+    def exists(self, item: str) -> bool:
+        """Return whether a given word item is present in a grid.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            bool: True if a word is present otherwise False.
+        """
+        return self.engine(item).exists(item)
+
+    def probe_count(self, item: str) -> int:
+        """Return the amount of probes a search of a given item makes.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            int: the amount of probes of a picked engine.
+        """
+        return self.engine(item).probe_count(item)
+
+    def search_many(
+        self, words: Iterable[str], limit: int = 0
+    ) -> Iterator[Tuple[str, List[str]]]:
+        """Yield coordinates of every word of a batch.
+
+        A batch is searched by a single trie walk of a grid if it is
+        estimated to cost less than a search of every distinct word.
+
+        Args:
+            words: (iterable) words to search.
+            limit: (int) the amount of coordinates of every word to stop
+                a search at, all coordinates are searched if it is `0`.
+
+        Returns:
+            iterator: words along with their found coordinates.
+        """
+        batch: List[str] = list(words)
+        seconds: float = sum(
+            min(self._seconds(word))
+            for word in dict.fromkeys(batch)
+            if not is_word_pattern(word)
+        )
+        if self._cost_model.dictionary_seconds(self._cells) < seconds:
+            _logger.debug(
+                f'DictionarySearchPuzzle engine is picked for {len(batch)} '
+                'words'
+            )
+            yield from DictionarySearchPuzzle(self._board).search_many(
+                batch, limit
+            )
+        else:
+            yield from super().search_many(batch, limit)
+
+    def engine(self, item: str) -> SearchPuzzle:
+        """Return a search engine of the least estimated cost of a word.
+
+        A pattern of words is always walked, as bitsets search plain words
+        only.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            SearchPuzzle: a search engine.
+        """
+        engine: SearchPuzzle = self._walk
+        if not is_word_pattern(item) and set(item) <= self._board.keys():
+            walk, bitmask = self._seconds(item)
+            if bitmask < walk:
+                engine = self._bitmask
+        if engine not in self._indexed:
+            self._indexed.append(engine)
+        _logger.debug(f'{engine.name} engine is picked for "{item}" word')
+        return engine
+
+    def _seconds(self, item: str) -> Tuple[float, float]:
+        """Estimate seconds of a walk and of a bitsets search of a word.
+
+        Args:
+            item: (str) a plain word.
+
+        Returns:
+            tuple: seconds of a walk and of a bitsets search.
+        """
+        anchors: int = min(
+            (len(self._board.get(letter, ())) for letter in item), default=0
+        )
+        return (
+            self._cost_model.walk_seconds(
+                self._cells, anchors, self._walk in self._indexed
+            ),
+            self._cost_model.bitmask_seconds(
+                self._cells, len(item), self._bitmask in self._indexed
+            ),
+        )
+
+    @property
+    def name(self) -> str:
+        """Return name of a search word puzzle.
+
+        Returns:
+            str: a name of a search puzzle e.g `AutoSearchPuzzle`.
+        """
+        return self.__class__.__name__
@@ -0,0 +1,430 @@
+"""A module contains as set API for the puzzle differential testing."""
+import random
+import re
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
+
+from loguru import logger as _logger
+
+from puzzle.bitmasks import BitMaskSearchPuzzle
+from puzzle.costs import AutoSearchPuzzle
+from puzzle.engines import search_engine
+from puzzle.executors import create_executor
+from puzzle.grids import GridContent
+from puzzle.indexes import (
+    DictionarySearchPuzzle,
+    NGramSearchPuzzle,
+    SuffixArraySearchPuzzle,
+)
+from puzzle.properties import LetterCoordinates
+from puzzle.puzzles import (
+    AxialSearchWordPuzzle,
+    BoundedSearchWordPuzzle,
+    SearchWordPuzzle,
+)
+from puzzle.sinks import CallbackSink
+from puzzle.tools import PuzzleType, start_words_search_puzzle
+from puzzle.words import HiddenWords
+
+Matches = Dict[str, FrozenSet[str]]
+
+DIFFERENTIAL_ENGINES: Dict[str, PuzzleType] = {
+    'SearchWordPuzzle': SearchWordPuzzle,
+    'BoundedSearchWordPuzzle': BoundedSearchWordPuzzle,
+    'AxialSearchWordPuzzle': AxialSearchWordPuzzle,
+    'BitMaskSearchPuzzle': BitMaskSearchPuzzle,
+    'AutoSearchPuzzle': AutoSearchPuzzle,
+    'NGramSearchPuzzle': partial(NGramSearchPuzzle, trigram_threshold=2),
+    'SuffixArraySearchPuzzle': partial(SuffixArraySearchPuzzle, depth=3),
+}
+_DICTIONARY_ENGINE: str = 'DictionarySearchPuzzle'
+_PATTERNS: Sequence[str] = ('?', '[ab]')
+
+
+@dataclass(frozen=True)
+class DifferentialCase:
+    """The class represents a seeded case of a differential test.
+
+    Example:
+    >>> case = DifferentialCase.generate(seed=1)
+    >>> case.rows
+    ('abca', 'cbba', ...)
+    """
+
+    seed: int
+    rows: Tuple[str, ...]
+    words: Tuple[str, ...]
+
+    @classmethod
+    def generate(cls, seed: int) -> 'DifferentialCase':
+        """Generate a random grid with words of a small alphabet.
+
+        A small alphabet makes words overlap a lot, words contain a single
+        letter, palindromes, reversed words and patterns.
+
+        Args:
+            seed: (int) a seed of a case.
+
+        Returns:
+            DifferentialCase: a generated case.
+        """
+        generator = random.Random(seed)
+        alphabet: str = 'abcd'[: generator.randint(1, 4)]
+        height, width = generator.randint(1, 8), generator.randint(1, 8)
+        rows = tuple(
+            ''.join(generator.choices(alphabet, k=width)) for _ in range(height)
+        )
+        words: List[str] = []
+        for _ in range(generator.randint(1, 8)):  # type: int
+            word = ''.join(
+                generator.choices(alphabet, k=generator.randint(1, 5))
+            )
+            words.extend((word, word[::-1], word + word[-2::-1]))
+        position: int = generator.randrange(len(words[0]))
+        head, tail = words[0][:position], words[0][position + 1 :]  # noqa
+        words.append(f'{head}{generator.choice(_PATTERNS)}{tail}')
+        words.append(f'{words[0]}*')
+        return cls(seed, rows, tuple(dict.fromkeys(words)))
+
+    def __str__(self) -> str:
+        """Return user friendly case to reproduce.
+
+        Returns:
+            str: string representation of the case.
+        """
+        return (
+            f'seed {self.seed}: rows={list(self.rows)} words={list(self.words)}'
+        )
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    """The class represents a mismatch of an engine and a plain search.
+
+    Example:
+    >>> str(mismatch)
+    'BitMaskSearchPuzzle/inline differs for "ab" word of seed 1: ...'
+    """
+
+    case: DifferentialCase
+    engine: str
+    executor: str
+    word: str
+    expected: FrozenSet[str]
+    actual: FrozenSet[str]
+
+    def __str__(self) -> str:
+        """Return user friendly mismatch to reproduce.
+
+        Returns:
+            str: string representation of the mismatch.
+        """
+        return (
+            f'{self.engine}/{self.executor} differs for "{self.word}" word of '
+            f'{self.case}: missing {sorted(self.expected - self.actual)}, '
+            f'unexpected {sorted(self.actual - self.expected)}'
+        )
+
+
+def _normalized(word: str, coordinates: Sequence[str]) -> FrozenSet[str]:
+    """Return a set of found coordinates of a word.
+
+    A placement of a palindrome is the same from both of its ends, so it is
+    kept from its smaller end only.
+
+    Args:
+        word: (str) a searched word.
+        coordinates: (sequence) found coordinates of a word.
+
+    Returns:
+        frozenset: normalized coordinates.
+    """
+    if word != word[::-1]:
+        return frozenset(coordinates)
+    return frozenset(
+        min(
+            coordinate,
+            re.sub(
+                r'Start at: (.+), End at: (.+)',
+                r'Start at: \2, End at: \1',
+                coordinate,
+            ),
+        )
+        for coordinate in coordinates
+    )
+
+
+def _expected_matches(
+    board: LetterCoordinates, words: Sequence[str]
+) -> Matches:
+    """Return normalized matches of words of a plain search.
+
+    Args:
+        board: (dict) a board of letters.
+        words: (sequence) words to search.
+
+    Returns:
+        dict: a set of found coordinates of every word.
+    """
+    puzzle = SearchWordPuzzle(board)
+    return {word: _normalized(word, puzzle.coordinates(word)) for word in words}
+
+
+def _engine_matches(
+    board: LetterCoordinates,
+    words: Sequence[str],
+    puzzle_type: PuzzleType,
+    executor_kind: str,
+) -> Matches:
+    """Return normalized matches of words of a search tool.
+
+    Args:
+        board: (dict) a board of letters.
+        words: (sequence) words to search.
+        puzzle_type: (callable) a search puzzle to search words with.
+        executor_kind: (str) a kind of an executor (see `create_executor`).
+
+    Returns:
+        dict: a set of found coordinates of every word.
+    """
+    found: Dict[str, List[str]] = {word: [] for word in words}
+    start_words_search_puzzle(
+        HiddenWords(board, iter(words)),
+        CallbackSink(lambda word, coordinate: found[word].append(coordinate)),
+        executor=create_executor(executor_kind, workers=2),
+        puzzle_type=puzzle_type,
+    )
+    return {
+        word: _normalized(word, coordinates)
+        for word, coordinates in found.items()
+    }
+
+
+def _dictionary_matches(
+    board: LetterCoordinates, words: Sequence[str]
+) -> Matches:
+    """Return normalized matches of words of a single pass search.
+
+    Args:
+        board: (dict) a board of letters.
+        words: (sequence) words to search.
+
+    Returns:
+        dict: a set of found coordinates of every word.
+    """
+    return {
+        word: _normalized(word, coordinates)
+        for word, coordinates in DictionarySearchPuzzle(board).search_many(
+            words
+        )
+    }
+
+
+def _engine_type(engine: str) -> PuzzleType:
+    """Return a search puzzle of a differential or a registered engine.
+
+    Args:
+        engine: (str) a name of an engine.
+
+    Returns:
+        callable: a search puzzle.
+
+    Raises:
+        ValueError: if an engine is unknown.
+    """
+    if engine in DIFFERENTIAL_ENGINES:
+        return DIFFERENTIAL_ENGINES[engine]
+    return search_engine(engine).puzzle_type
+
+
+def check_case(
+    case: DifferentialCase,
+    engines: Sequence[str] = tuple(DIFFERENTIAL_ENGINES),
+    executors: Sequence[str] = ('inline',),
+) -> List[Mismatch]:
+    """Compare matches of every engine and executor with a plain search.
+
+    Matches are normalized to sets, and placements of palindromes to their
+    smaller ends, so engines reporting a palindrome once (e.g
+    `AxialSearchWordPuzzle`) or in a different order are comparable.
+
+    Example:
+    >>> check_case(DifferentialCase.generate(seed=1))
+    []
+
+    Args:
+        case: (DifferentialCase) a case to check.
+        engines: (sequence) names of `DIFFERENTIAL_ENGINES` or registered
+            engines (see `search_engines`) to check.
+        executors: (sequence) kinds of executors to search words with.
+
+    Returns:
+        list: mismatches of engines.
+    """
+    board = GridContent(case.rows).to_coordinates()
+    expected = _expected_matches(board, case.words)
+    runs: Iterator[Tuple[str, str, Matches]] = (
+        (
+            engine,
+            executor_kind,
+            _engine_matches(
+                board,
+                case.words,
+                _engine_type(engine),
+                executor_kind,
+            ),
+        )
+        for engine in engines
+        for executor_kind in executors
+    )
+    mismatches: List[Mismatch] = []
+    for engine, executor_kind, actual in runs:  # type: str, str, Matches
+        mismatches.extend(
+            _mismatches(case, engine, executor_kind, expected, actual)
+        )
+    mismatches.extend(
+        _mismatches(
+            case,
+            _DICTIONARY_ENGINE,
+            'inline',
+            expected,
+            _dictionary_matches(board, case.words),
+        )
+    )
+    return mismatches
+
+
+def _mismatches(
+    case: DifferentialCase,
+    engine: str,
+    executor_kind: str,
+    expected: Matches,
+    actual: Matches,
+) -> Iterator[Mismatch]:
+    """Yield mismatches of words of an engine.
+
+    Args:
+        case: (DifferentialCase) a checked case.
+        engine: (str) a name of an engine.
+        executor_kind: (str) a kind of an executor.
+        expected: (dict) matches of a plain search.
+        actual: (dict) matches of an engine.
+
+    Returns:
+        iterator: mismatches of words.
+    """
+    for word, coordinates in actual.items():  # type: str, FrozenSet[str]
+        if coordinates != expected[word]:
+            yield Mismatch(
+                case, engine, executor_kind, word, expected[word], coordinates
+            )
+
+
+def shrink(mismatch: Mismatch) -> Mismatch:
+    """Shrink a case of a mismatch to a minimal grid still failing.
+
+    A case is reduced to a failing word, then edge rows and columns of
+    a grid are dropped one by one while an engine still differs.
+
+    Args:
+        mismatch: (Mismatch) a mismatch to shrink.
+
+    Returns:
+        Mismatch: a mismatch of a minimal case.
+    """
+    smallest: Mismatch = mismatch
+    reduced: Optional[Mismatch] = _recheck(
+        smallest, replace(smallest.case, words=(smallest.word,))
+    )
+    while reduced is not None:
+        smallest = reduced
+        reduced = next(
+            (
+                found
+                for found in map(
+                    partial(_recheck, smallest), _smaller_cases(smallest.case)
+                )
+                if found is not None
+            ),
+            None,
+        )
+    _logger.info(f'Shrunk a mismatch to {smallest}')
+    return smallest
+
+
+def _smaller_cases(case: DifferentialCase) -> Iterator[DifferentialCase]:
+    """Yield cases of a grid without one of its edge rows or columns.
+
+    Args:
+        case: (DifferentialCase) a case to shrink.
+
+    Returns:
+        iterator: smaller cases.
+    """
+    rows: Tuple[str, ...] = case.rows
+    if len(rows) > 1:
+        yield replace(case, rows=rows[1:])
+        yield replace(case, rows=rows[:-1])
+    if len(rows[0]) > 1:
+        yield replace(case, rows=tuple(row[1:] for row in rows))
+        yield replace(case, rows=tuple(row[:-1] for row in rows))
+
+
+def _recheck(mismatch: Mismatch, case: DifferentialCase) -> Optional[Mismatch]:
+    """Return a mismatch of an engine of a case if it still differs.
+
+    Args:
+        mismatch: (Mismatch) a mismatch to reproduce.
+        case: (DifferentialCase) a case to check.
+
+    Returns:
+        Mismatch: a mismatch of a word or None if an engine matches.
+    """
+    if mismatch.engine == _DICTIONARY_ENGINE:
+        engines: Sequence[str] = ()
+    else:
+        engines = (mismatch.engine,)
+    for found in check_case(
+        case, engines, (mismatch.executor,)
+    ):  # type: Mismatch
+        if found.engine == mismatch.engine and found.word == mismatch.word:
+            return found
+    return None
+
+
+def soak(
+    cases: int,
+    seed: int = 0,
+    engines: Sequence[str] = tuple(DIFFERENTIAL_ENGINES),
+    executors: Sequence[str] = ('inline', 'thread', 'process'),
+) -> List[Mismatch]:
+    """Check seeded cases one by one and shrink every found mismatch.
+
+    A few cases are quick enough for unit tests, thousands of them make
+    a soak run validating performance-motivated rewrites of engines.
+
+    Example:
+    >>> soak(cases=1000, seed=42)
+    []
+
+    Args:
+        cases: (int) the amount of cases to check.
+        seed: (int) a seed of the first case.
+        engines: (sequence) names of `DIFFERENTIAL_ENGINES` or registered
+            engines (see `search_engines`) to check.
+        executors: (sequence) kinds of executors to search words with.
+
+    Returns:
+        list: shrunk mismatches of every failed case.
+    """
+    _logger.info(f'Checking {cases} cases from {seed} seed ...')
+    mismatches: List[Mismatch] = []
+    for case_seed in range(seed, seed + cases):  # type: int
+        found = check_case(
+            DifferentialCase.generate(case_seed), engines, executors
+        )
+        if found:
+            mismatches.append(shrink(found[0]))
+    _logger.info(f'Found {len(mismatches)} failed cases out of {cases}')
+    return mismatches
@@ -0,0 +1,203 @@
+"""A module contains as set API for the puzzle search engines registry."""
+import re
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Dict, Iterable, List
+
+from loguru import logger as _logger
+
+from puzzle.bitmasks import BitMaskSearchPuzzle
+from puzzle.costs import AutoSearchPuzzle
+from puzzle.indexes import (
+    DictionarySearchPuzzle,
+    NGramSearchPuzzle,
+    SuffixArraySearchPuzzle,
+)
+from puzzle.puzzles import (
+    AxialSearchWordPuzzle,
+    BoundedSearchWordPuzzle,
+    SearchWordPuzzle,
+)
+from puzzle.tools import PuzzleType
+
+ENGINES_ENTRY_POINT_GROUP: str = 'search_words_puzzle.engines'
+_ENGINES: Dict[str, PuzzleType] = {
+    'auto': AutoSearchPuzzle,
+    'word': SearchWordPuzzle,
+    'bounded': BoundedSearchWordPuzzle,
+    'axial': AxialSearchWordPuzzle,
+    'bitmask': BitMaskSearchPuzzle,
+    'ngram': NGramSearchPuzzle,
+    'suffix-array': SuffixArraySearchPuzzle,
+    'dictionary': DictionarySearchPuzzle,
+}
+_PLUGINS_LOADED: bool = False
+
+
+@dataclass(frozen=True)
+class SearchEngine:
+    """The class represents a registered search engine.
+
+    Example:
+    >>> engine = search_engine('bitmask')
+    >>> engine.supports_early_exit
+    True
+    """
+
+    name: str
+    puzzle_type: PuzzleType
+
+    @property
+    def supports_patterns(self) -> bool:
+        """Return whether an engine searches patterns of words.
+
+        Returns:
+            bool: True if patterns are searched otherwise False.
+        """
+        return bool(getattr(self._puzzle_class, 'SUPPORTS_PATTERNS', False))
+
+    @property
+    def supports_early_exit(self) -> bool:
+        """Return whether a limited search of an engine stops early.
+
+        Returns:
+            bool: True if a search stops at a limit otherwise False.
+        """
+        return bool(getattr(self._puzzle_class, 'SUPPORTS_EARLY_EXIT', False))
+
+    @property
+    def _puzzle_class(self) -> Any:
+        """Return a search puzzle class of an engine (of a partial as well).
+
+        Returns:
+            type: a search puzzle class.
+        """
+        puzzle_type: Any = self.puzzle_type
+        while isinstance(puzzle_type, partial):
+            puzzle_type = puzzle_type.func
+        return puzzle_type
+
+    def __str__(self) -> str:
+        """Return user friendly engine name.
+
+        Returns:
+            str: string representation of the engine.
+        """
+        capabilities: List[str] = [
+            capability
+            for capability, supported in (
+                ('patterns', self.supports_patterns),
+                ('early exit', self.supports_early_exit),
+            )
+            if supported
+        ]
+        return (
+            f'{self.name} ({getattr(self._puzzle_class, "__name__", "?")}): '
+            f'{", ".join(capabilities) or "plain words"}'
+        )
+
+
+def register_engine(name: str, puzzle_type: PuzzleType) -> None:
+    """Register a search engine under a given name.
+
+    Third-party packages register engines without any calls by declaring
+    `search_words_puzzle.engines` entry points e.g within `setup.py`:
+    ```
+    entry_points={'search_words_puzzle.engines': ('simd = pkg:SimdPuzzle',)}
+    ```
+
+    Example:
+    >>> register_engine('simd', SimdSearchPuzzle)
+    >>> search_engine('simd').name
+    'simd'
+
+    Args:
+        name: (str) a name of an engine e.g `simd`.
+        puzzle_type: (callable) a search puzzle of a board of letters.
+
+    Raises:
+        ValueError: if a name is invalid or it is registered already.
+    """
+    if not re.fullmatch(string=name, pattern=r'[a-z][a-z0-9-]*'):
+        raise ValueError(
+            f'Specified "{name}" engine name is invalid. It should contain '
+            'lowercase letters, digits and dashes only e.g "suffix-array"!'
+        )
+    if name in _ENGINES:
+        raise ValueError(f'Specified "{name}" engine is registered already!')
+    _ENGINES[name] = puzzle_type
+
+
+def search_engines() -> List[SearchEngine]:
+    """Return every registered search engine.
+
+    Engines of entry points are loaded on the first call.
+
+    Returns:
+        list: search engines in the order of registration.
+    """
+    _load_plugins()
+    return [
+        SearchEngine(name, puzzle_type)
+        for name, puzzle_type in _ENGINES.items()
+    ]
+
+
+def search_engine(name: str) -> SearchEngine:
+    """Return a registered search engine of a given name.
+
+    Example:
+    >>> search_engine('ngram').puzzle_type
+    <class 'puzzle.indexes.NGramSearchPuzzle'>
+
+    Args:
+        name: (str) a name of an engine.
+
+    Returns:
+        SearchEngine: a search engine.
+
+    Raises:
+        ValueError: if an engine is unknown.
+    """
+    _load_plugins()
+    if name not in _ENGINES:
+        raise ValueError(
+            f'Specified "{name}" engine is unknown. It should be one of '
+            f'{", ".join(map(repr, _ENGINES))} engines!'
+        )
+    return SearchEngine(name, _ENGINES[name])
+
+
+def _load_plugins() -> None:
+    """Register engines of `search_words_puzzle.engines` entry points once.
+
+    An engine failing to load or clashing with a registered one is skipped.
+    """
+    global _PLUGINS_LOADED  # pylint:disable=global-statement
+    if _PLUGINS_LOADED:
+        return
+    _PLUGINS_LOADED = True
+    for entry_point in _entry_points():  # type: Any
+        try:
+            register_engine(entry_point.name, entry_point.load())
+        except (ImportError, AttributeError, ValueError) as error:
+            _logger.warning(
+                f'Cannot register "{entry_point.name}" engine: {error}'
+            )
+
+
+def _entry_points() -> Iterable[Any]:
+    """Return entry points of search engines of installed packages.
+
+    Returns:
+        iterable: entry points (none if `importlib.metadata` is missing).
+    """
+    try:
+        # pylint:disable=import-outside-toplevel
+        from importlib import metadata
+    except ImportError:  # pragma: no cover
+        return ()
+    entry_points: Any = metadata.entry_points()
+    if hasattr(entry_points, 'select'):
+        return entry_points.select(group=ENGINES_ENTRY_POINT_GROUP)
+    return entry_points.get(ENGINES_ENTRY_POINT_GROUP, ())  # pragma: no cover
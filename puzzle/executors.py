@@ -0,0 +1,434 @@
+"""A module contains as set API for the puzzle search executors."""
+import os
+import sys
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Type,
+)
+
+Task = Callable[[Any], Any]
+
+
+def is_free_threaded() -> bool:
+    """Return whether threads run Python code in parallel (no GIL).
+
+    It is the case of a free-threaded CPython 3.13+ build unless the GIL is
+    enabled back at runtime e.g with `PYTHON_GIL=1` environment variable.
+
+    Returns:
+        bool: True if the GIL is disabled otherwise False.
+    """
+    gil_enabled: Callable[[], bool] = getattr(
+        sys, '_is_gil_enabled', lambda: True
+    )
+    return not gil_enabled()
+
+
+class Executor(ABC):
+    """The class represents an abstract executor of search tasks.
+
+    Any implementation of this interface allows to release workers:
+      - using context manager (**with** statement)
+      - manually with **close**
+
+    Pending tasks are cancelled once workers are released.
+    """
+
+    __slots__: Sequence[str] = ()
+
+    @abstractmethod
+    def imap(
+        self, function: Task, items: Iterable[Any], chunksize: int = 1
+    ) -> Iterator[Any]:
+        """Return abstract results of a function in the order of items.
+
+        Args:
+            function: (callable) a task to execute for every item.
+            items: (iterable) items to execute a task for.
+            chunksize: (int) the amount of items to hand over at once.
+
+        Returns:
+            iterator: results of a function.
+        """
+        pass
+
+    @abstractmethod
+    def imap_unordered(
+        self, function: Task, items: Iterable[Any]
+    ) -> Iterator[Any]:
+        """Return abstract results of a function as soon as they are ready.
+
+        Args:
+            function: (callable) a task to execute for every item.
+            items: (iterable) items to execute a task for.
+
+        Returns:
+            iterator: results of a function.
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Cancel abstract pending tasks and release workers."""
+        pass
+
+    @abstractmethod
+    def initialized(
+        self, initializer: Callable[..., None], initargs: Sequence[Any] = ()
+    ) -> 'Executor':
+        """Return an abstract executor of the same workers with initializer.
+
+        Args:
+            initializer: (callable) a function to call once within every
+                worker.
+            initargs: (sequence) arguments of an initializer.
+
+        Returns:
+            Executor: a not started executor.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Return an abstract name of an executor.
+
+        Returns:
+            str: a name of an executor.
+        """
+        pass
+
+    def __enter__(self) -> 'Executor':
+        """Return runtime executor itself."""
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Release workers.
+
+        Raise any exception triggered within the runtime context.
+        """
+        self.close()
+
+
+class _PoolExecutor(Executor):
+    """The class represents an executor of a lazily started pool."""
+
+    __slots__: Sequence[str] = (
+        '_workers',
+        '_initializer',
+        '_initargs',
+        '_max_tasks',
+        '_pool',
+    )
+
+    def __init__(
+        self,
+        workers: int = 0,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Sequence[Any] = (),
+        max_tasks: int = 0,
+    ) -> None:
+        self._workers: int = workers or os.cpu_count() or 1
+        self._initializer = initializer
+        self._initargs = tuple(initargs)
+        self._max_tasks = max_tasks
+        self._pool: Any = None
+
+    def imap(
+        self, function: Task, items: Iterable[Any], chunksize: int = 1
+    ) -> Iterator[Any]:
+        """Return results of a function in the order of items.
+
+        Args:
+            function: (callable) a task to execute for every item.
+            items: (iterable) items to execute a task for.
+            chunksize: (int) the amount of items to hand over at once.
+
+        Returns:
+            iterator: results of a function.
+        """
+        return self._started().imap(function, items, chunksize)
+
+    def imap_unordered(
+        self, function: Task, items: Iterable[Any]
+    ) -> Iterator[Any]:
+        """Return results of a function as soon as they are ready.
+
+        Args:
+            function: (callable) a task to execute for every item.
+            items: (iterable) items to execute a task for.
+
+        Returns:
+            iterator: results of a function.
+        """
+        return self._started().imap_unordered(function, items)
+
+    def close(self) -> None:
+        """Cancel pending tasks and release workers of a pool."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def initialized(
+        self, initializer: Callable[..., None], initargs: Sequence[Any] = ()
+    ) -> Executor:
+        """Return an executor of the same pool of workers with initializer.
+
+        Example:
+        >>> ProcessExecutor(workers=2).initialized(print, ('foo',))
+        <puzzle.executors.ProcessExecutor object at ...>
+
+        Args:
+            initializer: (callable) a function to call once within every
+                worker.
+            initargs: (sequence) arguments of an initializer.
+
+        Returns:
+            Executor: a not started executor.
+        """
+        return self.__class__(
+            self._workers, initializer, initargs, self._max_tasks
+        )
+
+    @property
+    def name(self) -> str:
+        """Return name of an executor.
+
+        Returns:
+            str: a name of an executor e.g `ProcessExecutor`.
+        """
+        return self.__class__.__name__
+
+    def _started(self) -> Any:
+        """Return a pool of workers, it is started on the first use.
+
+        Returns:
+            Pool: a started pool.
+        """
+        if self._pool is None:
+            self._pool = self._start()
+        return self._pool
+
+    @abstractmethod
+    def _start(self) -> Any:
+        """Start an abstract pool of workers.
+
+        Returns:
+            Pool: a started pool.
+        """
+        pass
+
+
+class ProcessExecutor(_PoolExecutor):
+    """The class represents an executor of a pool of worker processes.
+
+    Every task and its result are pickled between processes, so it pays off
+    for long tasks of a GIL-enabled interpreter. A worker process is replaced
+    with a fresh one after `max_tasks` tasks (never if `0`), so memory of
+    large searches is returned to the system.
+
+    Example:
+    >>> with ProcessExecutor() as executor:
+    >>>     list(executor.imap(abs, (-1, -2)))
+    [1, 2]
+    """
+
+    __slots__: Sequence[str] = ()
+
+    def _start(self) -> Any:
+        """Start a pool of worker processes.
+
+        Returns:
+            Pool: a started pool.
+        """
+        # pylint:disable=import-outside-toplevel
+        from multiprocessing import Pool
+
+        return Pool(
+            self._workers,
+            self._initializer,
+            self._initargs,
+            self._max_tasks or None,
+        )
+
+
+class ThreadExecutor(_PoolExecutor):
+    """The class represents an executor of a pool of worker threads.
+
+    Tasks share memory (e.g a board of letters) with a caller without any
+    copies, so it pays off for a free-threaded interpreter (no GIL). Worker
+    threads are never replaced as they share memory anyway (`max_tasks` is
+    ignored).
+
+    Example:
+    >>> with ThreadExecutor() as executor:
+    >>>     list(executor.imap(abs, (-1, -2)))
+    [1, 2]
+    """
+
+    __slots__: Sequence[str] = ()
+
+    def _start(self) -> Any:
+        """Start a pool of worker threads.
+
+        Returns:
+            ThreadPool: a started pool.
+        """
+        # pylint:disable=import-outside-toplevel
+        from multiprocessing.pool import ThreadPool
+
+        return ThreadPool(self._workers, self._initializer, self._initargs)
+
+    def close(self) -> None:
+        """Cancel pending tasks and release a pool of worker threads.
+
+        A running thread can't be stopped, so a stuck worker thread is not
+        waited for: it is a daemon thread abandoned until its task is over.
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+
+
+class InlineExecutor(Executor):
+    """The class represents an executor running tasks in a caller thread.
+
+    Tasks are executed lazily one by one as results are consumed, so it
+    pays off for short tasks without any workers to start.
+
+    Example:
+    >>> with InlineExecutor() as executor:
+    >>>     list(executor.imap(abs, (-1, -2)))
+    [1, 2]
+    """
+
+    __slots__: Sequence[str] = ('_initializer', '_initargs')
+
+    def __init__(
+        self,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Sequence[Any] = (),
+    ) -> None:
+        self._initializer = initializer
+        self._initargs = tuple(initargs)
+
+    def imap(
+        self, function: Task, items: Iterable[Any], chunksize: int = 1
+    ) -> Iterator[Any]:
+        """Return results of a function in the order of items.
+
+        Args:
+            function: (callable) a task to execute for every item.
+            items: (iterable) items to execute a task for.
+            chunksize: (int) it is ignored as items are not handed over.
+
+        Returns:
+            iterator: results of a function.
+        """
+        if self._initializer is not None:
+            self._initializer(*self._initargs)
+            self._initializer = None
+        return map(function, items)
+
+    def imap_unordered(
+        self, function: Task, items: Iterable[Any]
+    ) -> Iterator[Any]:
+        """Return results of a function in the order of items.
+
+        Args:
+            function: (callable) a task to execute for every item.
+            items: (iterable) items to execute a task for.
+
+        Returns:
+            iterator: results of a function.
+        """
+        return self.imap(function, items)
+
+    def close(self) -> None:
+        """Nothing to release as tasks are executed by a caller."""
+
+    def initialized(
+        self, initializer: Callable[..., None], initargs: Sequence[Any] = ()
+    ) -> Executor:
+        """Return an executor of a caller thread with initializer.
+
+        Args:
+            initializer: (callable) a function to call once before tasks.
+            initargs: (sequence) arguments of an initializer.
+
+        Returns:
+            Executor: an executor.
+        """
+        return InlineExecutor(initializer, initargs)
+
+    @property
+    def name(self) -> str:
+        """Return name of an executor.
+
+        Returns:
+            str: a name of an executor e.g `InlineExecutor`.
+        """
+        return self.__class__.__name__
+
+
+_POOL_EXECUTORS: Dict[str, Type[_PoolExecutor]] = {
+    'process': ProcessExecutor,
+    'thread': ThreadExecutor,
+}
+
+
+def create_executor(
+    kind: str = 'auto',
+    workers: int = 0,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Sequence[Any] = (),
+    max_tasks: int = 0,
+) -> Executor:
+    """Create an executor of search tasks of a given kind.
+
+    An `auto` kind is a thread executor for a free-threaded interpreter
+    and a process executor otherwise.
+
+    Example:
+    >>> create_executor('thread').name
+    'ThreadExecutor'
+
+    Args:
+        kind: (str) a kind of an executor: `auto`, `process`, `thread` or
+            `inline`.
+        workers: (int) the amount of workers (CPU cores amount if `0`).
+        initializer: (callable) a function to call once within every worker.
+        initargs: (sequence) arguments of an initializer.
+        max_tasks: (int) the amount of tasks to replace a worker process
+            after, workers are never replaced if it is `0`.
+
+    Returns:
+        Executor: an executor of a given kind.
+
+    Raises:
+        ValueError: if a kind of an executor is unknown.
+    """
+    if kind == 'auto':
+        kind = 'thread' if is_free_threaded() else 'process'
+    if kind == 'inline':
+        return InlineExecutor(initializer, initargs)
+    if kind not in _POOL_EXECUTORS:
+        raise ValueError(
+            f'Cannot create "{kind}" executor. It should be one of '
+            '"auto", "process", "thread" or "inline" kinds!'
+        )
+    return _POOL_EXECUTORS[kind](workers, initializer, initargs, max_tasks)
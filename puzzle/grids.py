@@ -1,15 +1,43 @@
 """A module contains as set API for the puzzle grids."""
+import mmap
 import string
 import random
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from itertools import accumulate
 from types import TracebackType
-from typing import Any, List, Optional, Sequence, Type, Union
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+    overload,
+)
 
 from loguru import logger as _logger
 
+from puzzle.compat import mypyc_attr
 from puzzle.properties import Coordinate, GridSize, LetterCoordinates
 
+_UINT64: int = (1 << 64) - 1
+_LETTERS: str = string.ascii_lowercase
+_LETTER_CODES: bytes = bytes.maketrans(
+    string.ascii_lowercase.encode(), bytes(range(len(string.ascii_lowercase)))
+)
+_CODE_LETTERS: bytes = bytes.maketrans(
+    bytes(range(len(string.ascii_lowercase))), string.ascii_lowercase.encode()
+)
 
+
+@mypyc_attr(native_class=False)
 class Content(ABC):
     """The class represents an abstract content."""
 
@@ -34,6 +62,7 @@ class Content(ABC):
         pass
 
 
+@mypyc_attr(native_class=False)
 class Grid(ABC):
     """The class represents an abstract interface of a grid.
 
@@ -80,6 +109,29 @@ class Grid(ABC):
         """Build an abstract grid."""
         pass
 
+    def region(self, top: int, left: int, height: int, width: int) -> List[str]:
+        """Return rows of a rectangular region of a grid.
+
+        A region is clipped by grid edges. Implementations are able to
+        return a region without materialising a whole grid.
+
+        Example:
+        >>> grid.region(top=1, left=1, height=2, width=2)
+        ['bc', 'cd']
+
+        Args:
+            top: (int) the first row of a region.
+            left: (int) the first column of a region.
+            height: (int) the amount of rows of a region.
+            width: (int) the amount of columns of a region.
+
+        Returns:
+            list: rows of a region.
+        """
+        bottom, right = top + height, left + width
+        rows: List[str] = str(self.content).split()[top:bottom]
+        return [row[left:right] for row in rows]
+
     @abstractmethod
     def refresh(self) -> None:
         """Clear an abstract grid."""
@@ -104,7 +156,7 @@ class Grid(ABC):
         pass
 
     @classmethod
-    def __subclasshook__(cls, other: Any) -> Union[bool, NotImplementedError]:
+    def __subclasshook__(cls, other: Any) -> bool:
         """Customize ``issubclass`` builtin function on the ABC level.
 
         Args:
@@ -127,12 +179,226 @@ class Grid(ABC):
         return NotImplemented
 
 
+class CompactRows(Sequence[str]):
+    """The class represents compact rows of a grid of letters.
+
+    Rows are stored in a single `bytearray` with 1 byte per cell, so a row
+    is able to be accessed with zero copies as a `memoryview`. In a packed
+    mode every letter (a-z only) is stored with 5 bits instead, so a cell
+    takes 0.625 bytes.
+
+    Rows are appended as strings and read as strings, so they are able to
+    be used in place of a list of strings e.g by `GridContent`.
+
+    Example:
+    >>> rows = CompactRows(['abc', 'def'], packed=True)
+    >>> rows[1], rows.nbytes
+    ('def', 4)
+    """
+
+    __slots__: Sequence[str] = ('_packed', '_cells', '_width', '_height')
+
+    def __init__(self, rows: Iterable[str] = (), packed: bool = False) -> None:
+        self._packed = packed
+        self._cells = bytearray()
+        self._width: int = 0
+        self._height: int = 0
+        for row in rows:  # type: str
+            self.append(row)
+
+    @property
+    def packed(self) -> bool:
+        """Return whether letters are packed with 5 bits.
+
+        Returns:
+            bool: True if letters are packed otherwise False.
+        """
+        return self._packed
+
+    @property
+    def nbytes(self) -> int:
+        """Return the amount of bytes letters are stored with.
+
+        Returns:
+            int: the amount of bytes e.g `4`.
+        """
+        return len(self._cells)
+
+    def append(self, row: str) -> None:
+        """Append a row of letters.
+
+        Args:
+            row: (str) a row of letters.
+
+        Raises:
+            ValueError: if a row is empty, of another width than previous
+                rows or contains other than a-z letters in a packed mode.
+        """
+        if not row or self._width not in (0, len(row)):
+            raise ValueError(
+                f'Cannot append "{row}" row to rows of "{self._width}" width'
+            )
+        if not self._packed:
+            self._cells.extend(row.encode('ascii'))
+        else:
+            self._append_packed(row.encode('ascii').translate(_LETTER_CODES))
+        self._width = len(row)
+        self._height += 1
+
+    def row_view(self, index: int) -> memoryview:
+        """Return a row of letters as a zero-copy view of its bytes.
+
+        Rows are not able to be appended while a view is kept.
+
+        Args:
+            index: (int) an index of a row.
+
+        Returns:
+            memoryview: ASCII letters of a row.
+
+        Raises:
+            ValueError: if letters are packed.
+        """
+        if self._packed:
+            raise ValueError('Cannot view a row of letters packed with 5 bits')
+        start: int = self._row_index(index) * self._width
+        stop: int = start + self._width
+        return memoryview(self._cells)[start:stop]
+
+    def _append_packed(self, codes: bytes) -> None:
+        """Append codes of letters of a row packed with 5 bits.
+
+        Args:
+            codes: (bytes) codes of letters of a row (0-25).
+
+        Raises:
+            ValueError: if a row contains other than a-z letters.
+        """
+        if max(codes) >= len(string.ascii_lowercase):
+            raise ValueError('Cannot pack a row of other than a-z letters')
+        row_value: int = 0
+        for code in reversed(codes):  # type: int
+            row_value = (row_value << 5) | code
+        offset: int = self._height * self._width * 5 % 8
+        pending: int = self._cells.pop() if offset else 0
+        value: int = pending | (row_value << offset)
+        self._cells.extend(
+            value.to_bytes((offset + len(codes) * 5 + 7) // 8, 'little')
+        )
+
+    def _row(self, index: int) -> str:
+        """Return a row of letters.
+
+        Args:
+            index: (int) an index of a row.
+
+        Returns:
+            str: a row of letters.
+        """
+        if not self._packed:
+            return self.row_view(index).tobytes().decode()
+        start: int = self._row_index(index) * self._width * 5
+        first, stop = start // 8, (start + self._width * 5 + 7) // 8
+        value: int = int.from_bytes(self._cells[first:stop], 'little')
+        value >>= start % 8
+        return (
+            bytes((value >> step) & 31 for step in range(0, self._width * 5, 5))
+            .translate(_CODE_LETTERS)
+            .decode()
+        )
+
+    def _row_index(self, index: int) -> int:
+        """Return a non-negative index of a row.
+
+        Args:
+            index: (int) an index of a row.
+
+        Returns:
+            int: a non-negative index of a row.
+
+        Raises:
+            IndexError: if a row is out of range.
+        """
+        if not -self._height <= index < self._height:
+            raise IndexError(f'Row {index} is out of {self._height} rows')
+        return index % self._height
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        """Return a row or a slice of rows of letters.
+
+        Args:
+            index: (int or slice) an index of a row or a slice of rows.
+
+        Returns:
+            str or list: a row or a list of rows.
+        """
+        if isinstance(index, slice):
+            return [self._row(row) for row in range(*index.indices(len(self)))]
+        return self._row(index)
+
+    def __len__(self) -> int:
+        """Return the amount of rows.
+
+        Returns:
+            int: the amount of rows.
+        """
+        return self._height
+
+    def __reduce__(
+        self,
+    ) -> Tuple[
+        Callable[[bool, bytes, int, int], 'CompactRows'],
+        Tuple[bool, bytes, int, int],
+    ]:
+        """Pickle rows as their stored bytes, so packed rows stay packed.
+
+        Returns:
+            tuple: a function restoring rows and stored bytes of rows.
+        """
+        return _compact_rows, (
+            self._packed,
+            bytes(self._cells),
+            self._width,
+            self._height,
+        )
+
+
+def _compact_rows(
+    packed: bool, cells: bytes, width: int, height: int
+) -> CompactRows:
+    """Restore compact rows of a grid of letters from their stored bytes.
+
+    Args:
+        packed: (bool) whether letters are packed with 5 bits.
+        cells: (bytes) stored bytes of rows.
+        width: (int) the amount of letters of a row.
+        height: (int) the amount of rows.
+
+    Returns:
+        CompactRows: restored rows.
+    """
+    rows = CompactRows(packed=packed)
+    # pylint:disable=protected-access
+    rows._cells.extend(cells)
+    rows._width, rows._height = width, height
+    return rows
+
+
+@mypyc_attr(native_class=False)
 class GridContent(Content):
     """The class represents a grid content."""
 
     __slots__: Sequence[str] = ('_rows',)
 
-    def __init__(self, rows: List[str]) -> None:
+    def __init__(self, rows: Sequence[str]) -> None:
         self._rows = rows
 
     def to_coordinates(self) -> LetterCoordinates:
@@ -176,6 +442,7 @@ class GridContent(Content):
         return content
 
 
+@mypyc_attr(native_class=False)
 class RandomWordsGrid(Grid):
     """The class represents randomly created grid of letters.
 
@@ -184,25 +451,49 @@ class RandomWordsGrid(Grid):
       - automatically when an object will be deleted by garbage collector
       - manually with **__del__**
 
+    Letters are distributed uniformly unless relative `weights` of every
+    letter (a-z) are given e.g to generate a skewed-frequency grid.
+
+    A grid of a given `seed` is not materialised, every region of it is
+    computed lazily and reproduced exactly by `ProceduralGrid` of the same
+    seed and weights.
+
+    Rows are stored compactly with 1 byte per letter or with 5 bits per
+    letter if a grid is `packed`.
+
     Example:
     >>> with RandomWordsGrid(GridSize(10, 10)) as grid:
     >>>     content = grid.content
     ...
     """
 
-    __slots__: Sequence[str] = ('_size', '_rows')
+    __slots__: Sequence[str] = ('_size', '_rows', '_weights', '_procedural')
 
-    def __init__(self, grid_size: GridSize) -> None:
+    def __init__(
+        self,
+        grid_size: GridSize,
+        weights: Optional[Sequence[float]] = None,
+        seed: Optional[int] = None,
+        packed: bool = False,
+    ) -> None:
         self._size = grid_size
-        self._rows: List[str] = []
+        self._rows = CompactRows(packed=packed)
+        self._weights = weights
+        self._procedural: Optional[ProceduralGrid] = (
+            None if seed is None else ProceduralGrid(grid_size, seed, weights)
+        )
 
     @property
     def content(self) -> Content:
         """Create a new grid content.
 
+        A whole grid of a seed is generated once its content is requested.
+
         Returns:
             Content: a grid content.
         """
+        if self._procedural is not None:
+            return self._procedural.content
         return GridContent(self._rows)
 
     @property
@@ -227,32 +518,49 @@ class RandomWordsGrid(Grid):
         """Create a grid of randomly created letters (a-z only).
 
         Raises:
-           ValueError: if the size of a grid is invalid.
+           ValueError: if the size of a grid or letter weights are invalid.
         """
+        if self._procedural is not None:
+            self._procedural.build()
+            return
         _logger.info(f'{self._size} is used')
-        if (self.height < 0 or self.width < 0) or (
-            not self.height or not self.width
-        ):
-            raise ValueError(
-                'Cannot generate a grid of letters due to '
-                f'invalid "{self.height}x{self.width}" grid size. '
-                'It should not contain negative or zero values!'
-            )
+        _validate_random_grid(self._size, self._weights)
         _logger.info('Generating a grid of random letters ...')
         rows_counter: int = 0
         while rows_counter < self.height:
             next_row: str = ''.join(
                 random.choices(
                     population=string.ascii_lowercase,
+                    weights=self._weights,
                     k=self.width,
                 )
             )
             self._rows.append(next_row)
             rows_counter += 1
 
+    def region(self, top: int, left: int, height: int, width: int) -> List[str]:
+        """Return rows of a rectangular region of a grid.
+
+        A region of a grid of a seed is computed without materialising
+        a whole grid (see `ProceduralGrid.region`).
+
+        Args:
+            top: (int) the first row of a region.
+            left: (int) the first column of a region.
+            height: (int) the amount of rows of a region.
+            width: (int) the amount of columns of a region.
+
+        Returns:
+            list: rows of a region.
+        """
+        if self._procedural is not None:
+            return self._procedural.region(top, left, height, width)
+        bottom, right = min(top + height, self.height), left + width
+        return [row[left:right] for row in self._rows[top:bottom]]
+
     def refresh(self) -> None:
         """Clear a grid of letters."""
-        self._rows = []
+        self._rows = CompactRows(packed=self._rows.packed)
 
     def __enter__(self) -> Grid:
         """Build grid rows of randomly created words.
@@ -274,3 +582,345 @@ class RandomWordsGrid(Grid):
         Raise any exception triggered within the runtime context.
         """
         self.refresh()
+
+
+def _validate_random_grid(
+    size: GridSize, weights: Optional[Sequence[float]]
+) -> None:
+    """Validate the size of a random grid and weights of its letters.
+
+    Args:
+        size: (GridSize) the size of a grid.
+        weights: (sequence) relative weights of every letter (a-z).
+
+    Raises:
+       ValueError: if the size of a grid or letter weights are invalid.
+    """
+    if size.height <= 0 or size.width <= 0:
+        raise ValueError(
+            'Cannot generate a grid of letters due to '
+            f'invalid "{size.height}x{size.width}" grid size. '
+            'It should not contain negative or zero values!'
+        )
+    weights_count = len(weights or string.ascii_lowercase)
+    if weights_count != len(string.ascii_lowercase):
+        raise ValueError(
+            'Cannot generate a grid of letters due to '
+            f'invalid "{weights_count}" amount of letter weights. '
+            'It should contain a weight of every letter (a-z)!'
+        )
+
+
+def _split_mix(value: int) -> int:
+    """Return a 64-bit hash of a value with SplitMix64 finalizer.
+
+    Args:
+        value: (int) a value to hash.
+
+    Returns:
+        int: a 64-bit hash of a value.
+    """
+    value = (value + 0x9E3779B97F4A7C15) & _UINT64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _UINT64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _UINT64
+    return value ^ (value >> 31)
+
+
+@mypyc_attr(native_class=False)
+class ProceduralGrid(Grid):
+    """The class represents a procedural grid of letters.
+
+    A letter of every cell is a pure function of a seed, a row and a column
+    of a cell (a counter-based hash), so cells are computed only when they
+    are requested. A grid takes constant memory of any size, it is shipped
+    to a worker as a seed and any region of it is reproduced exactly.
+
+    Letters are distributed uniformly unless relative `weights` of every
+    letter (a-z) are given, a hash of a cell picks a letter by cumulative
+    weights then.
+
+    Example:
+    >>> with ProceduralGrid(GridSize(10**5, 10**5), seed=1) as grid:
+    >>>     grid.letter(row=70000, column=3)
+    'q'
+    """
+
+    __slots__: Sequence[str] = ('_size', '_seed', '_weights', '_bounds')
+
+    def __init__(
+        self,
+        grid_size: GridSize,
+        seed: int = 0,
+        weights: Optional[Sequence[float]] = None,
+    ) -> None:
+        self._size = grid_size
+        self._seed = seed
+        self._weights = weights
+        self._bounds: Tuple[float, ...] = tuple(accumulate(weights or ()))
+
+    @property
+    def content(self) -> Content:
+        """Create a new grid content of a whole grid.
+
+        Returns:
+            Content: a grid content.
+        """
+        return GridContent(self.region(0, 0, self.height, self.width))
+
+    @property
+    def height(self) -> int:
+        """Specify a grid height.
+
+        Returns:
+            int: a grid height e.g `10`.
+        """
+        return self._size.height
+
+    @property
+    def width(self) -> int:
+        """Specify a grid width.
+
+        Returns:
+            int: a grid width e.g `10`.
+        """
+        return self._size.width
+
+    def build(self) -> None:
+        """Validate a grid as there is nothing to generate up front.
+
+        Raises:
+           ValueError: if the size of a grid or letter weights are invalid.
+        """
+        _validate_random_grid(self._size, self._weights)
+        _logger.info(f'{self._size} of {self._seed} seed is used')
+
+    def letter(self, row: int, column: int) -> str:
+        """Return a letter of a cell.
+
+        Args:
+            row: (int) a row of a cell.
+            column: (int) a column of a cell.
+
+        Returns:
+            str: a letter of a cell e.g `a`.
+        """
+        return self._hashed_letter(_split_mix(self._row_state(row) ^ column))
+
+    def region(self, top: int, left: int, height: int, width: int) -> List[str]:
+        """Return rows of a rectangular region of a grid.
+
+        Only cells of a region are computed.
+
+        Args:
+            top: (int) the first row of a region.
+            left: (int) the first column of a region.
+            height: (int) the amount of rows of a region.
+            width: (int) the amount of columns of a region.
+
+        Returns:
+            list: rows of a region.
+        """
+        bottom: int = min(top + height, self.height)
+        right: int = min(left + width, self.width)
+        rows: List[str] = []
+        for row in range(top, bottom):  # type: int
+            state: int = self._row_state(row)
+            rows.append(
+                ''.join(
+                    self._hashed_letter(_split_mix(state ^ column))
+                    for column in range(left, right)
+                )
+            )
+        return rows
+
+    def refresh(self) -> None:
+        """Nothing to clear as cells are not kept."""
+
+    def _hashed_letter(self, value: int) -> str:
+        """Return a letter of a 64-bit hash of a cell.
+
+        Args:
+            value: (int) a hash of a cell.
+
+        Returns:
+            str: a letter of a cell e.g `a`.
+        """
+        if not self._bounds:
+            return _LETTERS[value % 26]
+        return _LETTERS[
+            bisect_right(
+                self._bounds,
+                value * self._bounds[-1] / (_UINT64 + 1),
+                0,
+                len(self._bounds) - 1,
+            )
+        ]
+
+    def _row_state(self, row: int) -> int:
+        """Return a hash state of a row shared by its cells.
+
+        Args:
+            row: (int) a row of a grid.
+
+        Returns:
+            int: a hash state of a row.
+        """
+        return _split_mix(_split_mix(self._seed) ^ row)
+
+    def __enter__(self) -> Grid:
+        """Validate a grid.
+
+        Returns:
+            Grid: a grid connection.
+        """
+        self.build()
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close a grid connection.
+
+        Raise any exception triggered within the runtime context.
+        """
+        self.refresh()
+
+
+@mypyc_attr(native_class=False)
+class MappedGrid(Grid):
+    """The class represents a memory-mapped file grid of letters.
+
+    A file contains rows of the same width separated by a new line. Only
+    pages of a file touched by requested regions are loaded into memory, so
+    a grid is able to be bigger than memory.
+
+    Example:
+    >>> with MappedGrid(Path('grid.txt')) as grid:
+    >>>     grid.region(top=0, left=0, height=2, width=2)
+    ['ab', 'cd']
+    """
+
+    __slots__: Sequence[str] = ('_path', '_map', '_width')
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._map: Optional[mmap.mmap] = None
+        self._width: int = 0
+
+    @property
+    def content(self) -> Content:
+        """Create a new grid content of a whole file.
+
+        Returns:
+            Content: a grid content.
+        """
+        return GridContent(self.region(0, 0, self.height, self.width))
+
+    @property
+    def height(self) -> int:
+        """Specify a grid height.
+
+        Returns:
+            int: a grid height e.g `10`.
+        """
+        return len(self._mapped()) // (self.width + 1)
+
+    @property
+    def width(self) -> int:
+        """Specify a grid width.
+
+        Returns:
+            int: a grid width e.g `10`.
+        """
+        self._mapped()
+        return self._width
+
+    def build(self) -> None:
+        """Map a file of a grid into memory.
+
+        Raises:
+            ValueError: if a file does not contain a grid of letters.
+        """
+        _logger.info(f'Mapping a grid of letters from "{self._path}" ...')
+        with self._path.open('rb') as grid_file:  # type: IO[bytes]
+            self._map = mmap.mmap(
+                grid_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        self._width = self._map.find(b'\n')
+        if self._width <= 0 or len(self._map) % (self._width + 1):
+            self.refresh()
+            raise ValueError(
+                f'Cannot map a grid of letters from "{self._path}" file. '
+                'It should contain rows of the same width ended by a new line!'
+            )
+
+    def region(self, top: int, left: int, height: int, width: int) -> List[str]:
+        """Return rows of a rectangular region of a grid.
+
+        Only a region of a file is read, a whole file is never materialised.
+
+        Args:
+            top: (int) the first row of a region.
+            left: (int) the first column of a region.
+            height: (int) the amount of rows of a region.
+            width: (int) the amount of columns of a region.
+
+        Returns:
+            list: rows of a region.
+        """
+        grid_map, stride = self._mapped(), self.width + 1
+        bottom: int = min(top + height, self.height)
+        right: int = min(left + width, self.width)
+        rows: List[str] = []
+        for offset in range(top * stride, bottom * stride, stride):  # type: int
+            start, stop = offset + left, offset + right
+            rows.append(grid_map[start:stop].decode())
+        return rows
+
+    def refresh(self) -> None:
+        """Unmap a file of a grid from memory."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _mapped(self) -> mmap.mmap:
+        """Return a memory map of a file, it is mapped on the first use.
+
+        Returns:
+            mmap: a memory map of a file.
+        """
+        if self._map is None:
+            self.build()
+        return cast(mmap.mmap, self._map)
+
+    def __reduce__(self) -> Tuple[Type['MappedGrid'], Tuple[Path]]:
+        """Pickle a grid as a path of its file, so a worker maps it again.
+
+        Returns:
+            tuple: a type and a path of a grid.
+        """
+        return self.__class__, (self._path,)
+
+    def __enter__(self) -> Grid:
+        """Map a file of a grid into memory.
+
+        Returns:
+            Grid: a grid connection.
+        """
+        self.build()
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Unmap a file of a grid from memory.
+
+        Raise any exception triggered within the runtime context.
+        """
+        self.refresh()
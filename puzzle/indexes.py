@@ -0,0 +1,811 @@
+"""A module contains as set API for the puzzle search indexes."""
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+from typing import (
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from loguru import logger as _logger
+
+from puzzle.compat import mypyc_attr
+from puzzle.properties import Coordinate, LetterCoordinates
+from puzzle.puzzles import (
+    Cells,
+    SearchPuzzle,
+    SearchWordPuzzle,
+    _board_cells,
+    _word_range,
+    is_word_pattern,
+)
+
+Trie = Dict[str, 'Trie']
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class NGramSearchPuzzle(SearchWordPuzzle):
+    """The class represents a search word puzzle of an n-gram index.
+
+    Every bigram of a grid is indexed once by the cells and directions it
+    starts at, so a word is probed only where its first 2 letters already
+    line up instead of probing 8 directions from every cell of its first
+    letter. Starts of a bigram more frequent than `trigram_threshold` are
+    split further by trigrams, the most frequent bigrams first, until the
+    index holds `max_entries` starts (no budget if `0`).
+
+    A start is stored as an index of a cell within a board of letters and
+    a direction packed into an unsigned integer, so coordinates are found
+    in the same order as `SearchWordPuzzle` does.
+
+    Example:
+    >>> puzzle = NGramSearchPuzzle(board, trigram_threshold=64)
+    >>> puzzle.probes('foo')
+    (12, 720)
+    """
+
+    SUPPORTS_EARLY_EXIT: ClassVar[bool] = True
+    __slots__: Sequence[str] = (
+        '_trigram_threshold',
+        '_max_entries',
+        '_bigrams',
+        '_trigrams',
+    )
+
+    def __init__(
+        self,
+        board: LetterCoordinates,
+        trigram_threshold: int = 64,
+        max_entries: int = 0,
+    ) -> None:
+        super().__init__(board)
+        self._trigram_threshold = trigram_threshold
+        self._max_entries = max_entries
+        self._bigrams: Dict[str, 'array[int]'] = {}
+        self._trigrams: Dict[str, Dict[str, 'array[int]']] = {}
+
+    def coordinates(self, item: str, limit: int = 0) -> List[str]:
+        """Return all starting and ending coordinates of a given word item.
+
+        Example:
+        >>> puzzle = NGramSearchPuzzle(board)
+        >>> puzzle.coordinates('foo')
+        ['Start at: (X13, Y36); End at: (X11, Y34)', ...]
+
+        Args:
+            item: (str) name of an item.
+            limit: (int) the amount of coordinates to stop a search at,
+                all coordinates are searched if it is `0`.
+
+        Returns:
+            list: a list of found coordinates of a given word.
+
+        Raises:
+            ValueError: if the board of letters is empty.
+        """
+        if is_word_pattern(item) or len(item) < 2:
+            return super().coordinates(item, limit)
+        if len(self._board) == 0:
+            raise ValueError('The board of letters is empty!')
+        _logger.info(f'Searching for "{item}" word in a grid of letters ...')
+        self.build()
+        starts = self._starts(item)
+        _logger.debug(
+            f'Probing {len(starts)} starts of "{item}" word instead of '
+            f'{self._plain_probes(item)}'
+        )
+        last_step: int = len(item) - 1
+        word_coordinates: List[str] = []
+        for start in starts:  # type: int
+            direction: int = start % len(self.MOVEMENT_COORDINATES)
+            first_coordinate = self._board[item[0]][
+                start // len(self.MOVEMENT_COORDINATES)
+            ]
+            row_step, column_step = self.MOVEMENT_COORDINATES[
+                direction
+            ].as_tuple()
+            row_point, column_point = first_coordinate.as_tuple()
+            for step in range(2, last_step + 1):  # type: int
+                self._probes += 1
+                cell = self._cells.get(
+                    (
+                        row_point + row_step * step,
+                        column_point + column_step * step,
+                    )
+                )
+                if cell != item[step]:
+                    break
+            else:
+                word_coordinates.append(
+                    _word_range(
+                        first_coordinate,
+                        Coordinate(
+                            row_point + row_step * last_step,
+                            column_point + column_step * last_step,
+                        ),
+                    )
+                )
+                if len(word_coordinates) == limit:
+                    break
+        return word_coordinates
+
+    def probes(self, item: str) -> Tuple[int, int]:
+        """Return the amount of starts probed with and without an index.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            tuple: the amount of indexed probes and plain ones.
+        """
+        if is_word_pattern(item) or len(item) < 2:
+            return self._plain_probes(item), self._plain_probes(item)
+        self.build()
+        return len(self._starts(item)), self._plain_probes(item)
+
+    def prepare(self) -> None:
+        """Build an index of n-grams once.
+
+        Raises:
+            ValueError: if the board of letters is empty.
+        """
+        self.build()
+
+    def build(self) -> None:
+        """Build an index of n-grams unless it is built already.
+
+        Raises:
+            ValueError: if the board of letters is empty.
+        """
+        if self._bigrams:
+            return
+        if len(self._board) == 0:
+            raise ValueError('The board of letters is empty!')
+        self._index()
+        directions: int = len(self.MOVEMENT_COORDINATES)
+        for letter, letter_coordinates in self._board.items():
+            for index, coordinate in enumerate(
+                letter_coordinates
+            ):  # type: int, Coordinate
+                for direction in range(directions):  # type: int
+                    cell = self._next_cell(coordinate, direction, 1)
+                    if cell is not None:
+                        self._bigrams.setdefault(
+                            f'{letter}{cell}', array('I')
+                        ).append(index * directions + direction)
+        entries: int = self._split_bigrams(
+            sum(map(len, self._bigrams.values()))
+        )
+        _logger.info(
+            f'Indexed {entries} starts of {len(self._bigrams)} bigrams and '
+            f'{len(self._trigrams)} split bigrams '
+            f'({entries * array("I").itemsize} bytes)'
+        )
+
+    def _split_bigrams(self, entries: int) -> int:
+        """Split starts of the most frequent bigrams by trigrams.
+
+        Args:
+            entries: (int) the amount of indexed starts of bigrams.
+
+        Returns:
+            int: the amount of indexed starts of bigrams and trigrams.
+        """
+        directions: int = len(self.MOVEMENT_COORDINATES)
+        for bigram in sorted(
+            self._bigrams, key=lambda key: -len(self._bigrams[key])
+        ):  # type: str
+            starts = self._bigrams[bigram]
+            if len(starts) <= self._trigram_threshold:
+                break
+            if self._max_entries and entries + len(starts) > self._max_entries:
+                break
+            trigrams: Dict[str, 'array[int]'] = {}
+            for start in starts:  # type: int
+                cell = self._next_cell(
+                    self._board[bigram[0]][start // directions],
+                    start % directions,
+                    2,
+                )
+                if cell is not None:
+                    trigrams.setdefault(cell, array('I')).append(start)
+            self._trigrams[bigram] = trigrams
+            entries += len(starts)
+        return entries
+
+    def _starts(self, item: str) -> Sequence[int]:
+        """Return packed starts of a word from an index of n-grams.
+
+        Args:
+            item: (str) name of an item, at least 2 letters long.
+
+        Returns:
+            sequence: packed cell indexes and directions.
+        """
+        bigram: str = item[:2]
+        if len(item) > 2 and bigram in self._trigrams:
+            return self._trigrams[bigram].get(item[2], ())
+        return self._bigrams.get(bigram, ())
+
+    def _plain_probes(self, item: str) -> int:
+        """Return the amount of starts probed without an index.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            int: 8 directions of every cell of the first letter of a word.
+        """
+        return len(self.MOVEMENT_COORDINATES) * len(
+            self._board.get(item[:1], ())
+        )
+
+    def _next_cell(
+        self, coordinate: Coordinate, direction: int, step: int
+    ) -> Optional[str]:
+        """Return a letter of a cell a few steps away in a direction.
+
+        Args:
+            coordinate: (Coordinate) a coordinate of a cell.
+            direction: (int) an index of a direction.
+            step: (int) the amount of steps.
+
+        Returns:
+            str: a letter of a cell or None if it is out of a grid.
+        """
+        row_step, column_step = self.MOVEMENT_COORDINATES[direction].as_tuple()
+        return self._cells.get(
+            (
+                coordinate.x_axis + row_step * step,
+                coordinate.y_axis + column_step * step,
+            )
+        )
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class DictionarySearchPuzzle(SearchWordPuzzle):
+    """The class represents a search puzzle of a whole dictionary of words.
+
+    Words are stored in a trie of letters, so a grid is walked once from
+    every cell in 8 directions and every dictionary word lining up along a
+    walk is found in a single pass instead of a search per word.
+
+    Example:
+    >>> puzzle = DictionarySearchPuzzle(board, ('foo', 'bar'))
+    >>> list(puzzle.matches())
+    [('foo', 'Start at: (X0, Y0), End at: (X0, Y2)'), ...]
+    """
+
+    __slots__: Sequence[str] = ('_trie', '_depth')
+
+    def __init__(
+        self, board: LetterCoordinates, words: Iterable[str] = ()
+    ) -> None:
+        super().__init__(board)
+        self._trie: Trie = {}
+        self._depth: int = 0
+        for word in words:  # type: str
+            node: Trie = self._trie
+            for letter in word:  # type: str
+                node = node.setdefault(letter, {})
+            node[''] = {}
+            self._depth = max(self._depth, len(word))
+
+    def search_many(
+        self, words: Iterable[str], limit: int = 0
+    ) -> Iterator[Tuple[str, List[str]]]:
+        """Yield coordinates of every word of a batch found in a single pass.
+
+        Words of a batch are found with a trie of their own in a single walk
+        of a grid, patterns of words are searched one by one.
+
+        Args:
+            words: (iterable) words to search.
+            limit: (int) the amount of coordinates of every word to stop
+                a search at, all coordinates are searched if it is `0`.
+
+        Returns:
+            iterator: words along with their found coordinates.
+
+        Raises:
+            ValueError: if the board of letters is empty.
+        """
+        batch: List[str] = list(words)
+        found: Dict[str, List[str]] = {
+            word: [] for word in batch if not is_word_pattern(word)
+        }
+        for word, coordinate in DictionarySearchPuzzle(
+            self._board, found
+        ).matches():  # type: str, str
+            found[word].append(coordinate)
+        for word in batch:  # type: str
+            if word in found:
+                yield word, found[word][: limit or None]
+            else:
+                yield word, self.coordinates(word, limit)
+
+    def matches(self, min_length: int = 1) -> Iterator[Tuple[str, str]]:
+        """Yield every dictionary word found in a grid with its coordinates.
+
+        Words are found in the order of cells of a grid, then directions
+        and lengths of words.
+
+        Args:
+            min_length: (int) the least length of a word to find.
+
+        Returns:
+            iterator: found words along with their coordinates.
+
+        Raises:
+            ValueError: if the board of letters is empty.
+        """
+        if len(self._board) == 0:
+            raise ValueError('The board of letters is empty!')
+        _logger.info('Searching for dictionary words in a grid of letters ...')
+        self._index()
+        for row_point, column_point in sorted(self._cells):  # type: int, int
+            for (
+                movement_coordinate
+            ) in self.MOVEMENT_COORDINATES:  # type: Coordinate
+                row_step, column_step = movement_coordinate.as_tuple()
+                node: Trie = self._trie
+                letters: List[str] = []
+                for step in range(self._depth):  # type: int
+                    self._probes += 1
+                    cell = self._cells.get(
+                        (
+                            row_point + row_step * step,
+                            column_point + column_step * step,
+                        )
+                    )
+                    if cell is None or cell not in node:
+                        break
+                    node = node[cell]
+                    letters.append(cell)
+                    if '' in node and step + 1 >= min_length:
+                        yield ''.join(letters), _word_range(
+                            Coordinate(row_point, column_point),
+                            Coordinate(
+                                row_point + row_step * step,
+                                column_point + column_step * step,
+                            ),
+                        )
+
+
+_SUFFIX_ARRAY_MAGIC: bytes = b'SWPSA\x01'
+_SUFFIX_ARRAY_HEADER: struct.Struct = struct.Struct('<6sIII')
+
+
+def _projection_lines(
+    height: int, width: int
+) -> Iterator[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """Yield the first cell and an axis of every line of a grid projection.
+
+    Lines are rows, columns, diagonals and anti-diagonals of a grid.
+
+    Example:
+    >>> tuple(_projection_lines(1, 2))[:3]
+    (((0, 0), (0, 1)), ((0, 0), (1, 0)), ((0, 1), (1, 0)))
+
+    Args:
+        height: (int) the amount of rows of a grid.
+        width: (int) the amount of columns of a grid.
+
+    Returns:
+        iterator: the first row and column, a row and a column step.
+    """
+    yield from (((row, 0), (0, 1)) for row in range(height))
+    yield from (((0, column), (1, 0)) for column in range(width))
+    yield from (((row, 0), (1, 1)) for row in range(height - 1, -1, -1))
+    yield from (((0, column), (1, 1)) for column in range(1, width))
+    yield from (((row, 0), (-1, 1)) for row in range(height))
+    yield from (((height - 1, column), (-1, 1)) for column in range(1, width))
+
+
+def _line_length(
+    height: int, width: int, first: Tuple[int, int], axis: Tuple[int, int]
+) -> int:
+    """Return the amount of cells of a line of a grid projection.
+
+    Args:
+        height: (int) the amount of rows of a grid.
+        width: (int) the amount of columns of a grid.
+        first: (tuple) the first row and column of a line.
+        axis: (tuple) a row and a column step of a line.
+
+    Returns:
+        int: the amount of cells of a line.
+    """
+    row, column = first
+    row_step, column_step = axis
+    if not row_step:
+        return width
+    if not column_step:
+        return height
+    rows: int = height - row if row_step > 0 else row + 1
+    return min(rows, width - column)
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class SuffixArraySearchPuzzle(SearchPuzzle):
+    """The class represents a search puzzle of a suffix array index.
+
+    Rows, columns, diagonals and anti-diagonals of a grid are joined into
+    a single text once, and suffixes of a text are sorted (by up to `depth`
+    letters). A word and its reversed word are looked up with a binary
+    search of sorted suffixes, so a lookup takes O(length x log(cells) +
+    occurrences) regardless of a grid size, it pays off once a grid is
+    searched for many words.
+
+    An index is built on the first lookup, it is able to be saved to a file
+    along with a grid and loaded back without building.
+
+    Coordinates are returned in the order of grid cells, the same as
+    coordinates of `SearchWordPuzzle` of a board of `GridContent`.
+
+    Example:
+    >>> puzzle = SuffixArraySearchPuzzle.from_rows(['foo', 'bar'])
+    >>> puzzle.coordinates('ob')
+    ['Start at: (X0, Y1), End at: (X1, Y0)']
+    """
+
+    MOVEMENT_COORDINATES: ClassVar[Tuple[Tuple[int, int], ...]] = tuple(
+        movement.as_tuple()
+        for movement in SearchWordPuzzle.MOVEMENT_COORDINATES
+    )
+    __slots__: Sequence[str] = (
+        '_board',
+        '_rows',
+        '_depth',
+        '_text',
+        '_suffixes',
+        '_line_starts',
+        '_lines',
+        '_probes',
+    )
+
+    def __init__(self, board: LetterCoordinates, depth: int = 16) -> None:
+        self._board = board
+        self._rows: Sequence[str] = ()
+        self._depth = depth
+        self._text: str = ''
+        self._suffixes: 'array[int]' = array('I')
+        self._line_starts: List[int] = []
+        self._lines: List[Tuple[Tuple[int, int], Tuple[int, int]]] = []
+        self._probes: int = 0
+
+    @classmethod
+    def from_rows(
+        cls, rows: Sequence[str], depth: int = 16
+    ) -> 'SuffixArraySearchPuzzle':
+        """Create a puzzle of rows of a grid without a board of letters.
+
+        Args:
+            rows: (sequence) rows of a grid.
+            depth: (int) the amount of letters suffixes are sorted by.
+
+        Returns:
+            SuffixArraySearchPuzzle: a puzzle of a grid.
+        """
+        puzzle = cls({}, depth)
+        puzzle._rows = rows  # pylint:disable=protected-access
+        return puzzle
+
+    @classmethod
+    def load(cls, path: Path) -> 'SuffixArraySearchPuzzle':
+        """Load a puzzle of an index saved to a file.
+
+        Args:
+            path: (Path) a path to a file of an index.
+
+        Returns:
+            SuffixArraySearchPuzzle: a puzzle of an indexed grid.
+
+        Raises:
+            ValueError: if a file is not an index of a grid.
+        """
+        content: bytes = path.read_bytes()
+        size: int = _SUFFIX_ARRAY_HEADER.size
+        if content[: len(_SUFFIX_ARRAY_MAGIC)] != _SUFFIX_ARRAY_MAGIC:
+            raise ValueError(f'"{path}" file is not an index of a grid')
+        _, height, width, depth = _SUFFIX_ARRAY_HEADER.unpack(content[:size])
+        puzzle = cls({}, depth)
+        puzzle._index_lines(height, width)  # pylint:disable=protected-access
+        end: int = size + puzzle._line_starts[-1]  # pylint:disable=W0212
+        puzzle._text = content[size:end].decode('ascii')  # pylint:disable=W0212
+        puzzle._suffixes.frombytes(content[end:])  # pylint:disable=W0212
+        if sys.byteorder != 'little':
+            puzzle._suffixes.byteswap()  # pylint:disable=protected-access
+        puzzle._rows = puzzle._text.split('\n')[:height]  # pylint:disable=W0212
+        return puzzle
+
+    def save(self, path: Path) -> None:
+        """Save an index of a grid to a file.
+
+        Args:
+            path: (Path) a path to a file of an index.
+        """
+        self.build()
+        suffixes: 'array[int]' = array('I', self._suffixes)
+        if sys.byteorder != 'little':
+            suffixes.byteswap()
+        with path.open('wb') as stream:  # type: IO[bytes]
+            stream.write(
+                _SUFFIX_ARRAY_HEADER.pack(
+                    _SUFFIX_ARRAY_MAGIC,
+                    len(self._rows),
+                    len(self._rows[0]),
+                    self._depth,
+                )
+            )
+            stream.write(self._text.encode('ascii'))
+            stream.write(suffixes.tobytes())
+
+    def prepare(self) -> None:
+        """Build an index of a grid once unless it is loaded already.
+
+        Raises:
+            ValueError: if the board of letters is empty.
+        """
+        self.build()
+
+    def build(self) -> None:
+        """Build an index of a grid unless it is built or loaded already.
+
+        Raises:
+            ValueError: if the board of letters is empty.
+        """
+        if self._text:
+            return
+        if not self._rows:
+            if len(self._board) == 0:
+                raise ValueError('The board of letters is empty!')
+            cells: Cells = _board_cells(self._board)
+            height: int = max(row for row, _ in cells) + 1
+            width: int = max(column for _, column in cells) + 1
+            self._rows = [
+                ''.join(
+                    cells.get((row, column), '\n') for column in range(width)
+                )
+                for row in range(height)
+            ]
+        height, width = len(self._rows), len(self._rows[0])
+        _logger.info(f'Indexing suffixes of {height}x{width} grid ...')
+        self._index_lines(height, width)
+        self._text = ''.join(
+            f'{self._projection(first, axis)}\n' for first, axis in self._lines
+        )
+        for letter in sorted(set(self._text) - {'\n'}):  # type: str
+            starts: List[int] = [
+                match.start() for match in re.finditer(letter, self._text)
+            ]
+            starts.sort(key=self._suffix)
+            self._suffixes.extend(starts)
+
+    def coordinates(self, item: str, limit: int = 0) -> List[str]:
+        """Return all starting and ending coordinates of a given word item.
+
+        Example:
+        >>> puzzle = SuffixArraySearchPuzzle(board)
+        >>> puzzle.coordinates('foo')
+        ['Start at: (X13, Y36); End at: (X11, Y34)', ...]
+
+        Args:
+            item: (str) name of an item.
+            limit: (int) the amount of coordinates to stop a search at,
+                all coordinates are searched if it is `0`.
+
+        Returns:
+            list: a list of found coordinates of a given word.
+
+        Raises:
+            ValueError: if the board of letters is empty.
+        """
+        if is_word_pattern(item):
+            return SearchWordPuzzle(self._letters()).coordinates(item, limit)
+        self.build()
+        _logger.info(f'Searching for "{item}" word in a grid of letters ...')
+        last_step: int = len(item) - 1
+        word_coordinates: List[str] = []
+        for row, column, direction in sorted(
+            self._placements(item)
+        ):  # type: int, int, int
+            row_step, column_step = self.MOVEMENT_COORDINATES[direction]
+            word_coordinates.append(
+                _word_range(
+                    Coordinate(row, column),
+                    Coordinate(
+                        row + row_step * last_step,
+                        column + column_step * last_step,
+                    ),
+                )
+            )
+            if len(word_coordinates) == limit:
+                break
+        return word_coordinates
+
+    def exists(self, item: str) -> bool:
+        """Return whether a given word item is present in a grid.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            bool: True if a word is present otherwise False.
+        """
+        if is_word_pattern(item):
+            return super().exists(item)
+        self.build()
+        return any(True for _ in self._placements(item))
+
+    def probe_count(self, item: str) -> int:
+        """Return the amount of suffixes a search of a given item compares.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            int: the amount of compared suffixes.
+        """
+        if is_word_pattern(item):
+            return SearchWordPuzzle(self._letters()).probe_count(item)
+        self._probes = 0
+        self.coordinates(item)
+        return self._probes
+
+    @property
+    def name(self) -> str:
+        """Return name of a search word puzzle.
+
+        Returns:
+            str: a name of a search puzzle e.g `SuffixArraySearchPuzzle`.
+        """
+        return self.__class__.__name__
+
+    def _placements(self, item: str) -> Iterator[Tuple[int, int, int]]:
+        """Yield the first cell and a direction of every word placement.
+
+        A suffix of a reversed word is a placement of a word in the opposite
+        direction from the other end of a suffix.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            iterator: the first row, column and a direction index.
+        """
+        last_step: int = len(item) - 1
+        for value, sign in ((item, 1), (item[::-1], -1)):  # type: str, int
+            for start in self._starts(value):  # type: int
+                line: int = bisect_right(self._line_starts, start) - 1
+                (row, column), (row_step, column_step) = self._lines[line]
+                offset: int = start - self._line_starts[line]
+                if sign < 0:
+                    offset += last_step
+                yield (
+                    row + row_step * offset,
+                    column + column_step * offset,
+                    self.MOVEMENT_COORDINATES.index(
+                        (row_step * sign, column_step * sign)
+                    ),
+                )
+
+    def _starts(self, value: str) -> Iterator[int]:
+        """Yield text offsets of suffixes starting with a word.
+
+        Suffixes are sorted by `depth` letters only, so a longer word is
+        looked up by its prefix and checked against a text.
+
+        Args:
+            value: (str) a word to look up.
+
+        Returns:
+            iterator: text offsets of a word.
+        """
+        prefix: str = value[: self._depth]
+        low: int = self._bound(prefix, upper=False)
+        high: int = self._bound(prefix, upper=True)
+        for start in self._suffixes[low:high]:  # type: int
+            self._probes += 1
+            if len(value) == len(prefix) or self._text.startswith(value, start):
+                yield start
+
+    def _bound(self, prefix: str, upper: bool) -> int:
+        """Return a bound of sorted suffixes starting with a prefix.
+
+        Args:
+            prefix: (str) a prefix of suffixes.
+            upper: (bool) whether an upper (exclusive) bound is returned.
+
+        Returns:
+            int: an index of sorted suffixes.
+        """
+        low, high = 0, len(self._suffixes)
+        while low < high:
+            self._probes += 1
+            middle: int = (low + high) // 2
+            start: int = self._suffixes[middle]
+            end: int = start + len(prefix)
+            suffix: str = self._text[start:end]
+            if suffix < prefix or (upper and suffix == prefix):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _suffix(self, start: int) -> str:
+        """Return the first `depth` letters of a suffix of a text.
+
+        Args:
+            start: (int) a text offset of a suffix.
+
+        Returns:
+            str: a prefix of a suffix.
+        """
+        end: int = start + self._depth
+        return self._text[start:end]
+
+    def _index_lines(self, height: int, width: int) -> None:
+        """Index lines of a grid projection by their text offsets.
+
+        Args:
+            height: (int) the amount of rows of a grid.
+            width: (int) the amount of columns of a grid.
+        """
+        self._lines = list(_projection_lines(height, width))
+        self._line_starts = [0]
+        offset: int = 0
+        for (
+            first,
+            axis,
+        ) in self._lines:  # type: Tuple[int, int], Tuple[int, int]
+            offset += _line_length(height, width, first, axis) + 1
+            self._line_starts.append(offset)
+
+    def _projection(self, first: Tuple[int, int], axis: Tuple[int, int]) -> str:
+        """Return letters of a line of a grid projection.
+
+        Args:
+            first: (tuple) the first row and column of a line.
+            axis: (tuple) a row and a column step of a line.
+
+        Returns:
+            str: letters of a line.
+        """
+        row, column = first
+        row_step, column_step = axis
+        if not row_step:
+            return self._rows[row]
+        length: int = _line_length(
+            len(self._rows), len(self._rows[0]), first, axis
+        )
+        return ''.join(
+            self._rows[row + row_step * step][column + column_step * step]
+            for step in range(length)
+        )
+
+    def _letters(self) -> LetterCoordinates:
+        """Return a board of letters of a grid.
+
+        Returns:
+            dict: a board of letters.
+        """
+        if not self._board and self._rows:
+            self._board = {}
+            for row_index, row_value in enumerate(self._rows):  # type: int, str
+                for column_index, letter in enumerate(
+                    row_value
+                ):  # type: int, str
+                    self._board.setdefault(letter, []).append(
+                        Coordinate(row_index, column_index)
+                    )
+        return self._board
@@ -0,0 +1,574 @@
+"""A module contains as set API for the puzzle tool options."""
+import inspect
+import random
+import re
+import textwrap
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from typer import Option
+
+if TYPE_CHECKING:  # pragma: no cover
+    from puzzle.properties import GridSize  # noqa: F401
+    from puzzle.servers import ServerLimits  # noqa: F401
+    from puzzle.tools import SearchBounds  # noqa: F401
+
+# Puzzle interfaces are imported within options to start the tool fast.
+# pylint:disable=import-outside-toplevel
+_Command = TypeVar('_Command', bound=Callable[..., None])
+_Group = TypeVar('_Group')
+
+
+def _validate_puzzle_grid_size(grid_size: str) -> None:
+    """Validate puzzle grid size input parameter.
+
+    Args:
+        grid_size: (str) the size of a grid.
+
+    Raises:
+        ValueError: in case invalid input parameter.
+    """
+    if not re.findall(string=grid_size, pattern=r'-?\d+x-?\d+'):
+        raise ValueError(
+            f'Specified "{grid_size}" grid size value is invalid. '
+            'It should match "NxN" pattern e e.g "10x10"!.'
+        )
+
+
+def _validate_puzzle_word(word: str) -> None:
+    """Validate puzzle custom word input parameter.
+
+    Args:
+        word: (str) a word to search.
+
+    Raises:
+        ValueError: in case invalid input parameter.
+    """
+    if not re.findall(string=word, pattern=r'^[a-z]+$'):
+        raise ValueError(
+            f'Specified "{word}" word value is invalid. It '
+            'should match "only lowercase letters" pattern e.g "foo"!.'
+        )
+
+
+def _validate_puzzle_pattern(pattern: str) -> None:
+    """Validate puzzle custom pattern of words input parameter.
+
+    Args:
+        pattern: (str) a pattern of words to search.
+
+    Raises:
+        ValueError: in case invalid input parameter.
+    """
+    tokens = re.fullmatch(
+        string=pattern, pattern=r'(?:[a-z?*]|\[\^?[a-z](?:-?[a-z])*\])+'
+    )
+    if not tokens or not pattern.strip('*'):
+        raise ValueError(
+            f'Specified "{pattern}" pattern value is invalid. It should '
+            'match "lowercase letters, "?", "*" or "[...]" classes" '
+            'pattern e.g "f?o", "ba*" or "[bc]at"!.'
+        )
+
+
+def _validate_puzzle_words_path(path: Path) -> None:
+    """Validate puzzle words filepath input parameter.
+
+    Args:
+        path: (Path) a path to words to search.
+
+    Raises:
+        ValueError: in case invalid input parameter.
+    """
+    if path.suffix not in ('.txt', '.log'):
+        raise ValueError(
+            f'"{path}" file has invalid suffix ' f'"{path.suffix}"'
+        )
+
+
+def _validate_puzzle_output_format(output_format: str) -> None:
+    """Validate puzzle output format input parameter.
+
+    Args:
+        output_format: (str) a format to stream found words with.
+
+    Raises:
+        ValueError: in case invalid input parameter.
+    """
+    if output_format not in ('log', 'jsonl', 'csv'):
+        raise ValueError(
+            f'Specified "{output_format}" output format is invalid. '
+            'It should be one of "log", "jsonl" or "csv" formats!.'
+        )
+
+
+def _validate_puzzle_executor(executor_kind: str) -> None:
+    """Validate puzzle executor kind input parameter.
+
+    Args:
+        executor_kind: (str) a kind of an executor to search words with.
+
+    Raises:
+        ValueError: in case invalid input parameter.
+    """
+    if executor_kind not in ('auto', 'process', 'thread', 'inline'):
+        raise ValueError(
+            f'Specified "{executor_kind}" executor value is invalid. It should '
+            'be one of "auto", "process", "thread" or "inline" executors!.'
+        )
+
+
+def _validate_puzzle_max_memory(max_memory: str) -> None:
+    """Validate puzzle memory budget input parameter.
+
+    Args:
+        max_memory: (str) a memory budget of a search.
+
+    Raises:
+        ValueError: in case invalid input parameter.
+    """
+    if not re.fullmatch(string=max_memory, pattern=r'[1-9]\d*[KMGTkmgt]?[Bb]?'):
+        raise ValueError(
+            f'Specified "{max_memory}" memory budget is invalid. It should '
+            'match "N" bytes or "N" with "K", "M", "G" or "T" unit e.g "4G"!.'
+        )
+
+
+def _validate_puzzle_all_words(word: str, min_length: int, top: int) -> None:
+    """Validate puzzle all words input parameters.
+
+    Args:
+        word: (str) a custom word to search.
+        min_length: (int) the least length of a word to search.
+        top: (int) the amount of the longest words to keep.
+
+    Raises:
+        ValueError: in case invalid input parameter.
+    """
+    if word:
+        raise ValueError(
+            f'Specified "{word}" word cannot be searched along with all words '
+            'of a dictionary. Use either "--word" or "--all-words" option!.'
+        )
+    if min_length < 1 or top < 0:
+        raise ValueError(
+            f'Specified "{min_length}" minimum length or "{top}" top words '
+            'is invalid. It should be a positive length and a non-negative '
+            'amount of words!.'
+        )
+
+
+def _validate_puzzle_timeouts(
+    timeout: float, word_timeout: float, max_worker_tasks: int
+) -> None:
+    """Validate puzzle search timeouts input parameters.
+
+    Args:
+        timeout: (float) seconds of a whole search.
+        word_timeout: (float) seconds of a search of a single word.
+        max_worker_tasks: (int) the amount of tasks to replace a worker after.
+
+    Raises:
+        ValueError: in case invalid input parameter.
+    """
+    if timeout < 0 or word_timeout < 0 or max_worker_tasks < 0:
+        raise ValueError(
+            f'Specified "{timeout}" timeout, "{word_timeout}" word timeout or '
+            f'"{max_worker_tasks}" worker tasks is invalid. It should be '
+            'a non-negative amount of seconds and tasks!.'
+        )
+
+
+def _validate_puzzle_manifest_path(path: Path) -> None:
+    """Validate puzzle batch manifest filepath input parameter.
+
+    Args:
+        path: (Path) a path to a manifest of grids.
+
+    Raises:
+        ValueError: in case invalid input parameter.
+    """
+    if path.suffix != '.jsonl':
+        raise ValueError(
+            f'"{path}" file has invalid suffix "{path.suffix}". '
+            'It should be a JSON lines file e.g "grids.jsonl"!.'
+        )
+
+
+def _random_words(
+    path: Path, limit: int = 5, unique: bool = False
+) -> Generator[str, None, None]:
+    """Read random N words from a text file path.
+
+    Args:
+        path: (Path) a path to text file.
+        limit: (int) the amount of words to invoke.
+        unique: (bool) whether words are sampled without replacement,
+            so at most all distinct words of a file are invoked.
+
+    Returns:
+        generator: a generator N random words.
+    """
+    with path.open() as payload:  # type: IO[str]
+        words = payload.read().split()
+        if unique:
+            distinct: List[str] = list(dict.fromkeys(words))
+            yield from random.sample(distinct, min(limit, len(distinct)))
+            return
+        for _ in range(limit):  # type: int
+            yield random.choice(words)
+
+
+def _dictionary_words(path: Path) -> List[str]:
+    """Read distinct words of a dictionary from a text file path.
+
+    Args:
+        path: (Path) a path to text file.
+
+    Returns:
+        list: distinct words in the order of a file.
+    """
+    with path.open() as payload:  # type: IO[str]
+        return list(dict.fromkeys(payload.read().split()))
+
+
+@dataclass(frozen=True)
+class _GridOptions:
+    """The class represents options of a grid of letters."""
+
+    grid_size: str = Option(
+        default='50x50',
+        help=textwrap.dedent(
+            'The size for a randomly created grid of letters (a-z only).'
+        ),
+    )
+    seed: Optional[int] = Option(
+        default=None,
+        help=textwrap.dedent(
+            'A seed to generate a reproducible grid of letters procedurally.'
+        ),
+    )
+    max_memory: str = Option(
+        default='',
+        help=textwrap.dedent(
+            'A memory budget of a search e.g "512M" or "4G". A storage and '
+            'an engine fitting it are picked, otherwise the tool fails fast.'
+        ),
+    )
+
+    @property
+    def size(self) -> 'GridSize':
+        """Return the size of a grid.
+
+        Returns:
+            GridSize: the size of a grid e.g `GridSize(50, 50)`.
+        """
+        from puzzle.properties import GridSize
+
+        return GridSize(*map(int, self.grid_size.split('x')))
+
+    def validate(self) -> None:
+        """Validate options of a grid.
+
+        Raises:
+            ValueError: in case invalid input parameter.
+        """
+        _validate_puzzle_grid_size(self.grid_size)
+        if self.max_memory:
+            _validate_puzzle_max_memory(self.max_memory)
+
+
+@dataclass(frozen=True)
+class _WordsOptions:
+    """The class represents options of words to search."""
+
+    words_file_path: Path = Option(
+        default=Path('payload/words.txt'),
+        help=textwrap.dedent(
+            'A path to a custom text file with words to search.'
+        ),
+    )
+    words_limit: int = Option(
+        default=5,
+        help=textwrap.dedent('Search N random words from a given text file.'),
+    )
+    word: str = Option(
+        default='',
+        help=textwrap.dedent(
+            'A custom word or pattern to search in a grid of letters '
+            'e.g "foo", "f?o", "fo*" or "[bc]at".'
+        ),
+    )
+    unique_words: bool = Option(
+        default=False,
+        help=textwrap.dedent(
+            'Sample N random words without replacement, otherwise repeated '
+            'words are searched once and reported for every copy.'
+        ),
+    )
+    all_words: bool = Option(
+        default=False,
+        help=textwrap.dedent(
+            'Find every word of a given text file present in a grid within '
+            'a single pass over a grid.'
+        ),
+    )
+    min_length: int = Option(
+        default=1,
+        help=textwrap.dedent(
+            'Find words of at least N letters only (with "--all-words").'
+        ),
+    )
+    top: int = Option(
+        default=0,
+        help=textwrap.dedent(
+            'Keep the longest N found words only (all if 0, '
+            'with "--all-words").'
+        ),
+    )
+
+    def validate(self) -> bool:
+        """Validate options of words to search.
+
+        Returns:
+            bool: True if a custom word is a pattern otherwise False.
+
+        Raises:
+            ValueError: in case invalid input parameter.
+        """
+        if self.all_words:
+            _validate_puzzle_all_words(self.word, self.min_length, self.top)
+        return _validate_puzzle_search_word(self.word, self.words_file_path)
+
+    def words(self) -> List[str]:
+        """Return words to search in a grid of letters.
+
+        Returns:
+            list: words to search.
+        """
+        if self.word:
+            return [self.word]
+        if self.all_words:
+            return _dictionary_words(self.words_file_path)
+        return list(
+            _random_words(
+                path=self.words_file_path,
+                limit=self.words_limit,
+                unique=self.unique_words,
+            )
+        )
+
+
+@dataclass(frozen=True)
+class _SearchOptions:
+    """The class represents options of an engine and bounds of a search."""
+
+    limit: int = Option(
+        default=0,
+        help=textwrap.dedent(
+            'Stop a search once N coordinates are found (all if 0).'
+        ),
+    )
+    executor: str = Option(
+        default='auto',
+        help=textwrap.dedent(
+            'An executor to search words with: "process", "thread", "inline" '
+            'or "auto" (threads if the GIL is disabled, processes otherwise).'
+        ),
+    )
+    engine: str = Option(
+        default='auto',
+        help=textwrap.dedent(
+            'A search engine to search words with e.g "bitmask" or "ngram" '
+            '(see "engines" command), "auto" picks one for every word.'
+        ),
+    )
+    timeout: float = Option(
+        default=0,
+        help=textwrap.dedent(
+            'Stop a search after N seconds, words left unsearched are '
+            'reported as timed out (no timeout if 0).'
+        ),
+    )
+    word_timeout: float = Option(
+        default=0,
+        help=textwrap.dedent(
+            'Interrupt a search of a single word after N seconds, it is '
+            'reported as timed out (no timeout if 0).'
+        ),
+    )
+    max_worker_tasks: int = Option(
+        default=0,
+        help=textwrap.dedent(
+            'Replace a worker process with a fresh one after N searched '
+            'words to release its memory (never if 0).'
+        ),
+    )
+
+    @property
+    def bounds(self) -> 'SearchBounds':
+        """Return bounds of a search.
+
+        Returns:
+            SearchBounds: a limit of coordinates and timeouts of a search.
+        """
+        from puzzle.tools import SearchBounds
+
+        return SearchBounds(self.limit, self.timeout, self.word_timeout)
+
+    def validate(self) -> None:
+        """Validate options of a search.
+
+        Raises:
+            ValueError: in case invalid input parameter.
+        """
+        _validate_puzzle_executor(self.executor)
+        _validate_puzzle_timeouts(
+            self.timeout, self.word_timeout, self.max_worker_tasks
+        )
+
+
+@dataclass(frozen=True)
+class _OutputOptions:
+    """The class represents options of an output of found words."""
+
+    output_format: str = Option(
+        default='log',
+        help=textwrap.dedent(
+            'A format to stream found words with: "log", "jsonl" or "csv".'
+        ),
+    )
+    output_path: Path = Option(
+        default=None,
+        help=textwrap.dedent(
+            'A path to a file to stream found words to (stdout if unset).'
+        ),
+    )
+
+    def validate(self) -> None:
+        """Validate options of an output.
+
+        Raises:
+            ValueError: in case invalid input parameter.
+        """
+        _validate_puzzle_output_format(self.output_format)
+
+
+@dataclass(frozen=True)
+class _ServerOptions:
+    """The class represents options of limits and an engine of a server."""
+
+    max_concurrency: int = Option(
+        default=0,
+        help=textwrap.dedent(
+            'Search N requests at the same time (CPU cores amount if 0).'
+        ),
+    )
+    queue_size: int = Option(
+        default=64,
+        help=textwrap.dedent(
+            'Keep N requests waiting for their turn, reject others.'
+        ),
+    )
+    engine: str = Option(
+        default='word',
+        help=textwrap.dedent(
+            'A search engine to search words of requests with e.g "bitmask" '
+            '(see "engines" command).'
+        ),
+    )
+
+    @property
+    def limits(self) -> 'ServerLimits':
+        """Return limits of requests of a server.
+
+        Returns:
+            ServerLimits: limits of concurrent and waiting requests.
+        """
+        from puzzle.servers import ServerLimits
+
+        return ServerLimits(self.max_concurrency, self.queue_size)
+
+
+def _grouped_options(*groups: type) -> Callable[[_Command], _Command]:
+    """Declare fields of option groups as options of a command.
+
+    Typer reads options of a command from its signature, so fields of groups
+    replace keyword arguments of a command, which gets them as `**options`
+    to be grouped back with `_options`.
+
+    Args:
+        groups: (tuple) dataclasses of options.
+
+    Returns:
+        callable: a decorator of a command.
+    """
+
+    def declare(command: _Command) -> _Command:
+        signature = inspect.signature(command)
+        parameters: List[inspect.Parameter] = [
+            parameter
+            for parameter in signature.parameters.values()
+            if parameter.kind is not inspect.Parameter.VAR_KEYWORD
+        ]
+        for group in groups:  # type: type
+            parameters.extend(inspect.signature(group).parameters.values())
+        setattr(
+            command,
+            '__signature__',
+            signature.replace(parameters=parameters),
+        )
+        return command
+
+    return declare
+
+
+def _options(group: Callable[..., _Group], options: Dict[str, Any]) -> _Group:
+    """Return a group of options of a command.
+
+    Args:
+        group: (callable) a dataclass of options.
+        options: (dict) options of a command.
+
+    Returns:
+        object: a group of options.
+    """
+    return group(
+        **{name: options[name] for name in inspect.signature(group).parameters}
+    )
+
+
+def _validate_puzzle_search_word(word: str, words_file_path: Path) -> bool:
+    """Validate a custom word, a pattern or words filepath input parameter.
+
+    Args:
+        word: (str) a custom word or pattern to search.
+        words_file_path: (Path) a path to words to search.
+
+    Returns:
+        bool: True if a custom word is a pattern otherwise False.
+
+    Raises:
+        ValueError: in case invalid input parameter.
+    """
+    from puzzle.puzzles import is_word_pattern
+
+    pattern: bool = bool(word) and is_word_pattern(word)
+    if pattern:
+        _validate_puzzle_pattern(word)
+    elif word:
+        _validate_puzzle_word(word)
+    else:
+        _validate_puzzle_words_path(words_file_path)
+    return pattern
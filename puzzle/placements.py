@@ -0,0 +1,323 @@
+"""A module contains as set API for the puzzle word placements."""
+import random
+from bisect import bisect_right
+from itertools import accumulate
+from types import TracebackType
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+
+from loguru import logger as _logger
+
+from puzzle.compat import mypyc_attr
+from puzzle.grids import _LETTERS, CompactRows, Content, Grid, GridContent
+from puzzle.properties import Coordinate, GridSize, WordPlacement
+
+_RANDOM_LETTER_CODES: bytes = bytes(
+    ord(_LETTERS[code % len(_LETTERS)]) for code in range(256)
+)
+_RANDOM_DROPPED_CODES: bytes = bytes(range(256 - 256 % len(_LETTERS), 256))
+_PLANT_DIRECTIONS: Sequence[Tuple[int, int]] = (
+    (1, 0),
+    (0, 1),
+    (-1, 0),
+    (0, -1),
+    (-1, -1),
+    (1, 1),
+    (-1, 1),
+    (1, -1),
+)
+
+
+def _fitting_range(size: int, step: int, last_step: int) -> range:
+    """Return cells of an axis a word fits from in a direction.
+
+    Example:
+    >>> _fitting_range(size=10, step=-1, last_step=2)
+    range(2, 10)
+
+    Args:
+        size: (int) the amount of cells of an axis.
+        step: (int) a step of a direction along an axis.
+        last_step: (int) the amount of steps of a word.
+
+    Returns:
+        range: cells of an axis.
+    """
+    if step > 0:
+        return range(size - last_step)
+    if step < 0:
+        return range(last_step, size)
+    return range(size)
+
+
+@mypyc_attr(native_class=False)
+class PlantedWordsGrid(Grid):
+    """The class represents a grid of letters with planted words.
+
+    Words are planted in random directions (8 of them) with overlaps of
+    the same letters allowed, then the rest of cells are filled with random
+    letters. Every placement of a word is kept as a ground truth to compare
+    search results with.
+
+    Cells of a grid are tracked by an occupancy map of 1 byte per cell
+    (`0` for a free cell), starts of a word are enumerated within cells a
+    word fits from in every direction, so a word never runs out of a grid,
+    and a conflict is checked with a single strided slice of a map. Starts
+    are tried from a random one onward, so a word is not planted only if
+    it conflicts with other words at every start.
+
+    Example:
+    >>> with PlantedWordsGrid(GridSize(10, 10), ['foo'], seed=1) as grid:
+    >>>     grid.placements
+    [WordPlacement(word='foo', start=Coordinate(3, 7), ...)]
+    """
+
+    __slots__: Sequence[str] = (
+        '_size',
+        '_words',
+        '_seed',
+        '_rows',
+        '_placements',
+    )
+
+    def __init__(
+        self,
+        grid_size: GridSize,
+        words: Iterable[str],
+        seed: Optional[int] = None,
+        packed: bool = False,
+    ) -> None:
+        self._size = grid_size
+        self._words = tuple(words)
+        self._seed = seed
+        self._rows = CompactRows(packed=packed)
+        self._placements: List[WordPlacement] = []
+
+    @property
+    def content(self) -> Content:
+        """Create a new grid content.
+
+        Returns:
+            Content: a grid content.
+        """
+        return GridContent(self._rows)
+
+    @property
+    def height(self) -> int:
+        """Specify a grid height.
+
+        Returns:
+            int: a grid height e.g `10`.
+        """
+        return self._size.height
+
+    @property
+    def width(self) -> int:
+        """Specify a grid width.
+
+        Returns:
+            int: a grid width e.g `10`.
+        """
+        return self._size.width
+
+    @property
+    def placements(self) -> List[WordPlacement]:
+        """Return placements of planted words in the order of words.
+
+        A word which does not fit a grid (or conflicts with other words
+        at every start) is not planted.
+
+        Returns:
+            list: placements of planted words.
+        """
+        return self._placements
+
+    def build(self) -> None:
+        """Plant words in a grid and fill the rest with random letters.
+
+        Raises:
+           ValueError: if the size of a grid or words are invalid.
+        """
+        if self.height <= 0 or self.width <= 0:
+            raise ValueError(
+                'Cannot generate a grid of letters due to '
+                f'invalid "{self.height}x{self.width}" grid size. '
+                'It should not contain negative or zero values!'
+            )
+        for word in self._words:  # type: str
+            if not word or word.strip(_LETTERS):
+                raise ValueError(
+                    f'Cannot plant "{word}" word in a grid of letters. '
+                    'It should contain lowercase letters only!'
+                )
+        _logger.info(
+            f'Planting {len(self._words)} words in {self._size} grid ...'
+        )
+        generator = random.Random(self._seed)
+        cells = bytearray(self.height * self.width)
+        planted: List[Tuple[slice, bytes]] = []
+        for word in self._words:  # type: str
+            placement = self._plant(generator, cells, word.encode())
+            if placement is not None:
+                planted.append(placement)
+        if len(planted) < len(self._words):
+            _logger.warning(
+                f'Cannot plant {len(self._words) - len(planted)} words '
+                'as they do not fit a grid'
+            )
+        letters = self._random_letters(generator, len(cells))
+        for cells_slice, value in planted:  # type: slice, bytes
+            letters[cells_slice] = value
+        for row in range(self.height):  # type: int
+            start: int = row * self.width
+            end: int = start + self.width
+            self._rows.append(letters[start:end].decode())
+
+    def region(self, top: int, left: int, height: int, width: int) -> List[str]:
+        """Return rows of a rectangular region of a grid.
+
+        Args:
+            top: (int) the first row of a region.
+            left: (int) the first column of a region.
+            height: (int) the amount of rows of a region.
+            width: (int) the amount of columns of a region.
+
+        Returns:
+            list: rows of a region.
+        """
+        bottom, right = min(top + height, self.height), left + width
+        return [row[left:right] for row in self._rows[top:bottom]]
+
+    def refresh(self) -> None:
+        """Clear a grid of letters and placements of words."""
+        self._rows = CompactRows(packed=self._rows.packed)
+        self._placements = []
+
+    def _plant(
+        self, generator: random.Random, cells: bytearray, word: bytes
+    ) -> Optional[Tuple[slice, bytes]]:
+        """Plant a word at a random free start of an occupancy map.
+
+        Args:
+            generator: (Random) a generator of random placements.
+            cells: (bytearray) an occupancy map of a grid.
+            word: (bytes) a word to plant.
+
+        Returns:
+            tuple: cells of a planted word and a word or None if a word is
+                not planted.
+        """
+        last_step: int = len(word) - 1
+        for row_step, column_step, row, column in self._fitting_starts(
+            generator, last_step
+        ):  # type: int, int, int, int
+            step: int = row_step * self.width + column_step
+            start: int = row * self.width + column
+            stop: Optional[int] = start + step * len(word)
+            if stop is not None and stop < 0:
+                stop = None
+            cells_slice = slice(start, stop, step)
+            line = bytes(cells[cells_slice])
+            if any(cell and cell != letter for cell, letter in zip(line, word)):
+                continue
+            cells[cells_slice] = word
+            self._placements.append(
+                WordPlacement(
+                    word.decode(),
+                    Coordinate(row, column),
+                    Coordinate(
+                        row + row_step * last_step,
+                        column + column_step * last_step,
+                    ),
+                )
+            )
+            return cells_slice, word
+        return None
+
+    def _fitting_starts(
+        self, generator: random.Random, last_step: int
+    ) -> Iterator[Tuple[int, int, int, int]]:
+        """Yield every start a word fits a grid from in every direction.
+
+        Starts are yielded from a random one onward. A single letter word
+        is planted in one direction only, as every direction of it is the
+        same cell.
+
+        Args:
+            generator: (Random) a generator of a random first start.
+            last_step: (int) the amount of steps of a word.
+
+        Returns:
+            iterator: a direction of a row, a direction of a column, a row
+                and a column of a start.
+        """
+        fitting: List[Tuple[Tuple[int, int], range, range]] = [
+            (
+                direction,
+                _fitting_range(self.height, direction[0], last_step),
+                _fitting_range(self.width, direction[1], last_step),
+            )
+            for direction in (
+                _PLANT_DIRECTIONS if last_step else _PLANT_DIRECTIONS[:1]
+            )
+        ]
+        bounds: List[int] = list(
+            accumulate(len(rows) * len(columns) for _, rows, columns in fitting)
+        )
+        offset: int = generator.randrange(bounds[-1]) if bounds[-1] else 0
+        for number in range(bounds[-1]):  # type: int
+            position: int = (offset + number) % bounds[-1]
+            index: int = bisect_right(bounds, position)
+            (row_step, column_step), rows, columns = fitting[index]
+            cell: int = position - (bounds[index - 1] if index else 0)
+            yield (
+                row_step,
+                column_step,
+                rows[cell // len(columns)],
+                columns[cell % len(columns)],
+            )
+
+    @staticmethod
+    def _random_letters(generator: random.Random, amount: int) -> bytearray:
+        """Return uniformly random letters (a-z only).
+
+        Random bytes above the largest multiple of 26 are dropped, so every
+        letter is equally likely.
+
+        Args:
+            generator: (Random) a generator of random letters.
+            amount: (int) the amount of letters.
+
+        Returns:
+            bytearray: random letters.
+        """
+        letters = bytearray()
+        while len(letters) < amount:
+            size: int = amount - len(letters)
+            # The same bytes as `Random.randbytes` of Python 3.9+ produces.
+            letters += (
+                generator.getrandbits(8 * size)
+                .to_bytes(size, 'little')
+                .translate(_RANDOM_LETTER_CODES, _RANDOM_DROPPED_CODES)
+            )
+        return letters
+
+    def __enter__(self) -> Grid:
+        """Build grid rows of planted words.
+
+        Returns:
+            Grid: a grid connection.
+        """
+        self.build()
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close a grid connection.
+
+        Raise any exception triggered within the runtime context.
+        """
+        self.refresh()
@@ -74,3 +74,28 @@ class GridSize(SafePropertyMixin):
 
     height: int
     width: int
+
+
+@dataclass(frozen=True)
+class WordPlacement(SafePropertyMixin):
+    """The class represents a placement of a word planted in a grid.
+
+    Example:
+    >>> placement = WordPlacement('foo', Coordinate(0, 0), Coordinate(0, 2))
+    >>> str(placement)
+    'Start at: (X0, Y0), End at: (X0, Y2)'
+    """
+
+    word: str
+    start: Coordinate
+    end: Coordinate
+
+    def __str__(self) -> str:
+        """Return user friendly coordinates of a placement.
+
+        They are formatted the same way search puzzles format found words.
+
+        Returns:
+            str: string representation of the placement.
+        """
+        return f'Start at: {self.start}, End at: {self.end}'
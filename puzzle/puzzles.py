@@ -1,29 +1,287 @@
 """A module contains as set API for all supported puzzles."""
+import re
+import string
 from abc import ABC, abstractmethod
-from typing import List, Sequence, Tuple
+from itertools import islice
+from typing import (
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from loguru import logger as _logger
 
+from puzzle.compat import mypyc_attr
 from puzzle.properties import Coordinate, LetterCoordinates
 
+Cells = Dict[Tuple[int, int], str]
+Steps = Tuple[Tuple[int, ...], ...]
+Positions = Tuple[FrozenSet[str], ...]
 
+_PATTERN_TOKEN: str = r'\[\^?[a-z](?:-?[a-z])*\]|[a-z?*]'
+_TOKEN_LETTERS: Dict[str, FrozenSet[str]] = {
+    '?': frozenset(string.ascii_lowercase),
+    **{letter: frozenset(letter) for letter in string.ascii_lowercase},
+}
+
+
+def _board_cells(board: LetterCoordinates) -> Cells:
+    """Return a letter of every cell in a board keyed by its location.
+
+    Example:
+    >>> _board_cells({'a': [Coordinate(0, 0)], 'b': [Coordinate(1, 0)]})
+    {(0, 0): 'a', (1, 0): 'b'}
+
+    Args:
+        board: (dict) a board of letters.
+
+    Returns:
+        dict: a letter of every cell e.g `{(0, 0): 'a'}`.
+    """
+    return {
+        coordinate.as_tuple(): letter
+        for letter, coordinates in board.items()
+        for coordinate in coordinates
+    }
+
+
+def _axis_steps(size: int, last_step: int) -> Steps:
+    """Return the steps a word fits in from every point along a grid axis.
+
+    Example:
+    >>> _axis_steps(size=3, last_step=2)
+    ((0, 1), (0,), (-1, 0))
+
+    Args:
+        size: (int) the size of a grid axis.
+        last_step: (int) the number of steps to reach the last letter.
+
+    Returns:
+        tuple: fitting steps for every point along a grid axis.
+    """
+    return tuple(
+        tuple(
+            step for step in (-1, 0, 1) if 0 <= point + step * last_step < size
+        )
+        for point in range(size)
+    )
+
+
+def is_word_pattern(item: str) -> bool:
+    """Return whether a given item is a pattern of words rather than a word.
+
+    A pattern may contain wildcards and character classes:
+      - `?` matches any single letter e.g `c?t`
+      - `*` matches any letters up to a grid size e.g `ab*`
+      - `[...]` matches a single letter of a class e.g `[bc]at`, `[a-e]`
+        or `[^aeiou]`
+
+    Args:
+        item: (str) name of an item.
+
+    Returns:
+        bool: True if an item is a pattern otherwise False.
+    """
+    return any(symbol in item for symbol in '?*[')
+
+
+def _token_letters(token: str) -> FrozenSet[str]:
+    """Return letters matched by a single pattern token.
+
+    Letters of a letter and of `?` wildcard are looked up, letters of
+    a character class are collected from its letters and ranges.
+
+    Example:
+    >>> sorted(_token_letters('[a-cx]'))
+    ['a', 'b', 'c', 'x']
+
+    Args:
+        token: (str) a letter, `?` wildcard or `[...]` character class.
+
+    Returns:
+        frozenset: matched letters.
+    """
+    letters: Optional[FrozenSet[str]] = _TOKEN_LETTERS.get(token)
+    if letters is None:
+        matched = set(token.strip('[^]'))
+        for first, last in re.findall(
+            pattern=r'([a-z])-([a-z])', string=token
+        ):  # type: str, str
+            matched.update(map(chr, range(ord(first), ord(last) + 1)))
+        matched.discard('-')
+        letters = (
+            _TOKEN_LETTERS['?'] - matched
+            if token.startswith('[^')
+            else frozenset(matched)
+        )
+    return letters
+
+
+def _expand_tokens(
+    tokens: Sequence[str], room: int
+) -> Iterator[Tuple[FrozenSet[str], ...]]:
+    """Return letters of every position of all words matching tokens.
+
+    Every `*` token is expanded into `?` tokens to fit a given room.
+
+    Args:
+        tokens: (sequence) pattern tokens.
+        room: (int) the amount of letters `*` tokens may be expanded to.
+
+    Returns:
+        iterator: matched letters of every position.
+    """
+    if not tokens:
+        yield ()
+        return
+    if tokens[0] != '*':
+        for tail in _expand_tokens(tokens[1:], room):  # type: Positions
+            yield (_token_letters(tokens[0]),) + tail
+        return
+    for count in range(room + 1):  # type: int
+        for tail in _expand_tokens(tokens[1:], room - count):
+            yield (_token_letters('?'),) * count + tail
+
+
+def _pattern_positions(pattern: str, max_length: int) -> List[Positions]:
+    """Return letters of every position of all words matching a pattern.
+
+    Example:
+    >>> _pattern_positions('c?', max_length=2)
+    [(frozenset({'c'}), frozenset({'a', 'b', ..., 'z'}))]
+
+    Args:
+        pattern: (str) a pattern of words e.g `c?t`.
+        max_length: (int) the maximum length of matching words.
+
+    Returns:
+        list: matched letters of every position of every word length.
+
+    Raises:
+        ValueError: if a pattern is invalid.
+    """
+    tokens: List[str] = re.findall(pattern=_PATTERN_TOKEN, string=pattern)
+    if ''.join(tokens) != pattern or all(token == '*' for token in tokens):
+        raise ValueError(f'Specified "{pattern}" pattern is invalid')
+    room: int = max_length - sum(token != '*' for token in tokens)
+    if room < 0:
+        return []
+    return [
+        positions
+        for positions in _expand_tokens(tokens, room)
+        if positions and all(positions)
+    ]
+
+
+def _word_range(first: Coordinate, last: Coordinate) -> str:
+    """Return user friendly starting and ending coordinates of a word.
+
+    Args:
+        first: (Coordinate) a coordinate of the first letter.
+        last: (Coordinate) a coordinate of the last letter.
+
+    Returns:
+        str: coordinates e.g `Start at: (X0, Y0), End at: (X0, Y2)`.
+    """
+    return f'Start at: {first}, End at: {last}'
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class SearchPuzzle(ABC):
-    """The class represents an abstract interface for a search puzzle."""
+    """The class represents an abstract interface for a search puzzle.
+
+    Capability flags tell tools how an engine behaves:
+      - `SUPPORTS_PATTERNS` whether patterns of words are searched
+        (see `is_word_pattern`)
+      - `SUPPORTS_EARLY_EXIT` whether a limited search stops at `limit`
+        coordinates rather than trimming all found ones
+    """
 
+    SUPPORTS_PATTERNS: ClassVar[bool] = True
+    SUPPORTS_EARLY_EXIT: ClassVar[bool] = False
     __slots__: Sequence[str] = ()
 
     @abstractmethod
-    def coordinates(self, item: str) -> List[str]:
+    def coordinates(self, item: str, limit: int = 0) -> List[str]:
         """Return the abstract starting and ending coordinates of a given item.
 
         Args:
             item: (str) name of an item.
+            limit: (int) the amount of coordinates to stop a search at,
+                all coordinates are searched if it is `0`.
 
         Returns:
             list: a list of found coordinates.
         """
         pass
 
+    def exists(self, item: str) -> bool:
+        """Return whether a given item is present in a search puzzle.
+
+        A search is stopped as soon as the first coordinates are found.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            bool: True if an item is present otherwise False.
+        """
+        return bool(self.coordinates(item, limit=1))
+
+    def prepare(self) -> None:
+        """Build indexes of a board once before words are searched.
+
+        Indexes are built on the first search otherwise, nothing is built
+        by default.
+        """
+
+    def probe_count(self, item: str) -> int:
+        """Return the amount of probes a search of a given item makes.
+
+        A probe is a unit of work of an engine e.g a lookup of a grid cell,
+        so engines are compared regardless of a load of a machine.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            int: the amount of probes.
+
+        Raises:
+            NotImplementedError: if an engine does not count its probes.
+        """
+        raise NotImplementedError(f'{self.name} does not count its probes')
+
+    def search_many(
+        self, words: Iterable[str], limit: int = 0
+    ) -> Iterator[Tuple[str, List[str]]]:
+        """Yield coordinates of every word of a batch.
+
+        A puzzle is prepared once for a whole batch, engines are able to
+        search a batch at once instead of word by word.
+
+        Example:
+        >>> list(puzzle.search_many(['foo', 'bar']))
+        [('foo', ['Start at: (X0, Y0), End at: (X0, Y2)']), ('bar', [])]
+
+        Args:
+            words: (iterable) words to search.
+            limit: (int) the amount of coordinates of every word to stop
+                a search at, all coordinates are searched if it is `0`.
+
+        Returns:
+            iterator: words along with their found coordinates.
+        """
+        self.prepare()
+        for word in words:  # type: str
+            yield word, self.coordinates(word, limit)
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -35,6 +293,7 @@ class SearchPuzzle(ABC):
         pass
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class SearchWordPuzzle(SearchPuzzle):
     r"""The class represents a search word puzzle.
 
@@ -51,7 +310,7 @@ class SearchWordPuzzle(SearchPuzzle):
     ```
     """
 
-    MOVEMENT_COORDINATES: Tuple[Coordinate, ...] = (
+    MOVEMENT_COORDINATES: ClassVar[Tuple[Coordinate, ...]] = (
         Coordinate(1, 0),
         Coordinate(0, 1),
         Coordinate(-1, 0),
@@ -61,12 +320,22 @@ class SearchWordPuzzle(SearchPuzzle):
         Coordinate(-1, 1),
         Coordinate(1, -1),
     )
-    __slots__: Sequence[str] = ('_board',)
+    __slots__: Sequence[str] = (
+        '_board',
+        '_cells',
+        '_height',
+        '_width',
+        '_probes',
+    )
 
     def __init__(self, board: LetterCoordinates) -> None:
         self._board = board
+        self._cells: Cells = {}
+        self._height: int = 0
+        self._width: int = 0
+        self._probes: int = 0
 
-    def coordinates(self, item: str) -> List[str]:
+    def coordinates(self, item: str, limit: int = 0) -> List[str]:
         """Return all starting and ending coordinates of a given word item.
 
         Example:
@@ -74,8 +343,18 @@ class SearchWordPuzzle(SearchPuzzle):
         >>> puzzle.coordinates('foo')
         ['Start at: (X13, Y36); End at: (X11, Y34)', ...]
 
+        A search is anchored on the least frequent letter of a word, which
+        is matched outward in both directions, but coordinates are returned
+        in the order of cells of the first letter of a word. A search of
+        `limit` coordinates is anchored on the first letter of a word, so it
+        stops as soon as `limit` coordinates are found.
+
+        It is also able to search a pattern of words (see `is_word_pattern`).
+
         Args:
             item: (str) name of an item.
+            limit: (int) the amount of coordinates to stop a search at,
+                all coordinates are searched if it is `0`.
 
         Returns:
             list: a list of found coordinates of a given word.
@@ -86,48 +365,501 @@ class SearchWordPuzzle(SearchPuzzle):
         if len(self._board) == 0:
             raise ValueError('The board of letters is empty!')
         word_coordinates: List[str] = []
-        _logger.info(f'Searching for "{item}" word in a grid of letters ...')
-        try:
-            for first_coordinate in self._board[item[0]]:  # type: Coordinate
-                for (
-                    movement_coordinate
-                ) in self.MOVEMENT_COORDINATES:  # type: Coordinate
-                    row_point, column_point = (
-                        first_coordinate.x_axis,
-                        first_coordinate.y_axis,
-                    )
-                    for next_letter in item[1:]:  # type: str
-                        row_point, column_point = (
-                            row_point + movement_coordinate.x_axis,
-                            column_point + movement_coordinate.y_axis,
+        if is_word_pattern(item):
+            word_coordinates = self._pattern_coordinates(item, limit)
+        else:
+            _logger.info(
+                f'Searching for "{item}" word in a grid of letters ...'
+            )
+            absent_letters = set(item) - self._board.keys()
+            if absent_letters:
+                _logger.warning(
+                    f'Cannot find coordinates for "{item}" word as the board '
+                    f'does not contain "{min(absent_letters)}" letter'
+                )
+            else:
+                word_coordinates = self._word_coordinates(item, limit)
+        return word_coordinates
+
+    @property
+    def name(self) -> str:
+        """Return name of a search word puzzle.
+
+        Returns:
+            str: a name of a search puzzle e.g `SearchWordPuzzle`.
+        """
+        return self.__class__.__name__
+
+    def prepare(self) -> None:
+        """Index letters of a board by cells once.
+
+        Raises:
+            ValueError: if the board of letters is empty.
+        """
+        if len(self._board) == 0:
+            raise ValueError('The board of letters is empty!')
+        self._index()
+
+    def probe_count(self, item: str) -> int:
+        """Return the amount of grid cells a search of a given item looks up.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            int: the amount of looked up cells.
+        """
+        self._probes = 0
+        self.coordinates(item)
+        return self._probes
+
+    def _index(self) -> None:
+        """Index letters of a board by cells along with a grid size."""
+        if not self._cells:
+            self._cells = _board_cells(self._board)
+            self._height = max(row for row, _ in self._cells) + 1
+            self._width = max(column for _, column in self._cells) + 1
+
+    def _pattern_coordinates(self, pattern: str, limit: int) -> List[str]:
+        """Return all starting and ending coordinates of a pattern of words.
+
+        Every word length of a pattern is anchored on its rarest position,
+        so a search starts from the least amount of cells instead of cells
+        of the first letter.
+
+        Args:
+            pattern: (str) a pattern of words e.g `c?t`.
+            limit: (int) the amount of coordinates to return.
+
+        Returns:
+            list: a list of found coordinates of a given pattern.
+        """
+        _logger.info(
+            f'Searching for "{pattern}" pattern in a grid of letters ...'
+        )
+        self._index()
+        found: Dict[Tuple[int, int, int, int], str] = {}
+        for positions in _pattern_positions(
+            pattern, max_length=max(self._height, self._width)
+        ):  # type: Positions
+            found.update(
+                self._anchored_matches(positions, self._anchor(positions))
+            )
+        word_coordinates = [found[start] for start in sorted(found)]
+        return word_coordinates[:limit] if limit else word_coordinates
+
+    def _anchor(self, positions: Positions) -> int:
+        """Return a position of a word matched by the least amount of cells.
+
+        Args:
+            positions: (tuple) matched letters of every position of a word.
+
+        Returns:
+            int: a position of an anchor in a word.
+        """
+        cells_amount: List[int] = [
+            sum(len(self._board.get(letter, ())) for letter in letters)
+            for letters in positions
+        ]
+        return cells_amount.index(min(cells_amount))
+
+    def _word_coordinates(self, item: str, limit: int) -> List[str]:
+        """Return coordinates of a word of letters present on the board.
+
+        Args:
+            item: (str) a word to search.
+            limit: (int) the amount of coordinates to stop a search at,
+                all coordinates are searched if it is `0`.
+
+        Returns:
+            list: a list of found coordinates of a given word.
+        """
+        self._index()
+        positions: Positions = tuple(map(frozenset, item))
+        anchor: int = (
+            0
+            if limit
+            else min(
+                range(len(item)),
+                key=lambda index: len(self._board[item[index]]),
+            )
+        )
+        matches: Iterator[
+            Tuple[Tuple[int, int, int, int], str]
+        ] = self._anchored_matches(positions, anchor)
+        if anchor:
+            first_cells: Dict[Tuple[int, int], int] = {
+                coordinate.as_tuple(): index
+                for index, coordinate in enumerate(self._board[item[0]])
+            }
+            matches = iter(
+                sorted(
+                    matches,
+                    key=lambda found: (first_cells[found[0][:2]], found[0][2]),
+                )
+            )
+        return [found[1] for found in islice(matches, limit or None)]
+
+    def _anchored_matches(
+        self, positions: Positions, anchor: int
+    ) -> Iterator[Tuple[Tuple[int, int, int, int], str]]:
+        """Yield coordinates of a word matched around cells of an anchor.
+
+        Letters are matched outward from an anchor position in both
+        directions along each of 8 axes, so a search is started from cells
+        of the least frequent letter of a word instead of its first letter.
+
+        Args:
+            positions: (tuple) matched letters of every position of a word.
+            anchor: (int) a position of an anchor in a word.
+
+        Returns:
+            iterator: found coordinates keyed by a start cell, a direction
+                and a length of a word.
+        """
+        last_step: int = len(positions) - 1
+        steps: Tuple[int, ...] = tuple(
+            range(anchor + 1, last_step + 1)
+        ) + tuple(range(anchor - 1, -1, -1))
+        movements: List[Tuple[int, int]] = [
+            movement_coordinate.as_tuple()
+            for movement_coordinate in self.MOVEMENT_COORDINATES
+        ]
+        cells: Cells = self._cells
+        for letter in sorted(positions[anchor]):  # type: str
+            for anchor_coordinate in self._board.get(
+                letter, ()
+            ):  # type: Coordinate
+                anchor_row: int = anchor_coordinate.x_axis
+                anchor_column: int = anchor_coordinate.y_axis
+                for direction, (row_step, column_step) in enumerate(
+                    movements
+                ):  # type: int, Tuple[int, int]
+                    row_point: int = anchor_row - row_step * anchor
+                    column_point: int = anchor_column - column_step * anchor
+                    for step in steps:  # type: int
+                        self._probes += 1
+                        cell = cells.get(
+                            (
+                                row_point + row_step * step,
+                                column_point + column_step * step,
+                            )
                         )
-                        if (
-                            Coordinate(row_point, column_point)
-                            not in self._board[next_letter]
-                        ):
+                        if cell not in positions[step]:
                             break
                     else:
-                        last_coordinate = Coordinate(row_point, column_point)
+                        first_coordinate = Coordinate(row_point, column_point)
+                        last_coordinate = Coordinate(
+                            row_point + row_step * last_step,
+                            column_point + column_step * last_step,
+                        )
                         _logger.debug(
-                            f'Found "{item}" word at: '
+                            f'Found word at: '
                             f'{first_coordinate}; {last_coordinate}'
                         )
-                        word_coordinates.append(
-                            f'Start at: {first_coordinate}, '
-                            f'End at: {last_coordinate}'
-                        )
-        except KeyError as error_message:
+                        yield (
+                            row_point,
+                            column_point,
+                            direction,
+                            last_step,
+                        ), _word_range(first_coordinate, last_coordinate)
+
+
+_FITTING_MOVEMENTS: Dict[
+    Tuple[Tuple[int, ...], Tuple[int, ...]], Tuple[Coordinate, ...]
+] = {
+    (row_steps, column_steps): tuple(
+        movement
+        for movement in SearchWordPuzzle.MOVEMENT_COORDINATES
+        if movement.x_axis in row_steps and movement.y_axis in column_steps
+    )
+    for row_steps in ((-1, 0, 1), (0, 1), (-1, 0), (0,))
+    for column_steps in ((-1, 0, 1), (0, 1), (-1, 0), (0,))
+}
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class BoundedSearchWordPuzzle(SearchWordPuzzle):
+    """The class represents a direction-pruned search word puzzle.
+
+    It finds the same words as `SearchWordPuzzle` but skips the movement
+    directions in which a word does not fit into a grid from a start cell.
+    For every word length the fitting steps are precomputed once per row and
+    per column of a grid, so a start cell looks its directions up instead of
+    walking out of grid bounds.
+
+    The last letter of a word is checked before walking the rest of it, so
+    most of the candidates are rejected with a single lookup.
+    """
+
+    SUPPORTS_EARLY_EXIT: ClassVar[bool] = True
+    __slots__: Sequence[str] = ('_steps',)
+
+    def __init__(self, board: LetterCoordinates) -> None:
+        super().__init__(board)
+        self._steps: Dict[int, Tuple[Steps, Steps]] = {}
+
+    def coordinates(self, item: str, limit: int = 0) -> List[str]:
+        """Return all starting and ending coordinates of a given word item.
+
+        Example:
+        >>> puzzle = BoundedSearchWordPuzzle(board)
+        >>> puzzle.coordinates('foo')
+        ['Start at: (X13, Y36); End at: (X11, Y34)', ...]
+
+        Args:
+            item: (str) name of an item.
+            limit: (int) the amount of coordinates to stop a search at,
+                all coordinates are searched if it is `0`.
+
+        Returns:
+            list: a list of found coordinates of a given word.
+
+        Raises:
+            ValueError: if the board of letters is empty.
+        """
+        if is_word_pattern(item):
+            return super().coordinates(item, limit)
+        if len(self._board) == 0:
+            raise ValueError('The board of letters is empty!')
+        _logger.info(f'Searching for "{item}" word in a grid of letters ...')
+        absent_letters = set(item) - self._board.keys()
+        if absent_letters:
             _logger.warning(
                 f'Cannot find coordinates for "{item}" word as the board '
-                f'does not contain "{error_message.args[0]}" letter'
+                f'does not contain "{min(absent_letters)}" letter'
+            )
+            return []
+        self._index()
+        word_coordinates: List[str] = []
+        for first_coordinate in self._board[item[0]]:  # type: Coordinate
+            word_coordinates.extend(
+                self._walk(
+                    first_coordinate, item, limit - len(word_coordinates)
+                )
             )
+            if limit and len(word_coordinates) == limit:
+                break
         return word_coordinates
 
-    @property
-    def name(self) -> str:
-        """Return name of a search word puzzle.
+    def _walk(
+        self, first_coordinate: Coordinate, item: str, limit: int
+    ) -> List[str]:
+        """Return coordinates of a word starting from a given coordinate.
+
+        Args:
+            first_coordinate: (Coordinate) a coordinate of the first letter.
+            item: (str) name of an item.
+            limit: (int) the amount of coordinates to stop a walk at.
 
         Returns:
-            str: a name of a search puzzle e.g `SearchWordPuzzle`.
+            list: a list of found coordinates of a given word.
         """
-        return self.__class__.__name__
+        cells, last_step = self._cells, len(item) - 1
+        row_point, column_point = first_coordinate.as_tuple()
+        row_steps, column_steps = self._fitting_steps(len(item))
+        word_coordinates: List[str] = []
+        for movement_coordinate in _FITTING_MOVEMENTS[
+            row_steps[row_point], column_steps[column_point]
+        ]:  # type: Coordinate
+            row_step, column_step = movement_coordinate.as_tuple()
+            last_point = (
+                row_point + row_step * last_step,
+                column_point + column_step * last_step,
+            )
+            self._probes += 1
+            if cells.get(last_point) != item[-1]:
+                continue
+            for step in range(1, last_step):  # type: int
+                self._probes += 1
+                next_point = (
+                    row_point + row_step * step,
+                    column_point + column_step * step,
+                )
+                if cells.get(next_point) != item[step]:
+                    break
+            else:
+                last_coordinate = Coordinate(*last_point)
+                _logger.debug(
+                    f'Found "{item}" word at: '
+                    f'{first_coordinate}; {last_coordinate}'
+                )
+                word_coordinates.append(
+                    _word_range(first_coordinate, last_coordinate)
+                )
+                if len(word_coordinates) == limit:
+                    break
+        return word_coordinates
+
+    def _fitting_steps(self, length: int) -> Tuple[Steps, Steps]:
+        """Return the steps a word of a given length fits in a grid with.
+
+        Args:
+            length: (int) the length of a word.
+
+        Returns:
+            tuple: fitting steps for every row and for every column.
+        """
+        if length not in self._steps:
+            self._steps[length] = (
+                _axis_steps(self._height, length - 1),
+                _axis_steps(self._width, length - 1),
+            )
+        return self._steps[length]
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class AxialSearchWordPuzzle(SearchWordPuzzle):
+    r"""The class represents a search word puzzle walking 4 axes only.
+
+    A word read backwards along an axis is the reversed word read forwards,
+    so a word and its reversed word are walked along 4 canonical axes only:
+    ```
+      /
+     +-
+     |\
+    ```
+    A match of a reversed word is reported in the opposite direction from
+    the other end of a segment, so it finds the same placements as
+    `SearchWordPuzzle` but every placement of a palindrome (or a single
+    letter) is reported once.
+    """
+
+    CANONICAL_COORDINATES: ClassVar[Tuple[Coordinate, ...]] = (
+        Coordinate(1, 0),
+        Coordinate(0, 1),
+        Coordinate(1, 1),
+        Coordinate(-1, 1),
+    )
+    __slots__: Sequence[str] = ()
+
+    def coordinates(self, item: str, limit: int = 0) -> List[str]:
+        """Return all starting and ending coordinates of a given word item.
+
+        Example:
+        >>> puzzle = AxialSearchWordPuzzle(board)
+        >>> puzzle.coordinates('foo')
+        ['Start at: (X13, Y36); End at: (X11, Y34)', ...]
+
+        Args:
+            item: (str) name of an item.
+            limit: (int) the amount of coordinates to stop a search at,
+                all coordinates are searched if it is `0`.
+
+        Returns:
+            list: a list of found coordinates of a given word.
+
+        Raises:
+            ValueError: if the board of letters is empty.
+        """
+        if is_word_pattern(item) or not self._prepare(item):
+            return super().coordinates(item, limit)
+        word_coordinates = [
+            _word_range(*found[1:]) for found in sorted(self._placements(item))
+        ]
+        return word_coordinates[:limit] if limit else word_coordinates
+
+    def exists(self, item: str) -> bool:
+        """Return whether a given word item is present in a grid.
+
+        A search is stopped at the first found placement of a word.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            bool: True if a word is present otherwise False.
+        """
+        if is_word_pattern(item) or not self._prepare(item):
+            return super().exists(item)
+        return any(True for _ in self._placements(item))
+
+    def _prepare(self, item: str) -> bool:
+        """Prepare cells of a grid to search a given word item.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            bool: False if a grid is not able to be searched by axes.
+        """
+        if len(self._board) == 0 or set(item) - self._board.keys():
+            return False
+        _logger.info(f'Searching for "{item}" word in a grid of letters ...')
+        self._index()
+        return True
+
+    def _placements(
+        self, item: str
+    ) -> Iterator[Tuple[Tuple[int, int, int], Coordinate, Coordinate]]:
+        """Yield every placement of a word walking 4 canonical axes.
+
+        Args:
+            item: (str) name of an item.
+
+        Returns:
+            iterator: placements keyed by a start cell and a direction index
+                along with starting and ending coordinates of a word.
+        """
+        last_step = len(item) - 1
+        axes: List[Tuple[int, int]] = [
+            movement_coordinate.as_tuple()
+            for movement_coordinate in self.CANONICAL_COORDINATES[
+                : 1 if last_step == 0 else None
+            ]
+        ]
+        cells: Cells = self._cells
+        for segment in dict.fromkeys((item, item[::-1])):  # type: str
+            for start_coordinate in self._board[segment[0]]:  # type: Coordinate
+                row_point: int = start_coordinate.x_axis
+                column_point: int = start_coordinate.y_axis
+                for row_step, column_step in axes:  # type: int, int
+                    for step in range(1, last_step + 1):  # type: int
+                        self._probes += 1
+                        next_point = (
+                            row_point + row_step * step,
+                            column_point + column_step * step,
+                        )
+                        if cells.get(next_point) != segment[step]:
+                            break
+                    else:
+                        end_coordinate = Coordinate(
+                            row_point + row_step * last_step,
+                            column_point + column_step * last_step,
+                        )
+                        if segment is item:
+                            yield self._placement(
+                                start_coordinate, end_coordinate
+                            )
+                        else:
+                            yield self._placement(
+                                end_coordinate, start_coordinate
+                            )
+
+    def _placement(
+        self, first_coordinate: Coordinate, last_coordinate: Coordinate
+    ) -> Tuple[Tuple[int, int, int], Coordinate, Coordinate]:
+        """Return a placement of a found word.
+
+        Args:
+            first_coordinate: (Coordinate) a coordinate of the first letter.
+            last_coordinate: (Coordinate) a coordinate of the last letter.
+
+        Returns:
+            tuple: a placement keyed by a start cell and a direction index
+                along with starting and ending coordinates of a word.
+        """
+        _logger.debug(f'Found word at: {first_coordinate}; {last_coordinate}')
+        row_delta = last_coordinate.x_axis - first_coordinate.x_axis
+        column_delta = last_coordinate.y_axis - first_coordinate.y_axis
+        scale = max(abs(row_delta), abs(column_delta))
+        direction: int = 0
+        if scale:
+            direction = self.MOVEMENT_COORDINATES.index(
+                Coordinate(row_delta // scale, column_delta // scale)
+            )
+        return (
+            (*first_coordinate.as_tuple(), direction),
+            first_coordinate,
+            last_coordinate,
+        )
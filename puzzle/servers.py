@@ -0,0 +1,440 @@
+"""A module contains as set API for the puzzle search servers."""
+import hashlib
+import json
+import os
+import random
+import re
+import socket
+import stat
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+from socketserver import (
+    BaseServer,
+    StreamRequestHandler,
+    ThreadingTCPServer,
+    ThreadingUnixStreamServer,
+)
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from loguru import logger as _logger
+
+from puzzle.engines import search_engine
+from puzzle.executors import Executor, create_executor
+from puzzle.grids import GridContent
+from puzzle.puzzles import SearchPuzzle, SearchWordPuzzle
+from puzzle.tools import PuzzleType
+
+Address = Union[str, Tuple[str, int]]
+Response = Dict[str, Any]
+_WordTask = Tuple[str, Optional[Tuple[str, ...]], str]
+
+
+_WORKER_PUZZLES: 'OrderedDict[str, SearchPuzzle]' = OrderedDict()
+_WORKER_CACHE_SIZE: int = 32
+_WORKER_PUZZLE_TYPE: PuzzleType = SearchWordPuzzle
+
+
+def _load_worker_cache(
+    cache_size: int, puzzle_type: PuzzleType = SearchWordPuzzle
+) -> None:
+    """Set prepared puzzles to keep within a worker process.
+
+    Args:
+        cache_size: (int) the amount of recently searched grids to keep.
+        puzzle_type: (callable) a search puzzle to search words with.
+    """
+    # pylint:disable=global-statement
+    global _WORKER_CACHE_SIZE, _WORKER_PUZZLE_TYPE
+    _WORKER_CACHE_SIZE, _WORKER_PUZZLE_TYPE = cache_size, puzzle_type
+    _WORKER_PUZZLES.clear()
+
+
+def _search_cached_word(task: _WordTask) -> Optional[List[str]]:
+    """Return coordinates of a word within a worker process.
+
+    A puzzle of a grid is prepared once and kept among recently searched
+    grids of a worker, so next tasks of a grid send its key only.
+
+    Args:
+        task: (tuple) a key of a grid, rows of a grid (if a worker is not
+            aware of a grid yet) and a word to search.
+
+    Returns:
+        list: a list of found coordinates of a given word or None if a
+            worker is not aware of a grid and its rows are not sent.
+    """
+    key, rows, word = task
+    if key in _WORKER_PUZZLES:
+        _WORKER_PUZZLES.move_to_end(key)
+    elif rows is None:
+        return None
+    else:
+        puzzle = _WORKER_PUZZLE_TYPE(GridContent(list(rows)).to_coordinates())
+        puzzle.prepare()
+        _WORKER_PUZZLES[key] = puzzle
+        if len(_WORKER_PUZZLES) > _WORKER_CACHE_SIZE:
+            _WORKER_PUZZLES.popitem(last=False)
+    return _WORKER_PUZZLES[key].coordinates(word)
+
+
+@dataclass(frozen=True)
+class ServerLimits:
+    """The class represents limits of requests of a search puzzle server.
+
+    At most `max_concurrency` requests (CPU cores amount if `0`) are searched
+    at the same time and at most `queue_size` requests are waiting for their
+    turn. Every worker keeps `cache_size` prepared puzzles of recently
+    searched grids.
+
+    Example:
+    >>> ServerLimits(max_concurrency=4)
+    ServerLimits(max_concurrency=4, queue_size=64, cache_size=32)
+    """
+
+    max_concurrency: int = 0
+    queue_size: int = 64
+    cache_size: int = 32
+
+
+class _SearchRequestHandler(StreamRequestHandler):
+    """The class represents a handler of a single JSON line request."""
+
+    timeout = 30.0
+
+    def __init__(
+        self,
+        respond: Callable[[bytes], Response],
+        request: Any,
+        client_address: Any,
+        server: BaseServer,
+    ) -> None:
+        self._respond = respond
+        super().__init__(request, client_address, server)
+
+    def handle(self) -> None:
+        """Respond a JSON line to a JSON line request."""
+        response: Response = self._respond(self.rfile.readline())
+        self.wfile.write(f'{json.dumps(response)}\n'.encode())
+
+
+class _SearchTCPServer(ThreadingTCPServer):
+    """The class represents a localhost TCP server of search requests."""
+
+    allow_reuse_address: bool = True
+
+
+class SearchPuzzleServer:
+    """The class represents a long-running search puzzle server.
+
+    The server keeps a pool of worker processes, a dictionary of words and
+    prepared puzzles of recently searched grids warm, so a request pays for
+    a search only. Every worker keeps recent puzzles keyed by a digest of
+    a grid, so rows of a grid are sent to workers only if they are not
+    aware of it yet.
+
+    It accepts one JSON line request per connection over a Unix domain
+    socket (a path address) or a localhost TCP socket (a host and a port):
+    ```
+    {"rows": ["abc", "def"], "words": ["be"]}
+    {"rows": ["abc", "def"], "words_limit": 5}
+    ```
+    and responds a JSON line with found coordinates of every word:
+    ```
+    {"status": "ok", "results": {"be": ["Start at: (X0, Y1), ..."]}}
+    ```
+
+    Requests beyond `limits` of the server (see `ServerLimits`) are
+    responded with `busy` status straight away.
+
+    Words are searched with a registered search `engine` (see
+    `search_engine`).
+
+    Example:
+    >>> with SearchPuzzleServer('/tmp/puzzle.sock') as server:
+    >>>     server.serve_forever()
+    ...
+    """
+
+    __slots__: Sequence[str] = (
+        '_address',
+        '_words',
+        '_executor',
+        '_running',
+        '_pending',
+        '_server',
+    )
+
+    def __init__(
+        self,
+        address: Address,
+        words: Sequence[str] = (),
+        limits: ServerLimits = ServerLimits(),
+        engine: str = 'word',
+    ) -> None:
+        processes: int = limits.max_concurrency or os.cpu_count() or 1
+        self._address = address
+        self._words = tuple(words)
+        self._executor: Executor = create_executor(
+            'process',
+            processes,
+            _load_worker_cache,
+            (limits.cache_size, search_engine(engine).puzzle_type),
+        )
+        self._running = threading.BoundedSemaphore(processes)
+        self._pending = threading.BoundedSemaphore(
+            processes + limits.queue_size
+        )
+        self._server: Optional[BaseServer] = None
+
+    @property
+    def address(self) -> Address:
+        """Return an address the server listens to.
+
+        Returns:
+            str or tuple: a socket path or a host with a port.
+        """
+        if self._server is None:
+            return self._address
+        return cast(Address, self._server.server_address)
+
+    def start(self) -> None:
+        """Start a pool of worker processes and bind a server socket.
+
+        A stale socket left at a socket path is replaced, but any other file
+        is never removed.
+
+        Raises:
+            ValueError: if a socket path is taken by a file other than socket.
+        """
+        handler = partial(_SearchRequestHandler, self._respond)
+        if isinstance(self._address, str):
+            if os.path.exists(self._address):
+                if not stat.S_ISSOCK(os.stat(self._address).st_mode):
+                    raise ValueError(
+                        f'Cannot listen "{self._address}" path as it is '
+                        'not a socket!'
+                    )
+                os.unlink(self._address)
+            self._server = ThreadingUnixStreamServer(self._address, handler)
+        else:
+            self._server = _SearchTCPServer(self._address, handler)
+        # A pool of an executor is started lazily, an empty map starts it.
+        self._executor.imap(_search_cached_word, ())
+        _logger.info(f'Search puzzle server is listening {self.address}')
+
+    def serve_forever(self) -> None:
+        """Handle requests until the server is shut down."""
+        if self._server is None:
+            raise ValueError('The server is not started!')
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stop handling new requests.
+
+        It should be called from another thread than `serve_forever`.
+        """
+        if self._server is not None:
+            _logger.info('Search puzzle server is shutting down ...')
+            self._server.shutdown()
+
+    def close(self) -> None:
+        """Wait for requests in progress and release server resources."""
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+            if isinstance(self._address, str) and os.path.exists(self._address):
+                os.unlink(self._address)
+        self._executor.close()
+
+    def _respond(self, request: bytes) -> Response:
+        """Respond to a raw search request.
+
+        Args:
+            request: (bytes) a JSON line request.
+
+        Returns:
+            dict: a search response.
+        """
+        response: Response = {
+            'status': 'busy',
+            'error': 'Too many pending requests',
+        }
+        with self._admitted() as admitted:  # type: bool
+            try:
+                if admitted:
+                    with self._running:
+                        response = {
+                            'status': 'ok',
+                            'results': self._search(request),
+                        }
+            except (ValueError, KeyError, TypeError) as error:
+                _logger.warning(f'Cannot handle "{request!r}" request: {error}')
+                response = {'status': 'error', 'error': str(error)}
+        return response
+
+    @contextmanager
+    def _admitted(self) -> Iterator[bool]:
+        """Admit a request unless too many requests are pending.
+
+        Yields:
+            bool: True if a request is admitted otherwise False.
+        """
+        admitted: bool = self._pending.acquire(blocking=False)
+        try:
+            yield admitted
+        finally:
+            if admitted:
+                self._pending.release()
+
+    def _search(self, request: bytes) -> Dict[str, List[str]]:
+        """Search words of a request in a grid of a request.
+
+        Args:
+            request: (bytes) a JSON line request.
+
+        Returns:
+            dict: found coordinates of every word.
+
+        Raises:
+            ValueError: if a request is invalid.
+        """
+        payload: Dict[str, Any] = json.loads(request)
+        if not isinstance(payload.get('words', []), list):
+            raise ValueError('Specified words of a request should be a list')
+        if not isinstance(payload['rows'], list):
+            raise ValueError('Specified rows of a request should be a list')
+        words: List[str] = list(payload.get('words', []))
+        if payload.get('words_limit') and self._words:
+            words.extend(
+                random.choice(self._words)
+                for _ in range(int(payload['words_limit']))
+            )
+        for word in words:  # type: str
+            if not re.fullmatch(string=word, pattern=r'[a-z]+'):
+                raise ValueError(f'Specified "{word}" word value is invalid')
+        rows: Tuple[str, ...] = tuple(payload['rows'])
+        key: str = hashlib.sha1('\n'.join(rows).encode()).hexdigest()
+        unique_words: List[str] = list(dict.fromkeys(words))
+        results: Dict[str, Optional[List[str]]] = dict(
+            zip(
+                unique_words,
+                self._executor.imap(
+                    _search_cached_word,
+                    [(key, None, word) for word in unique_words],
+                ),
+            )
+        )
+        missed: List[str] = [
+            word for word, found in results.items() if found is None
+        ]
+        results.update(
+            zip(
+                missed,
+                self._executor.imap(
+                    _search_cached_word,
+                    [(key, rows, word) for word in missed],
+                ),
+            )
+        )
+        return cast(Dict[str, List[str]], results)
+
+    def __enter__(self) -> 'SearchPuzzleServer':
+        """Start the server.
+
+        Returns:
+            SearchPuzzleServer: a started server.
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the server.
+
+        Raise any exception triggered within the runtime context.
+        """
+        self.close()
+
+
+class SearchPuzzleClient:
+    """The class represents a thin client of a search puzzle server.
+
+    Example:
+    >>> client = SearchPuzzleClient('/tmp/puzzle.sock')
+    >>> client.search(rows=['foo', 'bar'], words=['foo'])
+    {'foo': ['Start at: (X0, Y0), End at: (X0, Y2)']}
+    """
+
+    __slots__: Sequence[str] = ('_address', '_timeout')
+
+    def __init__(self, address: Address, timeout: float = 60.0) -> None:
+        self._address = address
+        self._timeout = timeout
+
+    def search(
+        self,
+        rows: Sequence[str],
+        words: Sequence[str] = (),
+        words_limit: int = 0,
+    ) -> Dict[str, List[str]]:
+        """Search words in a grid of letters with a server.
+
+        Args:
+            rows: (sequence) rows of a grid.
+            words: (sequence) words to search.
+            words_limit: (int) the amount of random server words to search.
+
+        Returns:
+            dict: found coordinates of every word.
+
+        Raises:
+            ValueError: if a server rejects a request.
+        """
+        request: Dict[str, Any] = {
+            'rows': list(rows),
+            'words': list(words),
+            'words_limit': words_limit,
+        }
+        with self._connect() as connection:  # type: socket.socket
+            connection.sendall(f'{json.dumps(request)}\n'.encode())
+            with connection.makefile('rb') as stream:
+                response: Response = json.loads(stream.readline())
+        if response['status'] != 'ok':
+            raise ValueError(
+                f'Search puzzle server responded "{response["status"]}" '
+                f'status: {response.get("error")}'
+            )
+        return response['results']
+
+    def _connect(self) -> socket.socket:
+        """Connect to a server.
+
+        Returns:
+            socket: a connection to a server.
+        """
+        if isinstance(self._address, str):
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.settimeout(self._timeout)
+            connection.connect(self._address)
+            return connection
+        return socket.create_connection(self._address, timeout=self._timeout)
@@ -0,0 +1,210 @@
+"""A module contains as set API for the puzzle search results sinks."""
+import csv
+import json
+import sys
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import IO, Callable, List, Optional, Sequence, Type
+
+from loguru import logger as _logger
+
+
+class Sink(ABC):
+    """The class represents an abstract sink of search results.
+
+    Any implementation of this interface allows to flush results:
+      - using context manager (**with** statement)
+      - manually with **flush**
+    """
+
+    __slots__: Sequence[str] = ()
+
+    @abstractmethod
+    def write(self, word: str, coordinates: List[str]) -> None:
+        """Write found coordinates of an abstract word.
+
+        Args:
+            word: (str) a searched word.
+            coordinates: (list) a list of found coordinates of a word.
+        """
+        pass
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Flush abstract written results."""
+        pass
+
+    def time_out(self, word: str) -> None:
+        """Report a word whose search has not finished before a deadline.
+
+        Args:
+            word: (str) a searched word.
+        """
+        _logger.warning(f'"{word}" word search timed out')
+
+    def __enter__(self) -> 'Sink':
+        """Return runtime sink itself."""
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Flush written results.
+
+        Raise any exception triggered within the runtime context.
+        """
+        self.flush()
+
+
+class LogSink(Sink):
+    """The class represents a sink logging search results."""
+
+    __slots__: Sequence[str] = ()
+
+    def write(self, word: str, coordinates: List[str]) -> None:
+        """Log found coordinates of a word.
+
+        Args:
+            word: (str) a searched word.
+            coordinates: (list) a list of found coordinates of a word.
+        """
+        if not coordinates:
+            _logger.info(f'"{word}" word is absent in a grid')
+        else:
+            _logger.info(
+                f'Found "{word}" word coordinates in a grid: {coordinates}'
+            )
+
+    def flush(self) -> None:
+        """Nothing to flush as results are logged straight away."""
+
+
+class CallbackSink(Sink):
+    """The class represents a sink calling back for every found match.
+
+    Example:
+    >>> sink = CallbackSink(lambda word, coordinates: print(word))
+    >>> sink.write('foo', ['Start at: (X0, Y0), End at: (X0, Y2)'])
+    foo
+    """
+
+    __slots__: Sequence[str] = ('_callback',)
+
+    def __init__(self, callback: Callable[[str, str], None]) -> None:
+        self._callback = callback
+
+    def write(self, word: str, coordinates: List[str]) -> None:
+        """Call back with every found coordinates of a word.
+
+        Args:
+            word: (str) a searched word.
+            coordinates: (list) a list of found coordinates of a word.
+        """
+        for coordinate in coordinates:  # type: str
+            self._callback(word, coordinate)
+
+    def flush(self) -> None:
+        """Nothing to flush as results are called back straight away."""
+
+
+class JsonLinesSink(Sink):
+    """The class represents a sink writing a JSON line for every match.
+
+    Lines are buffered and written to a stream in bulk. A word whose search
+    has timed out gets a line of `timed-out` status instead of coordinates.
+
+    Example:
+    >>> with JsonLinesSink(sys.stdout) as sink:
+    >>>     sink.write('foo', ['Start at: (X0, Y0), End at: (X0, Y2)'])
+    {"word": "foo", "coordinates": "Start at: (X0, Y0), End at: (X0, Y2)"}
+    """
+
+    __slots__: Sequence[str] = ('_stream', '_buffer_size', '_lines')
+
+    def __init__(
+        self, stream: IO[str] = sys.stdout, buffer_size: int = 1024
+    ) -> None:
+        self._stream = stream
+        self._buffer_size = buffer_size
+        self._lines: List[str] = []
+
+    def write(self, word: str, coordinates: List[str]) -> None:
+        """Write a JSON line for every found coordinates of a word.
+
+        Args:
+            word: (str) a searched word.
+            coordinates: (list) a list of found coordinates of a word.
+        """
+        for coordinate in coordinates:  # type: str
+            self._lines.append(
+                f'{json.dumps({"word": word, "coordinates": coordinate})}\n'
+            )
+        if len(self._lines) >= self._buffer_size:
+            self.flush()
+
+    def time_out(self, word: str) -> None:
+        """Write a JSON line of `timed-out` status of a word.
+
+        Args:
+            word: (str) a searched word.
+        """
+        self._lines.append(
+            f'{json.dumps({"word": word, "status": "timed-out"})}\n'
+        )
+
+    def flush(self) -> None:
+        """Write buffered JSON lines to a stream."""
+        self._stream.writelines(self._lines)
+        self._stream.flush()
+        self._lines = []
+
+
+class CsvSink(Sink):
+    """The class represents a sink writing a CSV row for every match.
+
+    Rows are buffered and written to a stream in bulk after a header row.
+    A word whose search has timed out gets a row of `timed-out` status
+    instead of coordinates.
+
+    Example:
+    >>> with CsvSink(sys.stdout) as sink:
+    >>>     sink.write('foo', ['Start at: (X0, Y0), End at: (X0, Y2)'])
+    word,coordinates
+    foo,"Start at: (X0, Y0), End at: (X0, Y2)"
+    """
+
+    __slots__: Sequence[str] = ('_stream', '_writer', '_buffer_size', '_rows')
+
+    def __init__(self, stream: IO[str], buffer_size: int = 1024) -> None:
+        self._stream = stream
+        self._writer = csv.writer(stream)
+        self._buffer_size = buffer_size
+        self._rows: List[Sequence[str]] = [('word', 'coordinates')]
+
+    def write(self, word: str, coordinates: List[str]) -> None:
+        """Write a CSV row for every found coordinates of a word.
+
+        Args:
+            word: (str) a searched word.
+            coordinates: (list) a list of found coordinates of a word.
+        """
+        self._rows.extend((word, coordinate) for coordinate in coordinates)
+        if len(self._rows) >= self._buffer_size:
+            self.flush()
+
+    def time_out(self, word: str) -> None:
+        """Write a CSV row of `timed-out` status of a word.
+
+        Args:
+            word: (str) a searched word.
+        """
+        self._rows.append((word, 'timed-out'))
+
+    def flush(self) -> None:
+        """Write buffered CSV rows to a stream."""
+        self._writer.writerows(self._rows)
+        self._stream.flush()
+        self._rows = []
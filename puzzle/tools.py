@@ -1,14 +1,82 @@
 """A module represents an API for the `search-words-puzzle` tool."""
-from multiprocessing import Pool, cpu_count
-from typing import Iterable
+import heapq
+import json
+import multiprocessing
+import re
+import signal
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from functools import partial
+from multiprocessing.pool import IMapIterator
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 
 from loguru import logger as _logger
 
-from puzzle.puzzles import SearchPuzzle, SearchWordPuzzle
+from puzzle.executors import Executor, create_executor
+from puzzle.grids import Grid, GridContent
+from puzzle.indexes import DictionarySearchPuzzle
+from puzzle.properties import Coordinate, LetterCoordinates
+from puzzle.puzzles import (
+    SearchPuzzle,
+    SearchWordPuzzle,
+    is_word_pattern,
+)
+from puzzle.sinks import LogSink, Sink
 from puzzle.words import HiddenWord, HiddenWords
 
+BatchGrid = Tuple[str, List[str]]
+PuzzleType = Callable[[LetterCoordinates], SearchPuzzle]
+Tile = Tuple[int, int]
 
-def start_word_search_puzzle(word: HiddenWord) -> None:
+_BATCH_CHUNK_SIZE: int = 16
+_BATCH_WORDS: Sequence[str] = ()
+_BATCH_PUZZLE_TYPE: PuzzleType = SearchWordPuzzle
+_TILED_GRID: Optional[Grid] = None
+_TILED_WORDS: Sequence[str] = ()
+_TILE_SIZE: int = 0
+
+
+def _search_word(
+    word: HiddenWord, limit: int = 0, puzzle_type: PuzzleType = SearchWordPuzzle
+) -> Tuple[str, List[str]]:
+    """Search a word in a grid of letters within a worker process.
+
+    Args:
+        word: (HiddenWord) a word to search.
+        limit: (int) the amount of coordinates to stop a search at.
+        puzzle_type: (callable) a search puzzle to search a word with.
+
+    Returns:
+        tuple: a word and a list of its found coordinates.
+    """
+    puzzle: SearchPuzzle = puzzle_type(word.board)
+    if is_word_pattern(word.value) and not puzzle.SUPPORTS_PATTERNS:
+        puzzle = SearchWordPuzzle(word.board)
+    return word.value, puzzle.coordinates(word.value, limit)
+
+
+def start_word_search_puzzle(
+    word: HiddenWord,
+    sink: Optional[Sink] = None,
+    limit: int = 0,
+    puzzle_type: PuzzleType = SearchWordPuzzle,
+) -> List[str]:
     """Start word search puzzle tool.
 
     It will generate a random grid of letters and match them with
@@ -16,30 +84,755 @@ def start_word_search_puzzle(word: HiddenWord) -> None:
 
     Args:
         word: (HiddenWord) a word to search.
+        sink: (Sink) a sink to write results to, results are logged if unset.
+        limit: (int) the amount of coordinates to stop a search at,
+            all coordinates are searched if it is `0`.
+        puzzle_type: (callable) a search puzzle to search a word with
+            e.g `AutoSearchPuzzle`.
+
+    Returns:
+        list: a list of found coordinates of a given word.
+    """
+    output: Sink = sink or LogSink()
+    value, coordinates = _search_word(word, limit, puzzle_type)
+    output.write(value, coordinates)
+    output.flush()
+    return coordinates
+
+
+class _SearchTimeoutError(Exception):
+    """The class represents an interrupted search of a word."""
+
+
+def _interrupt_search(*_: Any) -> None:
+    """Interrupt a search of a word once a timer signal is received.
+
+    Raises:
+        _SearchTimeoutError: always.
+    """
+    raise _SearchTimeoutError
+
+
+@contextmanager
+def _search_deadline(seconds: float) -> Iterator[None]:
+    """Interrupt a search running longer than given seconds.
+
+    A timer signal interrupts a search within the main thread of a process
+    only (a worker process or an inline caller), a search of a worker
+    thread or of a platform without timers (Windows) is never interrupted.
+
+    Args:
+        seconds: (float) seconds to interrupt a search after (never if `0`).
+
+    Raises:
+        _SearchTimeoutError: if a search is interrupted.
+    """
+    main_thread: bool = threading.current_thread() is threading.main_thread()
+    if not seconds or not main_thread or not hasattr(signal, 'setitimer'):
+        yield
+        return
+    previous: Any = signal.signal(signal.SIGALRM, _interrupt_search)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+@dataclass(frozen=True)
+class _WordsSearch:
+    """The class represents boards of a search of words kept within a worker.
+
+    A search puzzle of a board is prepared once on the first word of
+    a worker and kept in `puzzles` by a number of a board.
+    """
+
+    boards: Sequence[LetterCoordinates]
+    puzzle_type: PuzzleType
+    puzzles: Dict[int, SearchPuzzle] = field(default_factory=dict)
+
+
+_WORDS_SEARCHES: Dict[str, _WordsSearch] = {}
+
+
+def _load_words_boards(
+    search: str,
+    boards: Sequence[LetterCoordinates],
+    puzzle_type: PuzzleType = SearchWordPuzzle,
+) -> None:
+    """Keep boards of letters to search words in within a worker.
+
+    Boards are shipped once per worker rather than with every word. They are
+    kept by a key of a search, as threads (or a caller thread) of concurrent
+    searches share a module of a worker.
+
+    Args:
+        search: (str) a unique key of a search.
+        boards: (sequence) boards of letters to search words in.
+        puzzle_type: (callable) a search puzzle to search words with.
     """
-    puzzle: SearchPuzzle = SearchWordPuzzle(word.board)
-    coordinates: Iterable[str] = puzzle.coordinates(word.value)
-    if not coordinates:
-        _logger.info(f'"{word}" word is absent in a grid')
-    else:
-        _logger.info(
-            f'Found "{word}" word coordinates in a grid: {coordinates}'
+    _WORDS_SEARCHES[search] = _WordsSearch(boards, puzzle_type)
+
+
+def _words_puzzle(search: str, board: int, value: str) -> SearchPuzzle:
+    """Return a prepared search puzzle of a board kept within a worker.
+
+    A pattern is searched with a plain search puzzle if a search puzzle
+    of a board does not support patterns.
+
+    Args:
+        search: (str) a unique key of a search (see `_load_words_boards`).
+        board: (int) a number of a board of letters.
+        value: (str) a word to search.
+
+    Returns:
+        SearchPuzzle: a search puzzle of a board.
+    """
+    words: _WordsSearch = _WORDS_SEARCHES[search]
+    if board not in words.puzzles:
+        puzzle: SearchPuzzle = words.puzzle_type(words.boards[board])
+        puzzle.prepare()
+        words.puzzles[board] = puzzle
+    if is_word_pattern(value) and not words.puzzles[board].SUPPORTS_PATTERNS:
+        return SearchWordPuzzle(words.boards[board])
+    return words.puzzles[board]
+
+
+@dataclass(frozen=True)
+class SearchBounds:
+    """The class represents bounds of a search of words.
+
+    Example:
+    >>> SearchBounds(limit=10, timeout=60, word_timeout=5).started().seconds()
+    5
+    """
+
+    limit: int = 0
+    timeout: float = 0
+    word_timeout: float = 0
+    deadline: float = 0
+
+    def started(self) -> 'SearchBounds':
+        """Return bounds of a search started now.
+
+        A deadline of a whole search is set `timeout` seconds from now.
+
+        Returns:
+            SearchBounds: bounds with a deadline (no deadline if `0`).
+        """
+        return replace(
+            self, deadline=time.time() + self.timeout if self.timeout else 0
         )
 
+    def seconds(self) -> Optional[float]:
+        """Return seconds a search of a word is left with.
+
+        Returns:
+            float: seconds of a search (no timeout if `0`), `None` if
+                a deadline of a whole search has passed.
+        """
+        seconds: Optional[float] = self.word_timeout
+        if self.deadline:
+            remaining: float = self.deadline - time.time()
+            seconds = (
+                min(self.word_timeout or remaining, remaining)
+                if remaining > 0
+                else None
+            )
+        return seconds
+
+
+def _search_task(
+    task: Tuple[int, int, str], search: str, bounds: SearchBounds
+) -> Tuple[int, Optional[List[str]]]:
+    """Search a word of a numbered task within a worker.
+
+    A search is interrupted once it runs longer than `word_timeout` seconds
+    or a deadline of a whole search passes, a task started after the
+    deadline is not searched at all. A puzzle of a board is prepared before
+    a timer is set, so a preparation shared by next words is not timed.
+
+    Args:
+        task: (tuple) a number of a task, a number of a board kept within
+            a worker (see `_load_words_boards`) and a word to search.
+        search: (str) a unique key of a search of boards of a worker.
+        bounds: (SearchBounds) bounds of a started search.
+
+    Returns:
+        tuple: a number of a task and a list of found coordinates (`None`
+            if a search timed out).
+    """
+    number, board, value = task
+    coordinates: Optional[List[str]] = None
+    seconds: Optional[float] = bounds.seconds()
+    if seconds is not None:
+        puzzle: SearchPuzzle = _words_puzzle(search, board, value)
+        try:
+            with _search_deadline(seconds):
+                coordinates = puzzle.coordinates(value, bounds.limit)
+        except _SearchTimeoutError:
+            _logger.warning(
+                f'Search of "{value}" word is interrupted after '
+                f'{seconds:.3f} seconds'
+            )
+    return number, coordinates
+
+
+def _reversed_coordinates(
+    word: HiddenWord, coordinates: List[str]
+) -> List[str]:
+    """Return coordinates of a reversed word from coordinates of a word.
+
+    Start and end cells are swapped, coordinates are ordered the way a
+    reversed word is searched: by cells of its first letter, then by
+    directions.
+
+    Example:
+    >>> word = HiddenWord(board, 'ab')
+    >>> _reversed_coordinates(word, ['Start at: (X0, Y0), End at: (X0, Y1)'])
+    ['Start at: (X0, Y1), End at: (X0, Y0)']
+
+    Args:
+        word: (HiddenWord) a searched word.
+        coordinates: (list) found coordinates of a word.
+
+    Returns:
+        list: coordinates of a reversed word.
+    """
+    first_cells: Dict[Tuple[int, int], int] = {
+        coordinate.as_tuple(): index
+        for index, coordinate in enumerate(word.board.get(word.value[-1], ()))
+    }
+    reversed_coordinates: List[Tuple[Tuple[int, int], str]] = []
+    for coordinate in coordinates:  # type: str
+        (row, column), (last_row, last_column) = (
+            (int(row_value), int(column_value))
+            for row_value, column_value in re.findall(
+                r'\(X(-?\d+), Y(-?\d+)\)', coordinate
+            )
+        )
+        direction = Coordinate(
+            (row > last_row) - (row < last_row),
+            (column > last_column) - (column < last_column),
+        )
+        reversed_coordinates.append(
+            (
+                (
+                    first_cells[last_row, last_column],
+                    SearchWordPuzzle.MOVEMENT_COORDINATES.index(direction),
+                ),
+                re.sub(
+                    r'Start at: (.+), End at: (.+)',
+                    r'Start at: \2, End at: \1',
+                    coordinate,
+                ),
+            )
+        )
+    return [found for _, found in sorted(reversed_coordinates)]
+
+
+def _fanned_out(
+    word: HiddenWord, coordinates: Optional[List[str]], requested: List[str]
+) -> Iterator[Tuple[str, Optional[List[str]]]]:
+    """Return coordinates of every requested copy of a searched word.
+
+    Args:
+        word: (HiddenWord) a searched word.
+        coordinates: (list) found coordinates of a word (`None` if a search
+            timed out).
+        requested: (list) requested copies of a word or of its reverse.
+
+    Returns:
+        iterator: requested words and their found coordinates.
+    """
+    for value in requested:  # type: str
+        if value == word.value or coordinates is None:
+            yield value, coordinates
+        else:
+            yield value, _reversed_coordinates(word, coordinates)
+
+
+def _unique_tasks(
+    words: HiddenWords, limit: int = 0
+) -> Tuple[List[HiddenWord], List[List[str]]]:
+    """Return unique words to search and requested copies of every word.
+
+    Repeated words (and words equal to a reverse of another word unless
+    a search is limited) are searched once.
+
+    Args:
+        words: (generator) a generator of words to search.
+        limit: (int) the amount of coordinates to stop a search at.
+
+    Returns:
+        tuple: words to search and requested copies of every word.
+    """
+    tasks: List[HiddenWord] = []
+    requested: List[List[str]] = []
+    numbers: Dict[Tuple[int, str], int] = {}
+    for word in words:  # type: HiddenWord
+        key: Tuple[int, str] = (id(word.board), word.value)
+        reverse_key: Tuple[int, str] = (id(word.board), word.value[::-1])
+        if key not in numbers and not limit and reverse_key in numbers:
+            if not is_word_pattern(word.value):
+                key = reverse_key
+        if key not in numbers:
+            numbers[key] = len(tasks)
+            tasks.append(word)
+            requested.append([])
+        requested[numbers[key]].append(word.value)
+    return tasks, requested
+
+
+def _board_tasks(
+    words: List[HiddenWord],
+) -> Tuple[List[LetterCoordinates], List[Tuple[int, int, str]]]:
+    """Return distinct boards of words and numbered tasks of words.
+
+    A task refers a board by its number, so a board is not shipped to
+    a worker along with every word (see `_load_words_boards`).
 
-def start_words_search_puzzle(words: HiddenWords) -> None:
+    Args:
+        words: (list) words to search.
+
+    Returns:
+        tuple: boards of letters and a number of a task, a number of
+            a board and a word of every task.
+    """
+    boards: List[LetterCoordinates] = []
+    numbers: Dict[int, int] = {}
+    tasks: List[Tuple[int, int, str]] = []
+    for number, word in enumerate(words):  # type: int, HiddenWord
+        if id(word.board) not in numbers:
+            numbers[id(word.board)] = len(boards)
+            boards.append(word.board)
+        tasks.append((number, numbers[id(word.board)], word.value))
+    return boards, tasks
+
+
+def _before_deadline(results: Iterator[Any], deadline: float) -> Iterator[Any]:
+    """Return results of an executor until a deadline passes.
+
+    Results of a pool are waited for until a deadline at most, so a stuck
+    worker never stalls a caller. Results of an inline executor are bounded
+    by a deadline of every task (see `_search_task`).
+
+    Args:
+        results: (iterator) results of an executor.
+        deadline: (float) a wall-clock time to stop at (`time.time` seconds),
+            no deadline if `0`.
+
+    Returns:
+        iterator: results ready before a deadline.
+    """
+    while True:
+        timeout: Optional[float] = None
+        if deadline:
+            timeout = deadline - time.time()
+            if timeout <= 0:
+                return
+        try:
+            if isinstance(results, IMapIterator):
+                result: Any = results.next(timeout)
+            else:
+                result = next(results)
+        except (StopIteration, multiprocessing.TimeoutError):
+            return
+        yield result
+
+
+def _write_results(
+    results: Iterator[Tuple[int, Tuple[str, Optional[List[str]]]]],
+    requested: List[List[str]],
+    output: Sink,
+    limit: int = 0,
+) -> List[str]:
+    """Write results of numbered tasks to a sink until a limit is found.
+
+    A word whose search timed out (`None` coordinates) is reported as timed
+    out, so is every word of a task left without results once results stop
+    before a deadline.
+
+    Args:
+        results: (iterator) numbers of tasks and found coordinates of words.
+        requested: (list) requested copies of a word of every task.
+        output: (Sink) a sink to write results to.
+        limit: (int) the amount of coordinates to stop at (all if `0`).
+
+    Returns:
+        list: requested words whose search timed out.
+    """
+    found: int = 0
+    timed_out: List[str] = []
+    pending: Set[int] = set(range(len(requested)))
+    for number, (value, coordinates) in results:
+        pending.discard(number)
+        if coordinates is None:
+            output.time_out(value)
+            timed_out.append(value)
+            continue
+        if limit:
+            coordinates = coordinates[: limit - found]
+        output.write(value, coordinates)
+        found += len(coordinates)
+        if limit and found >= limit:
+            _logger.info(
+                f'Found {found} coordinates, cancelling the rest of words'
+            )
+            return timed_out
+    if pending:
+        _logger.warning(
+            f'Search timed out, cancelling {len(pending)} unsearched words'
+        )
+    for number in sorted(pending):  # type: int
+        for value in requested[number]:  # type: str
+            output.time_out(value)
+            timed_out.append(value)
+    return timed_out
+
+
+def start_words_search_puzzle(
+    words: HiddenWords,
+    sink: Optional[Sink] = None,
+    executor: Optional[Executor] = None,
+    puzzle_type: PuzzleType = SearchWordPuzzle,
+    bounds: SearchBounds = SearchBounds(),
+) -> List[str]:
     """Start words search puzzle tool.
 
-    The search is conducted with parallel processes based on CPU cores amount.
+    The search is conducted with an executor of parallel processes (or
+    threads for a free-threaded interpreter) based on CPU cores amount.
+    Results of a word are written to a sink as soon as a word is searched,
+    so results are not kept in memory until all words are searched.
+
+    Repeated words (and words equal to a reverse of another word unless
+    a search is limited) are searched once, their results are fanned out
+    to every requested copy.
+
+    A board of letters is shipped once to every worker (see
+    `Executor.initialized`) and its search puzzle is prepared once there,
+    so tasks carry words and a key of a search only. Boards are kept by
+    the key, so concurrent searches sharing workers do not mix them up.
+
+    Once `limit` coordinates of all words are found (see `SearchBounds`),
+    the rest of words are not searched anymore as pending tasks of processes
+    are cancelled.
+
+    A search of a word is interrupted once it runs longer than
+    `word_timeout` seconds, and the whole search stops once it runs longer
+    than `timeout` seconds: results found so far are kept, and every word
+    left unsearched is reported to a sink as timed out (see `Sink.time_out`).
+    Pending tasks are cancelled and stuck workers are terminated as an
+    executor is closed. A worker thread can't be interrupted, so a thread
+    executor bounds a whole search only (its stuck threads are abandoned).
 
     It will generate a random grid of letters and match them with
     the corresponding words.
 
     Args:
         words: (generator) a generator of words to search.
+        sink: (Sink) a sink to write results to, results are logged if unset.
+        executor: (Executor) an executor to search words with, it is
+            created by `create_executor` if unset.
+        puzzle_type: (callable) a search puzzle to search words with
+            e.g `AutoSearchPuzzle`, it should be pickled for processes.
+        bounds: (SearchBounds) the amount of coordinates to stop a search
+            at and timeouts of a whole search and of a single word (all
+            coordinates are searched without timeouts by default).
+
+    Returns:
+        list: requested words whose search timed out.
+    """
+    output: Sink = sink or LogSink()
+    tasks, requested = _unique_tasks(words, bounds.limit)
+    _logger.info(
+        f'Searching for {len(tasks)} unique words out of '
+        f'{sum(map(len, requested))} requested words ...'
+    )
+    bounds = bounds.started()
+    boards, board_tasks = _board_tasks(tasks)
+    search: str = uuid.uuid4().hex
+    try:
+        with executor or create_executor() as base, base.initialized(
+            _load_words_boards, (search, boards, puzzle_type)
+        ) as pool:  # type: Executor, Executor
+            results: Iterator[Tuple[int, Tuple[str, Optional[List[str]]]]] = (
+                (number, fanned)
+                for number, coordinates in _before_deadline(
+                    pool.imap_unordered(
+                        partial(_search_task, search=search, bounds=bounds),
+                        board_tasks,
+                    ),
+                    bounds.deadline,
+                )
+                for fanned in _fanned_out(
+                    tasks[number], coordinates, requested[number]
+                )
+            )
+            timed_out: List[str] = _write_results(
+                results, requested, output, bounds.limit
+            )
+    finally:
+        _WORDS_SEARCHES.pop(search, None)
+    output.flush()
+    return timed_out
+
+
+def start_all_words_search_puzzle(
+    board: LetterCoordinates,
+    words: Iterable[str],
+    sink: Optional[Sink] = None,
+    min_length: int = 1,
+    top: int = 0,
+) -> List[str]:
+    """Start all words search puzzle tool.
+
+    A grid is walked once for a whole dictionary of words (see
+    `DictionarySearchPuzzle`) instead of a search per word. Every found
+    word is written to a sink as soon as it is found, unless only the
+    longest `top` words are kept, then they are written once a grid is
+    walked.
+
+    Example:
+    >>> start_all_words_search_puzzle(board, ['foo', 'bar', 'o'], top=1)
+    ['foo']
+
+    Args:
+        board: (dict) a board of letters.
+        words: (iterable) a dictionary of words to search.
+        sink: (Sink) a sink to write results to, results are logged if unset.
+        min_length: (int) the least length of a word to search.
+        top: (int) the amount of the longest words to keep (all if `0`).
+
+    Returns:
+        list: found words, the longest first if `top` words are kept.
+    """
+    output: Sink = sink or LogSink()
+    puzzle = DictionarySearchPuzzle(
+        board, (word for word in words if len(word) >= min_length)
+    )
+    found: Dict[str, List[str]] = {}
+    for value, coordinates in puzzle.matches(min_length):  # type: str, str
+        if not top:
+            output.write(value, [coordinates])
+        found.setdefault(value, []).append(coordinates)
+    if top:
+        ranked: List[str] = heapq.nlargest(top, found, key=len)
+        for value in ranked:  # type: str
+            output.write(value, found[value])
+        found = {value: found[value] for value in ranked}
+    _logger.info(f'Found {len(found)} dictionary words in a grid')
+    output.flush()
+    return list(found)
+
+
+def _load_batch_words(
+    words: Sequence[str], puzzle_type: PuzzleType = SearchWordPuzzle
+) -> None:
+    """Keep a set of words to search within a worker process.
+
+    Words are shipped once per worker rather than with every grid.
+
+    Args:
+        words: (sequence) a set of words to search.
+        puzzle_type: (callable) a search puzzle to search a grid with.
+    """
+    # pylint:disable=global-statement
+    global _BATCH_WORDS, _BATCH_PUZZLE_TYPE
+    _BATCH_WORDS = words
+    _BATCH_PUZZLE_TYPE = puzzle_type
+
+
+def _search_batch_grid(grid: BatchGrid) -> List[str]:
+    """Search a set of batch words in a single grid of letters.
+
+    Args:
+        grid: (tuple) an identifier and rows of a grid.
+
+    Returns:
+        list: a JSON line for every word found in a grid.
+    """
+    grid_id, rows = grid
+    puzzle: SearchPuzzle = _BATCH_PUZZLE_TYPE(
+        GridContent(rows).to_coordinates()
+    )
+    results: List[str] = []
+    for word, coordinates in puzzle.search_many(
+        _BATCH_WORDS
+    ):  # type: str, List[str]
+        if coordinates:
+            results.append(
+                json.dumps(
+                    {'grid': grid_id, 'word': word, 'coordinates': coordinates}
+                )
+            )
+    return results
+
+
+def start_batch_search_puzzle(
+    grids: Iterable[BatchGrid],
+    words: Sequence[str],
+    output: IO[str],
+    executor_kind: str = 'auto',
+    puzzle_type: PuzzleType = SearchWordPuzzle,
+) -> None:
+    """Start batch search puzzle tool.
+
+    Every grid is searched for a whole set of words within a single
+    executor of parallel processes (or threads for a free-threaded
+    interpreter) based on CPU cores amount. Results are streamed as
+    JSON lines in the order of grids as soon as a grid is searched.
+
+    A search puzzle of a grid is prepared once and searches a whole set
+    of words as a batch (see `SearchPuzzle.search_many`).
+
+    Example:
+    >>> start_batch_search_puzzle([('1', ['foo'])], ['foo'], sys.stdout)
+    {"grid": "1", "word": "foo", "coordinates": ["Start at: ..."]}
+
+    Args:
+        grids: (iterable) identifiers and rows of grids to search.
+        words: (sequence) a set of words to search in every grid.
+        output: (IO) a stream to write JSON lines of found words to.
+        executor_kind: (str) a kind of an executor (see `create_executor`).
+        puzzle_type: (callable) a search puzzle to search every grid with.
     """
-    pool = Pool(processes=cpu_count())
-    parallel_search = pool.map_async(
-        func=start_word_search_puzzle, iterable=words
+    _logger.info(f'Searching for {len(words)} words in a batch of grids ...')
+    with create_executor(
+        executor_kind,
+        initializer=_load_batch_words,
+        initargs=(tuple(words), puzzle_type),
+    ) as pool:  # type: Executor
+        for results in pool.imap(
+            _search_batch_grid, grids, chunksize=_BATCH_CHUNK_SIZE
+        ):  # type: List[str]
+            for result in results:  # type: str
+                output.write(f'{result}\n')
+            output.flush()
+
+
+def _load_tiled_grid(grid: Grid, words: Sequence[str], tile_size: int) -> None:
+    """Keep a grid and a set of words to search within a worker.
+
+    Args:
+        grid: (Grid) a grid to search tiles of.
+        words: (sequence) a set of words to search.
+        tile_size: (int) the amount of rows and columns of a tile.
+    """
+    # pylint:disable=global-statement
+    global _TILED_GRID, _TILED_WORDS, _TILE_SIZE
+    _TILED_GRID, _TILED_WORDS, _TILE_SIZE = grid, words, tile_size
+
+
+def _search_tile(tile: Tile) -> List[Tuple[str, List[str]]]:
+    """Search a set of words in a single tile of a grid of letters.
+
+    A tile is searched along with a halo of (max word length - 1) cells
+    below and to the right of it, so only a tile with its halo is kept in
+    memory. A word is reported by a tile its top-left cell belongs to,
+    so a word crossing tiles is never reported twice.
+
+    Args:
+        tile: (tuple) the first row and the first column of a tile.
+
+    Returns:
+        list: words and their found coordinates within a tile.
+    """
+    top, left = tile
+    halo: int = max(map(len, _TILED_WORDS)) - 1
+    rows = cast(Grid, _TILED_GRID).region(
+        top, left, _TILE_SIZE + halo, _TILE_SIZE + halo
+    )
+    board: LetterCoordinates = {}
+    for row_index, row_value in enumerate(rows):  # type: int, str
+        for column_index, letter in enumerate(row_value):  # type: int, str
+            board.setdefault(letter, []).append(
+                Coordinate(top + row_index, left + column_index)
+            )
+    puzzle: SearchPuzzle = SearchWordPuzzle(board)
+    results: List[Tuple[str, List[str]]] = []
+    for word in _TILED_WORDS:  # type: str
+        coordinates: List[str] = [
+            coordinate
+            for coordinate in puzzle.coordinates(word)
+            if _is_tile_word(coordinate, top, left)
+        ]
+        if coordinates:
+            results.append((word, coordinates))
+    return results
+
+
+def _is_tile_word(coordinates: str, top: int, left: int) -> bool:
+    """Return whether the top-left cell of a found word belongs to a tile.
+
+    Args:
+        coordinates: (str) coordinates of a found word.
+        top: (int) the first row of a tile.
+        left: (int) the first column of a tile.
+
+    Returns:
+        bool: True if a word belongs to a tile otherwise False.
+    """
+    rows, columns = zip(*re.findall(r'\(X(\d+), Y(\d+)\)', coordinates))
+    row, column = min(map(int, rows)), min(map(int, columns))
+    return top <= row < top + _TILE_SIZE and left <= column < left + _TILE_SIZE
+
+
+def start_tiled_search_puzzle(
+    grid: Grid,
+    words: Sequence[str],
+    sink: Optional[Sink] = None,
+    tile_size: int = 1024,
+    executor_kind: str = 'auto',
+) -> None:
+    """Start tiled search puzzle tool.
+
+    A huge grid is split into square tiles searched by an executor one by
+    one, so a grid is never materialised as a whole: only a tile with its
+    halo is kept in memory of a worker. A grid of a region support is
+    expected e.g a memory-mapped `MappedGrid` or a seeded `RandomWordsGrid`.
+
+    Results of a tile are written to a sink in the order of tiles.
+
+    Example:
+    >>> with MappedGrid(Path('grid.txt')) as grid:
+    >>>     start_tiled_search_puzzle(grid, ['foo'], tile_size=4096)
+    ...
+
+    Args:
+        grid: (Grid) a grid to search.
+        words: (sequence) a set of words to search.
+        sink: (Sink) a sink to write results to, results are logged if unset.
+        tile_size: (int) the amount of rows and columns of a tile.
+        executor_kind: (str) a kind of an executor (see `create_executor`).
+
+    Raises:
+        ValueError: if a tile size or words are invalid.
+    """
+    if tile_size <= 0 or not words or not all(words):
+        raise ValueError(
+            f'Cannot search {tuple(words)} words in tiles of "{tile_size}" '
+            'size. It should contain words and a positive tile size!'
+        )
+    _logger.info(
+        f'Searching for {len(words)} words in {tile_size}x{tile_size} tiles '
+        f'of {grid.height}x{grid.width} grid ...'
+    )
+    output: Sink = sink or LogSink()
+    tiles: Iterable[Tile] = (
+        (top, left)
+        for top in range(0, grid.height, tile_size)
+        for left in range(0, grid.width, tile_size)
     )
-    parallel_search.get()
+    with create_executor(
+        executor_kind,
+        initializer=_load_tiled_grid,
+        initargs=(grid, tuple(words), tile_size),
+    ) as pool:  # type: Executor
+        for results in pool.imap(
+            _search_tile, tiles
+        ):  # type: List[Tuple[str, List[str]]]
+            for word, coordinates in results:  # type: str, List[str]
+                output.write(word, coordinates)
+    output.flush()
@@ -0,0 +1,267 @@
+"""A module contains as set API for the puzzle search engines tuning."""
+import json
+import os
+import pickle
+import string
+import time
+from collections import Counter
+from dataclasses import asdict, fields
+from importlib import import_module
+from importlib.machinery import EXTENSION_SUFFIXES
+from itertools import product
+from pathlib import Path
+from typing import Callable, List, Sequence, Tuple
+
+from loguru import logger as _logger
+
+from puzzle.bitmasks import BitMaskSearchPuzzle
+from puzzle.costs import SearchCostModel
+from puzzle.executors import ProcessExecutor, is_free_threaded
+from puzzle.grids import RandomWordsGrid
+from puzzle.indexes import DictionarySearchPuzzle
+from puzzle.properties import GridSize, LetterCoordinates
+from puzzle.puzzles import SearchPuzzle, SearchWordPuzzle
+
+CALIBRATION_PATH: Path = (
+    Path.home() / '.config' / 'search-words-puzzle' / 'calibration.json'
+)
+_COMPILABLE_MODULES: Sequence[str] = (
+    'puzzle.grids',
+    'puzzle.placements',
+    'puzzle.puzzles',
+    'puzzle.bitmasks',
+    'puzzle.costs',
+    'puzzle.indexes',
+)
+
+
+def compiled_modules() -> List[str]:
+    """Return modules of search engines and grids compiled with mypyc.
+
+    Modules are compiled by an optional build (see `setup.py`), pure Python
+    modules are imported otherwise.
+
+    Example:
+    >>> compiled_modules()
+    ['puzzle.grids', 'puzzle.placements', 'puzzle.puzzles', ...]
+
+    Returns:
+        list: names of compiled modules.
+    """
+    return [
+        name
+        for name in _COMPILABLE_MODULES
+        if str(import_module(name).__file__).endswith(tuple(EXTENSION_SUFFIXES))
+    ]
+
+
+def _best_seconds(function: Callable[[], object], repeat: int) -> float:
+    """Return the best seconds of a function out of a few runs.
+
+    Args:
+        function: (callable) a function to measure.
+        repeat: (int) the amount of runs.
+
+    Returns:
+        float: the best seconds of a run.
+    """
+    best: float = float('inf')
+    for _ in range(repeat):  # type: int
+        start: float = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _search_seconds(
+    engine: Callable[[LetterCoordinates], SearchPuzzle],
+    board: LetterCoordinates,
+    word: str,
+    repeat: int,
+) -> Tuple[float, float]:
+    """Return seconds of a search of a word by a new and an indexed engine.
+
+    Args:
+        engine: (callable) a search engine type.
+        board: (dict) a board of letters.
+        word: (str) a word to search.
+        repeat: (int) the amount of runs.
+
+    Returns:
+        tuple: seconds of a new engine and of an indexed one.
+    """
+    puzzle: SearchPuzzle = engine(board)
+    puzzle.coordinates(word)
+    return (
+        _best_seconds(lambda: engine(board).coordinates(word), repeat),
+        _best_seconds(lambda: puzzle.coordinates(word), repeat),
+    )
+
+
+def calibrate(
+    grid_size: GridSize = GridSize(300, 300), repeat: int = 3
+) -> SearchCostModel:
+    """Measure costs of search engines on a machine.
+
+    Engines search a random grid of letters, the best time of a few runs
+    is divided by units of work of a search e.g cells of an anchor letter.
+    A trie walk is measured with a dictionary of all two letter words.
+
+    Example:
+    >>> calibrate().walk_cost
+    3.9e-06
+
+    Args:
+        grid_size: (GridSize) the size of a grid to search.
+        repeat: (int) the amount of runs of every measure.
+
+    Returns:
+        SearchCostModel: measured costs of search engines.
+    """
+    _logger.info(
+        f'Calibrating search engines on {grid_size} '
+        f'(compiled modules: {compiled_modules() or "none"}) ...'
+    )
+    with RandomWordsGrid(grid_size) as grid:  # type: RandomWordsGrid
+        board: LetterCoordinates = grid.content.to_coordinates()
+    cells: int = grid_size.height * grid_size.width
+    word: str = string.ascii_lowercase[:3]
+    anchors: int = min(len(board[letter]) for letter in word)
+    walk_seconds, indexed_walk_seconds = _search_seconds(
+        SearchWordPuzzle, board, word, repeat
+    )
+    mask_seconds, indexed_mask_seconds = _search_seconds(
+        BitMaskSearchPuzzle, board, word, repeat
+    )
+    dictionary = DictionarySearchPuzzle(
+        board, map(''.join, product(string.ascii_lowercase, repeat=2))
+    )
+    dictionary.prepare()
+    trie_seconds: float = _best_seconds(
+        lambda: list(dictionary.matches()), repeat
+    )
+    dispatch_seconds: float = _best_seconds(
+        lambda: pickle.loads(pickle.dumps(board)), repeat
+    )
+    walks: int = cells * len(SearchWordPuzzle.MOVEMENT_COORDINATES)
+    with ProcessExecutor(workers=1) as executor:  # type: ProcessExecutor
+        worker_seconds: float = _best_seconds(
+            lambda: list(executor.imap(abs, (0,))), 1
+        )
+    return SearchCostModel(
+        cell_index_cost=max(walk_seconds - indexed_walk_seconds, 0) / cells,
+        walk_cost=indexed_walk_seconds / anchors,
+        mask_index_cost=max(mask_seconds - indexed_mask_seconds, 0) / cells,
+        mask_cost=indexed_mask_seconds / (cells * len(word)),
+        dispatch_cost=dispatch_seconds / cells,
+        worker_cost=worker_seconds,
+        trie_cost=trie_seconds / walks,
+    )
+
+
+def save_cost_model(
+    cost_model: SearchCostModel, path: Path = CALIBRATION_PATH
+) -> None:
+    """Store costs of search engines of a machine to a JSON file.
+
+    Args:
+        cost_model: (SearchCostModel) costs of search engines.
+        path: (Path) a path to a JSON file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(asdict(cost_model), indent=2))
+    _logger.info(f'Costs of search engines are stored to "{path}"')
+
+
+def load_cost_model(path: Path = CALIBRATION_PATH) -> SearchCostModel:
+    """Load costs of search engines of a machine from a JSON file.
+
+    Default costs are used if a machine is not calibrated yet or a file is
+    invalid.
+
+    Args:
+        path: (Path) a path to a JSON file.
+
+    Returns:
+        SearchCostModel: costs of search engines.
+    """
+    if not path.is_file():
+        return SearchCostModel()
+    try:
+        costs = json.loads(path.read_text())
+        return SearchCostModel(
+            **{
+                field.name: float(costs[field.name])
+                for field in fields(SearchCostModel)
+                if field.name in costs
+            }
+        )
+    except (ValueError, TypeError) as error:
+        _logger.warning(f'Cannot load costs from "{path}" file: {error}')
+        return SearchCostModel()
+
+
+def plan_executor(
+    cells: int,
+    words: Sequence[str],
+    cost_model: SearchCostModel,
+    executor_kind: str = 'auto',
+) -> Tuple[str, int]:
+    """Pick a kind of an executor and the amount of its workers.
+
+    Words are searched in parallel if it pays off for starting workers and
+    shipping a board of letters to every worker process once, a board is
+    indexed within every worker in parallel. A search of words is estimated
+    by the cheapest engine of every length of words, so a few long words
+    are not averaged out by many short ones.
+
+    Example:
+    >>> plan_executor(2500, ['foo', 'bar'], SearchCostModel())
+    ('inline', 1)
+
+    Args:
+        cells: (int) the amount of cells of a grid.
+        words: (sequence) words to search.
+        cost_model: (SearchCostModel) costs of search engines.
+        executor_kind: (str) a kind of an executor, it is picked if `auto`.
+
+    Returns:
+        tuple: a kind of an executor and the amount of its workers.
+    """
+    workers: int = min(os.cpu_count() or 1, max(len(words), 1))
+    kind: str = executor_kind
+    if kind == 'auto':
+        kind = 'thread' if is_free_threaded() else 'process'
+        search: float = _search_words_seconds(cells, words, cost_model)
+        dispatch: float = 0.0
+        if kind == 'process':
+            dispatch = cost_model.dispatch_cost * cells
+        startup: float = workers * (cost_model.worker_cost + dispatch)
+        if workers == 1 or startup + search / workers >= search:
+            kind = 'inline'
+    return kind, 1 if kind == 'inline' else workers
+
+
+def _search_words_seconds(
+    cells: int, words: Sequence[str], cost_model: SearchCostModel
+) -> float:
+    """Estimate seconds of a search of words on an indexed board.
+
+    Every length of words is searched by the cheapest engine of it.
+
+    Args:
+        cells: (int) the amount of cells of a grid.
+        words: (sequence) words to search.
+        cost_model: (SearchCostModel) costs of search engines.
+
+    Returns:
+        float: seconds of a search of all words.
+    """
+    walk: float = cost_model.walk_seconds(
+        cells, cells // len(string.ascii_lowercase), indexed=True
+    )
+    seconds: float = 0.0
+    for length, amount in Counter(map(len, words)).items():  # type: int, int
+        bitmask: float = cost_model.bitmask_seconds(cells, length, indexed=True)
+        seconds += amount * min(walk, bitmask)
+    return seconds
@@ -2,7 +2,7 @@
 from dataclasses import dataclass
 from typing import Iterator
 
-from puzzle import LetterCoordinates
+from puzzle.properties import LetterCoordinates
 
 
 @dataclass
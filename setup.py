@@ -1,10 +1,20 @@
 """Package setup entrypoint."""
+import os
 import re
 import sys
 from pathlib import Path
-from typing import IO, Sequence
+from typing import IO, Any, Sequence
 from setuptools import find_packages, setup
 
+_compiled_modules: Sequence[str] = (
+    'puzzle/grids.py',
+    'puzzle/placements.py',
+    'puzzle/puzzles.py',
+    'puzzle/bitmasks.py',
+    'puzzle/costs.py',
+    'puzzle/indexes.py',
+)
+
 
 class _Package:
     """Represents a single package."""
@@ -91,6 +101,23 @@ def _load_requirements() -> Sequence[str]:
         return tuple(map(str.strip, requirements.readlines()))
 
 
+def _load_ext_modules() -> Sequence[Any]:
+    """Return search engine and grid modules compiled with mypyc.
+
+    Modules are compiled only if `SEARCH_WORDS_PUZZLE_COMPILE=1` variable
+    is set and mypyc is installed (`compiled` extra), otherwise pure Python
+    modules are installed.
+    """
+    if os.environ.get('SEARCH_WORDS_PUZZLE_COMPILE') != '1':
+        return ()
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        sys.stderr.write('mypyc is not installed, modules are not compiled\n')
+        return ()
+    return mypycify(list(_compiled_modules), opt_level='3')
+
+
 def _setup_package(package: _Package) -> None:
     """Setup a package entrypoint.
 
@@ -111,6 +138,8 @@ def _setup_package(package: _Package) -> None:
         ),
         include_package_data=True,
         install_requires=_load_requirements(),
+        extras_require={'compiled': ('mypy>=1.14', 'mypy-extensions>=1.0.0')},
+        ext_modules=list(_load_ext_modules()),
         classifiers=(
             'Programming Language :: Python :: 3.6',
             'Programming Language :: Python :: 3.7',
@@ -0,0 +1,111 @@
+"""A test suite contains a set of test cases for the puzzle memory budgets."""
+import pytest
+
+from puzzle.budgets import (
+    MemoryEstimate,
+    SearchMode,
+    estimate_search_memory,
+    format_memory_size,
+    parse_memory_size,
+    peak_memory,
+    plan_search_memory,
+)
+from puzzle.properties import GridSize
+
+pytestmark = pytest.mark.unittest
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    (('1024', 1024), ('2k', 2048), ('512M', 512 * 1024**2), ('4GB', 4 << 30)),
+)
+def test_parse_memory_size(value: str, expected: int) -> None:
+    """Test a memory size is parsed to the amount of bytes."""
+    actual = parse_memory_size(value)
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+@pytest.mark.parametrize('value', ('', '0', '1.5G', '-1M', '4X'))
+def test_invalid_memory_size(value: str) -> None:
+    """Test an invalid memory size fails to be parsed.
+
+    ValueError should be raised in case of invalid memory size.
+    """
+    with pytest.raises(ValueError):
+        parse_memory_size(value)
+
+
+@pytest.mark.parametrize(
+    'amount, expected',
+    ((100, '100 B'), (1536, '1.5 KiB'), (3 * 1024**3, '3.0 GiB')),
+)
+def test_format_memory_size(amount: int, expected: str) -> None:
+    """Test a memory size is formatted with a binary unit."""
+    actual = format_memory_size(amount)
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_estimate_search_memory() -> None:
+    """Test a tiled search of a packed grid needs less memory than a search
+    of a board of a whole grid, and threads share a board of letters."""
+    size = GridSize(1000, 1000)
+    board = estimate_search_memory(size, workers=4)
+    shared = estimate_search_memory(size, workers=4, shared=True)
+    tiled = estimate_search_memory(
+        size, SearchMode('packed', 'tiled', 64), 4, False, 9
+    )
+    assert (
+        tiled.total < shared.total < board.total
+    ), f'Expected: {tiled} < {shared} < {board}'
+    assert (tiled.grid_bytes, shared.workers_bytes) == (625000, 0)
+
+
+@pytest.mark.parametrize(
+    'budget, procedural, storage, engine',
+    (
+        ('', False, 'rows', 'board'),
+        ('4G', False, 'rows', 'board'),
+        ('16M', False, 'rows', 'tiled'),
+        ('8M', False, 'packed', 'tiled'),
+        ('4M', True, 'procedural', 'tiled'),
+    ),
+)
+def test_plan_search_memory(
+    budget: str, procedural: bool, storage: str, engine: str
+) -> None:
+    """Test a plan picks the fastest storage and engine fitting a budget."""
+    plan: MemoryEstimate = plan_search_memory(
+        GridSize(3000, 3000),
+        parse_memory_size(budget) if budget else 0,
+        executor_kind='inline',
+        procedural=procedural,
+        halo=9,
+    )
+    actual = (plan.storage, plan.engine)
+    assert (
+        storage,
+        engine,
+    ) == actual, (
+        f'Expected: {storage} storage of {engine} engine != Actual: {plan}'
+    )
+
+
+def test_plan_search_memory_fails_fast() -> None:
+    """Test a plan fails when neither storage nor engine fit a budget.
+
+    ValueError should be raised with the smallest estimate.
+    """
+    with pytest.raises(ValueError, match='needs at least'):
+        plan_search_memory(
+            GridSize(10**5, 10**5),
+            parse_memory_size('1G'),
+            executor_kind='inline',
+            tiled=False,
+        )
+
+
+def test_peak_memory() -> None:
+    """Test peak resident memory of the process and workers is reported."""
+    process, worker = peak_memory()
+    assert process > 0, 'Peak memory of the process is not reported'
+    assert worker >= 0, f'Expected: non-negative != Actual: {worker}'
@@ -0,0 +1,27 @@
+"""A test suite contains a set of test cases for the puzzle optional
+dependencies."""
+import importlib
+import sys
+
+import pytest
+
+import puzzle.compat
+
+pytestmark = pytest.mark.unittest
+
+
+def test_mypyc_attr_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a class is kept as is if `mypy-extensions` is not installed."""
+    monkeypatch.setitem(sys.modules, 'mypy_extensions', None)
+    try:
+        compat = importlib.reload(puzzle.compat)
+
+        @compat.mypyc_attr(allow_interpreted_subclasses=True)
+        class _Puzzle:
+            """The class represents a decorated class."""
+
+        actual = _Puzzle.__name__
+    finally:
+        monkeypatch.undo()
+        importlib.reload(puzzle.compat)
+    assert '_Puzzle' == actual, f'Expected: _Puzzle != Actual: {actual}'
@@ -0,0 +1,74 @@
+"""A test suite contains a set of test cases for the puzzle search costs."""
+from typing import List
+
+import pytest
+
+from puzzle.costs import AutoSearchPuzzle, SearchCostModel
+from puzzle.grids import GridContent
+from puzzle.properties import LetterCoordinates
+from puzzle.puzzles import SearchWordPuzzle
+
+pytestmark = pytest.mark.unittest
+
+_abcd_rows: List[str] = [
+    ''.join('abcd'[(row * 9 + column) * 7 % 11 % 4] for column in range(9))
+    for row in range(12)
+]
+
+
+@pytest.mark.parametrize('word', ('a', 'ab', 'abcd', 'dcb', 'a?c', 'zoo'))
+@pytest.mark.parametrize('limit', (0, 2))
+def test_auto_puzzle_matches_search_word_puzzle(word: str, limit: int) -> None:
+    """Test a puzzle picking an engine finds the same coordinates in the
+    same order as a plain one."""
+    board = GridContent(_abcd_rows).to_coordinates()
+    expected = SearchWordPuzzle(board).coordinates(word, limit)
+    actual = AutoSearchPuzzle(board).coordinates(word, limit)
+    assert expected == actual, (
+        f'Expected: {expected} coordinates '
+        f'for "{word}" word but got {actual}'
+    )
+    assert AutoSearchPuzzle(board).exists(word) == bool(expected)
+
+
+@pytest.mark.parametrize(
+    'word, engine',
+    (
+        ('aaaa', 'BitMaskSearchPuzzle'),
+        ('aaab', 'SearchWordPuzzle'),
+        ('a*', 'SearchWordPuzzle'),
+        ('zoo', 'SearchWordPuzzle'),
+    ),
+)
+def test_auto_puzzle_engine(word: str, engine: str) -> None:
+    """Test a puzzle picks an engine of the least estimated cost.
+
+    A grid of mostly "a" letters is used, so a word of "a" letters only is
+    searched with bitsets and a word of a rare "b" letter is walked.
+    """
+    board: LetterCoordinates = GridContent(
+        [
+            ''.join(
+                'ab'[(row * 5 + column * 3) % 97 == 0] for column in range(40)
+            )
+            for row in range(40)
+        ]
+    ).to_coordinates()
+    actual = AutoSearchPuzzle(board, SearchCostModel()).engine(word).name
+    assert engine == actual, f'Expected: {engine} != Actual: {actual}'
+
+
+@pytest.mark.parametrize('trie_cost', (0.0, 1.0))
+@pytest.mark.parametrize('limit', (0, 1))
+def test_auto_puzzle_search_many(trie_cost: float, limit: int) -> None:
+    """Test a batch of words is found the same way by a single trie walk
+    of a grid and by a search of every word."""
+    board: LetterCoordinates = GridContent(_abcd_rows).to_coordinates()
+    words = ['abc', 'dab', 'ca?', 'abc', 'zz', 'cd']
+    expected = list(SearchWordPuzzle(board).search_many(words, limit))
+    actual = list(
+        AutoSearchPuzzle(
+            board, SearchCostModel(trie_cost=trie_cost)
+        ).search_many(words, limit)
+    )
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
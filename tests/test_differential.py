@@ -0,0 +1,71 @@
+"""A test suite contains a set of test cases for the differential testing."""
+from typing import List
+
+import pytest
+
+from puzzle.differential import (
+    DIFFERENTIAL_ENGINES,
+    DifferentialCase,
+    check_case,
+    shrink,
+    soak,
+)
+from puzzle.puzzles import SearchWordPuzzle
+
+pytestmark = pytest.mark.unittest
+
+
+class _BrokenPuzzle(SearchWordPuzzle):
+    """The class represents a puzzle missing the last found coordinates."""
+
+    __slots__ = ()
+
+    def coordinates(self, item: str, limit: int = 0) -> List[str]:
+        """Return all but the last found coordinates of a word."""
+        return super().coordinates(item, limit)[:-1]
+
+
+def test_differential_case_is_reproduced() -> None:
+    """Test a case is generated exactly by the same seed only."""
+    first = DifferentialCase.generate(seed=1)
+    second = DifferentialCase.generate(seed=1)
+    third = DifferentialCase.generate(seed=2)
+    assert first == second != third, (
+        f'Expected cases of the same seed to be equal: {first} != {second} '
+        f'and cases of different seeds to differ: {first} == {third}'
+    )
+
+
+def test_engines_match_search_word_puzzle() -> None:
+    """Test every engine finds the same words as a plain search puzzle."""
+    actual = [
+        str(mismatch) for mismatch in soak(cases=20, executors=('inline',))
+    ]
+    assert not actual, f'Expected: no mismatches != Actual: {actual}'
+
+
+@pytest.mark.parametrize('executor_kind', ('thread', 'process'))
+def test_engines_match_search_word_puzzle_in_parallel(
+    executor_kind: str,
+) -> None:
+    """Test every engine finds the same words within parallel workers."""
+    actual = [
+        str(mismatch)
+        for seed in (3, 4)
+        for mismatch in check_case(
+            DifferentialCase.generate(seed), executors=(executor_kind,)
+        )
+    ]
+    assert not actual, f'Expected: no mismatches != Actual: {actual}'
+
+
+def test_mismatch_is_shrunk(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a mismatch of a broken engine is shrunk to a minimal grid."""
+    monkeypatch.setitem(DIFFERENTIAL_ENGINES, 'BrokenPuzzle', _BrokenPuzzle)
+    case = DifferentialCase(
+        seed=0, rows=('xxxx', 'xabx', 'xxxx'), words=('ab', 'xx')
+    )
+    mismatches = check_case(case, engines=('BrokenPuzzle',))
+    actual = shrink(mismatches[0]).case
+    expected = DifferentialCase(seed=0, rows=('ab',), words=('ab',))
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
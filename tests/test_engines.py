@@ -0,0 +1,119 @@
+"""A test suite contains a set of test cases for the search engines."""
+from functools import partial
+from types import SimpleNamespace
+from typing import Any, List
+
+import pytest
+
+from puzzle import engines
+from puzzle.bitmasks import BitMaskSearchPuzzle
+from puzzle.engines import (
+    SearchEngine,
+    register_engine,
+    search_engine,
+    search_engines,
+)
+from puzzle.indexes import NGramSearchPuzzle
+from puzzle.puzzles import SearchWordPuzzle
+
+pytestmark = pytest.mark.unittest
+
+
+class _PlainWordsPuzzle(SearchWordPuzzle):
+    """The class represents a puzzle searching plain words only."""
+
+    SUPPORTS_PATTERNS = False
+    __slots__ = ()
+
+
+@pytest.fixture()
+def registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Isolate a registry of search engines of a test."""
+    monkeypatch.setattr(engines, '_ENGINES', dict(engines._ENGINES))
+    monkeypatch.setattr(engines, '_PLUGINS_LOADED', True)
+
+
+def test_search_engines() -> None:
+    """Test built-in engines are registered in the order of registration."""
+    expected: List[str] = [
+        'auto',
+        'word',
+        'bounded',
+        'axial',
+        'bitmask',
+        'ngram',
+        'suffix-array',
+        'dictionary',
+    ]
+    actual = [engine.name for engine in search_engines()][: len(expected)]
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_search_engine() -> None:
+    """Test a search engine is looked up by its name."""
+    expected = SearchEngine('ngram', NGramSearchPuzzle)
+    actual = search_engine('ngram')
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_unknown_search_engine() -> None:
+    """Test an unknown search engine is not looked up."""
+    with pytest.raises(ValueError):
+        search_engine('simd')
+
+
+@pytest.mark.usefixtures('registry')
+def test_register_engine() -> None:
+    """Test a custom search engine is registered."""
+    register_engine('plain', _PlainWordsPuzzle)
+    expected = 'plain (_PlainWordsPuzzle): plain words'
+    actual = str(search_engine('plain'))
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+@pytest.mark.usefixtures('registry')
+@pytest.mark.parametrize('name', ('word', 'Simd', '1simd', 'si md', ''))
+def test_invalid_register_engine(name: str) -> None:
+    """Test an engine of an invalid or a registered name is not registered."""
+    with pytest.raises(ValueError):
+        register_engine(name, _PlainWordsPuzzle)
+
+
+def test_engine_capabilities() -> None:
+    """Test capabilities of an engine are read from its puzzle class."""
+    expected = 'bitmask (BitMaskSearchPuzzle): patterns, early exit'
+    actual = str(search_engine('bitmask'))
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_partial_engine_capabilities() -> None:
+    """Test capabilities of a partial engine are read from its class."""
+    engine = SearchEngine('ngram', partial(NGramSearchPuzzle, max_entries=1))
+    assert engine.supports_early_exit, f'Expected "{engine}" to exit early'
+
+
+@pytest.mark.usefixtures('registry')
+def test_plugins_are_registered(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test engines of entry points are registered once, broken ones are
+    skipped."""
+
+    def broken() -> Any:
+        raise ImportError('No module named "simd"')
+
+    monkeypatch.setattr(engines, '_PLUGINS_LOADED', False)
+    monkeypatch.setattr(
+        engines,
+        '_entry_points',
+        lambda: (
+            SimpleNamespace(name='fast', load=lambda: BitMaskSearchPuzzle),
+            SimpleNamespace(name='simd', load=broken),
+            SimpleNamespace(name='word', load=lambda: BitMaskSearchPuzzle),
+        ),
+    )
+    actual = [engine.name for engine in search_engines()]
+    assert 'fast' in actual and 'simd' not in actual, f'Actual: {actual}'
+    expected = SearchWordPuzzle
+    actual_type = search_engine('word').puzzle_type
+    assert (
+        expected == actual_type
+    ), f'Expected: {expected} != Actual: {actual_type}'
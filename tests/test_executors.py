@@ -0,0 +1,105 @@
+"""A test suite contains a set of test cases for the puzzle executors."""
+import os
+from typing import List
+
+import pytest
+
+from puzzle.executors import (
+    Executor,
+    InlineExecutor,
+    ProcessExecutor,
+    ThreadExecutor,
+    create_executor,
+    is_free_threaded,
+)
+
+pytestmark = pytest.mark.unittest
+
+_initialized: List[int] = []
+
+
+def _initialize(value: int) -> None:
+    """Keep a value initialized within a worker."""
+    _initialized.append(value)
+
+
+def _initialized_value(offset: int) -> int:
+    """Return a value initialized within a worker along with an offset."""
+    return _initialized[-1] + offset
+
+
+def _worker_id(_: int) -> int:
+    """Return an identifier of a worker process."""
+    return os.getpid()
+
+
+@pytest.mark.parametrize(
+    'kind, executor_type',
+    (
+        ('process', ProcessExecutor),
+        ('thread', ThreadExecutor),
+        ('inline', InlineExecutor),
+    ),
+)
+def test_create_executor(kind: str, executor_type: type) -> None:
+    """Test an executor of a given kind is created."""
+    with create_executor(kind) as executor:  # type: Executor
+        assert isinstance(executor, executor_type), (
+            f'Expected executor: {executor_type.__name__} '
+            f'!= Actual executor: {executor.name}'
+        )
+
+
+def test_create_auto_executor() -> None:
+    """Test threads are picked for a free-threaded interpreter only."""
+    expected = 'ThreadExecutor' if is_free_threaded() else 'ProcessExecutor'
+    with create_executor() as executor:  # type: Executor
+        assert (
+            expected == executor.name
+        ), f'Expected executor: {expected} != Actual executor: {executor.name}'
+
+
+def test_create_invalid_executor() -> None:
+    """Test an executor of an unknown kind fails to be created.
+
+    ValueError should be raised in case of an unknown executor kind.
+    """
+    with pytest.raises(ValueError):
+        create_executor('fiber')
+
+
+@pytest.mark.parametrize('kind', ('process', 'thread', 'inline'))
+def test_executor_results(kind: str) -> None:
+    """Test an executor returns results of every item."""
+    with create_executor(
+        kind, workers=2, initializer=_initialize, initargs=(10,)
+    ) as executor:  # type: Executor
+        ordered = list(executor.imap(_initialized_value, range(5)))
+        unordered = sorted(executor.imap_unordered(_initialized_value, (1, 2)))
+    assert ordered == [10, 11, 12, 13, 14] and unordered == [11, 12], (
+        f'Expected results: [10, 11, 12, 13, 14] and [11, 12] '
+        f'!= Actual results: {ordered} and {unordered}'
+    )
+
+
+@pytest.mark.parametrize('max_tasks, expected', ((0, 1), (1, 3)))
+def test_process_executor_max_tasks(max_tasks: int, expected: int) -> None:
+    """Test a worker process is replaced after a given amount of tasks."""
+    with create_executor(
+        'process', workers=1, max_tasks=max_tasks
+    ) as executor:  # type: Executor
+        actual = len(set(executor.imap(_worker_id, range(3))))
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+@pytest.mark.parametrize('kind', ('process', 'thread', 'inline'))
+def test_executor_initialized(kind: str) -> None:
+    """Test an executor of the same kind is created with an initializer."""
+    with create_executor(kind, workers=2) as executor, executor.initialized(
+        _initialize, (20,)
+    ) as initialized:  # type: Executor, Executor
+        actual = list(initialized.imap(_initialized_value, range(2)))
+    assert executor.name == initialized.name and actual == [20, 21], (
+        f'Expected: {executor.name} and [20, 21] '
+        f'!= Actual: {initialized.name} and {actual}'
+    )
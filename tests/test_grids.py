@@ -2,9 +2,22 @@
 A test suite contains a set of test cases for the puzzle
 grids interfaces.
 """
+import pickle
+from string import ascii_lowercase
+from pathlib import Path
+from typing import List
+
 import pytest
 
-from puzzle.grids import Content, GridContent, Grid, RandomWordsGrid
+from puzzle.grids import (
+    CompactRows,
+    Content,
+    GridContent,
+    Grid,
+    MappedGrid,
+    ProceduralGrid,
+    RandomWordsGrid,
+)
 from puzzle.properties import Coordinate, LetterCoordinates, GridSize
 
 pytestmark = pytest.mark.unittest
@@ -170,3 +183,203 @@ def test_empty_grid(random_words_grid: Grid) -> None:
     random_words_grid.refresh()
     with pytest.raises(ValueError):
         str(random_words_grid.content)
+
+
+def test_weighted_grid_letters() -> None:
+    """Test grid generates letters of non-zero weights only."""
+    weights = [int(letter in 'ab') for letter in 'abcdefghijklmnopqrstuvwxyz']
+    with RandomWordsGrid(GridSize(5, 5), weights) as grid:  # type: Grid
+        letters = set(str(grid.content)) - {'\n'}
+    assert letters <= {
+        'a',
+        'b',
+    }, f'Expected grid letters: {{"a", "b"}} != Actual letters: {letters}'
+
+
+def test_invalid_grid_weights() -> None:
+    """Test grid fails to generate letters with a weight of some letters.
+
+    ValueError should be raised in case of invalid letter weights.
+    """
+    with pytest.raises(ValueError):
+        with RandomWordsGrid(GridSize(5, 5), (1.0, 2.0)) as grid:  # type: Grid
+            str(grid.content)
+
+
+def test_seeded_grid_region() -> None:
+    """Test a region of a seeded grid is a part of its whole content."""
+    with RandomWordsGrid(GridSize(6, 600), seed=3) as grid:  # type: Grid
+        expected = [row[250:520] for row in str(grid.content).split()[2:5]]
+        actual = grid.region(top=2, left=250, height=3, width=270)
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_seeded_grid_is_reproduced() -> None:
+    """Test a seeded grid is reproduced exactly by the same seed only."""
+    first = str(RandomWordsGrid(GridSize(4, 4), seed=1).content)
+    second = str(RandomWordsGrid(GridSize(4, 4), seed=1).content)
+    third = str(RandomWordsGrid(GridSize(4, 4), seed=2).content)
+    assert first == second != third, (
+        f'Expected grids of the same seed to be equal: {first} != {second} '
+        f'and grids of different seeds to differ: {first} == {third}'
+    )
+
+
+def test_mapped_grid(tmp_path: Path) -> None:
+    """Test a memory-mapped grid reads regions of its file."""
+    path = tmp_path / 'grid.txt'
+    path.write_text('abcd\nefgh\nijkl\n')
+    with MappedGrid(path) as grid:  # type: Grid
+        actual = (
+            grid.height,
+            grid.width,
+            grid.region(top=1, left=2, height=5, width=5),
+            str(pickle.loads(pickle.dumps(grid)).content),
+        )
+    expected = (3, 4, ['gh', 'kl'], 'abcd\nefgh\nijkl')
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+@pytest.mark.parametrize('rows', ('', '\nab\n', 'abc\nde\n', 'abc'))
+def test_invalid_mapped_grid(tmp_path: Path, rows: str) -> None:
+    """Test a memory-mapped grid fails to map a file of invalid rows.
+
+    ValueError should be raised in case of invalid rows.
+    """
+    path = tmp_path / 'grid.txt'
+    path.write_text(rows)
+    with pytest.raises(ValueError):
+        with MappedGrid(path) as grid:  # type: Grid
+            str(grid.content)
+
+
+def test_procedural_grid_region() -> None:
+    """Test a region of a procedural grid is computed from its cells only."""
+    with ProceduralGrid(
+        GridSize(10**9, 10**9), seed=5
+    ) as grid:  # type: Grid
+        expected = [
+            ''.join(grid.letter(row, column) for column in range(70, 75))
+            for row in range(10**9 - 2, 10**9)
+        ]
+        actual = grid.region(top=10**9 - 2, left=70, height=5, width=5)
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_procedural_grid_is_reproduced() -> None:
+    """Test a procedural grid is reproduced exactly by the same seed only.
+
+    A grid is shipped to a worker as a seed, so it is reproduced after
+    pickling as well.
+    """
+    grid = ProceduralGrid(GridSize(4, 5), seed=1)
+    first = str(grid.content)
+    second = str(pickle.loads(pickle.dumps(grid)).content)
+    third = str(ProceduralGrid(GridSize(4, 5), seed=2).content)
+    assert first == second != third, (
+        f'Expected grids of the same seed to be equal: {first} != {second} '
+        f'and grids of different seeds to differ: {first} == {third}'
+    )
+    assert len(pickle.dumps(grid)) < 256, 'Grid is not shipped as a seed'
+
+
+def test_procedural_grid_weights() -> None:
+    """Test a procedural grid picks letters of positive weights only."""
+    weights = [1.0 if letter in 'ab' else 0.0 for letter in ascii_lowercase]
+    with ProceduralGrid(
+        GridSize(20, 20), seed=1, weights=weights
+    ) as grid:  # type: Grid
+        actual = set(str(grid.content).replace('\n', ''))
+    expected = {'a', 'b'}
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_seeded_grid_is_procedural() -> None:
+    """Test a seeded grid is computed by a procedural grid of the same seed
+    and letter weights."""
+    weights = [float(weight) for weight in range(len(ascii_lowercase))]
+    expected = str(ProceduralGrid(GridSize(5, 7), 3, weights).content)
+    actual = str(RandomWordsGrid(GridSize(5, 7), weights, seed=3).content)
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_invalid_procedural_grid_size() -> None:
+    """Test a procedural grid of invalid size fails to be generated.
+
+    ValueError should be raised in case of invalid grid size.
+    """
+    with pytest.raises(ValueError):
+        with ProceduralGrid(GridSize(0, 5)) as grid:  # type: Grid
+            str(grid.content)
+
+
+@pytest.mark.parametrize('packed', (False, True))
+def test_compact_rows(packed: bool) -> None:
+    """Test compact rows return the same rows as appended ones.
+
+    Rows of odd widths are used, so packed letters cross bytes.
+    """
+    expected = [
+        ''.join(chr(97 + (row * 11 + column * 5) % 26) for column in range(37))
+        for row in range(13)
+    ]
+    rows = CompactRows(expected, packed=packed)
+    actual = (list(rows), rows[-1], rows[3:5])
+    assert (
+        expected,
+        expected[-1],
+        expected[3:5],
+    ) == actual, f'Expected: {expected} rows != Actual: {actual} rows'
+
+
+@pytest.mark.parametrize('packed, limit', ((False, 1.5), (True, 0.63)))
+def test_compact_rows_size(packed: bool, limit: float) -> None:
+    """Test a letter of compact rows takes less than a limit of bytes."""
+    with RandomWordsGrid(
+        GridSize(100, 99), packed=packed
+    ) as grid:  # type: RandomWordsGrid
+        content = str(grid.content)
+        actual = CompactRows(content.split(), packed=packed).nbytes / 9900
+    assert actual < limit, f'Expected: < {limit} bytes != Actual: {actual}'
+
+
+@pytest.mark.parametrize('packed', (False, True))
+def test_compact_rows_are_pickled(packed: bool) -> None:
+    """Test compact rows are pickled as their stored bytes."""
+    rows = CompactRows(['abc', 'def', 'ghi'], packed=packed)
+    restored = pickle.loads(pickle.dumps(rows))
+    expected = (list(rows), rows.nbytes, packed)
+    actual = (list(restored), restored.nbytes, restored.packed)
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+    restored.append('jkl')
+    assert restored[-1] == 'jkl', f'Actual: {list(restored)} rows'
+
+
+def test_compact_rows_view() -> None:
+    """Test a row of compact rows is viewed without any copies."""
+    rows = CompactRows(['abc', 'def'])
+    view = rows.row_view(-1)
+    actual = (bytes(view), view.readonly, view.obj is rows.row_view(0).obj)
+    assert (b'def', False, True) == actual, f'Actual: {actual} view'
+
+
+@pytest.mark.parametrize(
+    'rows, packed',
+    ((['abc', 'de'], False), ([''], False), (['aBc'], True), (['a1'], True)),
+)
+def test_invalid_compact_rows(rows: List[str], packed: bool) -> None:
+    """Test compact rows fail to store invalid rows.
+
+    ValueError should be raised in case of invalid rows.
+    """
+    with pytest.raises(ValueError):
+        CompactRows(rows, packed=packed)
+
+
+def test_packed_compact_rows_view() -> None:
+    """Test a row of packed compact rows is not able to be viewed.
+
+    ValueError should be raised as packed letters are not bytes.
+    """
+    with pytest.raises(ValueError):
+        CompactRows(['abc'], packed=True).row_view(0)
@@ -0,0 +1,129 @@
+"""A test suite contains a set of test cases for the puzzle indexes."""
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+from puzzle.grids import GridContent
+from puzzle.indexes import (
+    DictionarySearchPuzzle,
+    NGramSearchPuzzle,
+    SuffixArraySearchPuzzle,
+)
+from puzzle.puzzles import SearchWordPuzzle
+
+pytestmark = pytest.mark.unittest
+
+_abcd_rows: List[str] = [
+    ''.join('abcd'[(row * 9 + column) * 7 % 11 % 4] for column in range(9))
+    for row in range(12)
+]
+
+
+@pytest.mark.parametrize(
+    'word', ('a', 'ab', 'aba', 'abcd', 'dcb', 'abcdabcdabcd', 'a?c', 'zoo')
+)
+@pytest.mark.parametrize('limit', (0, 1, 3))
+@pytest.mark.parametrize('depth', (1, 16))
+def test_suffix_array_puzzle_matches_search_word_puzzle(
+    word: str, limit: int, depth: int
+) -> None:
+    """Test a puzzle of a suffix array finds the same coordinates in the
+    same order as a plain one, including words longer than sorted suffixes
+    and patterns."""
+    board = GridContent(_abcd_rows).to_coordinates()
+    expected = SearchWordPuzzle(board).coordinates(word, limit)
+    for puzzle in (
+        SuffixArraySearchPuzzle(board, depth),
+        SuffixArraySearchPuzzle.from_rows(_abcd_rows, depth),
+    ):  # type: SuffixArraySearchPuzzle
+        actual = puzzle.coordinates(word, limit)
+        assert expected == actual, (
+            f'Expected: {expected} coordinates '
+            f'for "{word}" word but got {actual}'
+        )
+        assert puzzle.exists(word) == bool(expected)
+
+
+def test_suffix_array_puzzle_save_load(tmp_path: Path) -> None:
+    """Test an index of a grid is loaded back from a file and finds the same
+    coordinates without a board of letters."""
+    path = tmp_path / 'grid.idx'
+    SuffixArraySearchPuzzle.from_rows(_abcd_rows, depth=3).save(path)
+    puzzle = SuffixArraySearchPuzzle.load(path)
+    board = GridContent(_abcd_rows).to_coordinates()
+    for word in ('ab', 'abcd', 'dcba', 'b?d'):  # type: str
+        expected = SearchWordPuzzle(board).coordinates(word)
+        actual = puzzle.coordinates(word)
+        assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_suffix_array_puzzle_invalid_file(tmp_path: Path) -> None:
+    """Test a file which is not an index of a grid is rejected."""
+    path = tmp_path / 'grid.idx'
+    path.write_bytes(b'foo bar')
+    with pytest.raises(ValueError):
+        SuffixArraySearchPuzzle.load(path)
+
+
+@pytest.mark.parametrize(
+    'word', ('a', 'ab', 'aba', 'abcd', 'dcb', 'a?c', 'zoo')
+)
+@pytest.mark.parametrize('limit', (0, 1, 3))
+@pytest.mark.parametrize(
+    'trigram_threshold, max_entries', ((0, 0), (0, 500), (10**6, 0))
+)
+def test_ngram_puzzle_matches_search_word_puzzle(
+    word: str, limit: int, trigram_threshold: int, max_entries: int
+) -> None:
+    """Test a puzzle of an n-gram index finds the same coordinates in the
+    same order as a plain one whether bigrams are split or not."""
+    board = GridContent(_abcd_rows).to_coordinates()
+    expected = SearchWordPuzzle(board).coordinates(word, limit)
+    puzzle = NGramSearchPuzzle(board, trigram_threshold, max_entries)
+    actual = puzzle.coordinates(word, limit)
+    assert expected == actual, (
+        f'Expected: {expected} coordinates '
+        f'for "{word}" word but got {actual}'
+    )
+    assert puzzle.exists(word) == bool(expected)
+
+
+@pytest.mark.parametrize(
+    'trigram_threshold, expected',
+    ((10**6, (58, 224)), (0, (27, 224))),
+)
+def test_ngram_puzzle_probes(
+    trigram_threshold: int, expected: Tuple[int, int]
+) -> None:
+    """Test an n-gram index probes fewer starts than 8 directions of every
+    cell of the first letter of a word."""
+    board = GridContent(_abcd_rows).to_coordinates()
+    actual = NGramSearchPuzzle(board, trigram_threshold).probes('abcd')
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+@pytest.mark.parametrize('min_length', (1, 3))
+def test_dictionary_puzzle_matches_search_word_puzzle(min_length: int) -> None:
+    """Test a puzzle of a dictionary finds every word in a single pass with
+    the same coordinates in the same order as a plain one."""
+    words = ('a', 'ab', 'aba', 'abcd', 'dcb', 'bad', 'zoo')
+    board = GridContent(_abcd_rows).to_coordinates()
+    puzzle = SearchWordPuzzle(board)
+    expected = {
+        word: puzzle.coordinates(word)
+        for word in words
+        if len(word) >= min_length and puzzle.exists(word)
+    }
+    actual: Dict[str, List[str]] = {}
+    for word, coordinates in DictionarySearchPuzzle(board, words).matches(
+        min_length
+    ):  # type: str, str
+        actual.setdefault(word, []).append(coordinates)
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_dictionary_puzzle_invalid_board_of_letters() -> None:
+    """Test a dictionary is not searched in an empty board of letters."""
+    with pytest.raises(ValueError):
+        list(DictionarySearchPuzzle({}, ('foo',)).matches())
@@ -0,0 +1,87 @@
+"""
+A test suite contains a set of test cases to measure startup time
+of search words puzzle tool.
+"""
+import re
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+pytestmark = pytest.mark.unittest
+_max_allowed_import_time: float = 0.05
+
+
+def import_times(statement: str) -> Dict[str, float]:
+    """Runs a statement with a fresh interpreter and returns cumulative
+    import time in seconds of every imported module (`-X importtime`).
+    """
+    process = subprocess.run(
+        (sys.executable, '-X', 'importtime', '-c', statement),
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return {
+        module.strip(): int(cumulative) / 10**6
+        for cumulative, module in re.findall(
+            pattern=r'import time:\s+\d+ \|\s+(\d+) \|(.+)',
+            string=process.stderr,
+        )
+    }
+
+
+def test_measure_package_import() -> None:
+    """Test the package is imported without its submodules.
+
+    Basically package should be imported within less that 0.05 seconds.
+    """
+    modules = import_times('import puzzle')
+    assert (
+        not {'puzzle.grids', 'puzzle.tools'} & modules.keys()
+    ), f'Package imports its submodules eagerly: {sorted(modules)}'
+    assert modules['puzzle'] < _max_allowed_import_time, (
+        f'Import time of a package "{modules["puzzle"]}" exceeds '
+        f'maximum allowed "{_max_allowed_import_time}" time.'
+    )
+
+
+def test_measure_tool_import() -> None:
+    """Test the tool entrypoint does not import search engine upfront.
+
+    A search engine, logger and processes pool should be imported
+    only when a search is started, e.g. not for `--help` option.
+    """
+    modules = import_times('import puzzle.__main__')
+    eager_modules = {
+        'loguru',
+        'multiprocessing',
+        'puzzle.bitmasks',
+        'puzzle.costs',
+        'puzzle.grids',
+        'puzzle.indexes',
+        'puzzle.placements',
+        'puzzle.puzzles',
+        'puzzle.tools',
+        'puzzle.words',
+    } & modules.keys()
+    assert (
+        not eager_modules
+    ), f'Tool entrypoint imports "{sorted(eager_modules)}" modules eagerly'
+
+
+def test_lazy_package_interface() -> None:
+    """Test the package interfaces are imported on their first access."""
+    import puzzle  # pylint:disable=import-outside-toplevel
+    from puzzle.puzzles import (  # pylint:disable=import-outside-toplevel
+        SearchWordPuzzle,
+    )
+
+    assert puzzle.SearchWordPuzzle is SearchWordPuzzle, (
+        f'Expected {SearchWordPuzzle} interface '
+        f'but got {puzzle.SearchWordPuzzle} interface'
+    )
+    assert 'SearchWordPuzzle' in dir(puzzle), f'Not found in {dir(puzzle)}'
+    with pytest.raises(AttributeError):
+        getattr(puzzle, 'UnknownPuzzle')
@@ -2,15 +2,33 @@
 A test suite contains a set of test cases to measure performance
 of search words puzzle engine.
 """
+import string
 import time
+from importlib.util import module_from_spec, spec_from_file_location
 from pathlib import Path
-from typing import List, Sequence
+from typing import List, Sequence, Tuple, Type
 
 import pytest
+from loguru import logger
 
+from puzzle import puzzles
+from puzzle.bitmasks import BitMaskSearchPuzzle
+from puzzle.executors import create_executor
 from puzzle.grids import RandomWordsGrid, Grid
+from puzzle.indexes import NGramSearchPuzzle, SuffixArraySearchPuzzle
 from puzzle.properties import GridSize, LetterCoordinates
-from puzzle.tools import start_word_search_puzzle, start_words_search_puzzle
+from puzzle.puzzles import (
+    AxialSearchWordPuzzle,
+    BoundedSearchWordPuzzle,
+    SearchPuzzle,
+    SearchWordPuzzle,
+)
+from puzzle.tools import (
+    start_tiled_search_puzzle,
+    start_word_search_puzzle,
+    start_words_search_puzzle,
+)
+from puzzle.tuning import compiled_modules
 from puzzle.words import HiddenWords, HiddenWord
 
 pytestmark = pytest.mark.unittest
@@ -30,6 +48,63 @@ def board() -> LetterCoordinates:
         yield grid.content.to_coordinates()
 
 
+@pytest.fixture(scope='module')
+def large_board() -> LetterCoordinates:
+    """Creates a large seeded board of letters for a puzzle."""
+    with RandomWordsGrid(
+        GridSize(height=60, width=60), seed=1
+    ) as grid:  # type: Grid
+        yield grid.content.to_coordinates()
+
+
+@pytest.fixture(scope='module')
+def skewed_board() -> LetterCoordinates:
+    """Creates a seeded board of mostly common letters for a puzzle."""
+    weights = [
+        20.0 if letter in 'etaoin' else 1.0 for letter in string.ascii_lowercase
+    ]
+    with RandomWordsGrid(
+        GridSize(height=60, width=60), weights, seed=1
+    ) as grid:  # type: Grid
+        yield grid.content.to_coordinates()
+
+
+def measure_puzzle(
+    puzzle: SearchPuzzle, words: Sequence[str], repeat: int = 3
+) -> float:
+    """Measures the best time a puzzle spends to search given words."""
+    best_time: float = float('inf')
+    for _ in range(repeat):  # type: int
+        execution_start_time: float = time.perf_counter()
+        for word in words:  # type: str
+            puzzle.coordinates(word)
+        best_time = min(best_time, time.perf_counter() - execution_start_time)
+    return best_time
+
+
+def count_probes(puzzle: SearchPuzzle, words: Sequence[str]) -> int:
+    """Counts probes a puzzle makes to search given words."""
+    return sum(puzzle.probe_count(word) for word in words)
+
+
+def compare_puzzles(
+    puzzle: SearchPuzzle, plain_puzzle: SearchPuzzle, words: Sequence[str]
+) -> Tuple[int, int]:
+    """Counts probes of two puzzles searching given words.
+
+    Search times are logged for information only as they depend on a load
+    of a machine.
+    """
+    probes = count_probes(puzzle, words), count_probes(plain_puzzle, words)
+    logger.info(
+        f'{puzzle.name} makes {probes[0]} probes in '
+        f'{measure_puzzle(puzzle, words):.4f} seconds, {plain_puzzle.name} '
+        f'makes {probes[1]} probes in '
+        f'{measure_puzzle(plain_puzzle, words):.4f} seconds'
+    )
+    return probes
+
+
 @pytest.mark.parametrize(
     'word', ('foo', 'foobar', 'foobar', 'foobarlong', 'foobarisatoolongword')
 )
@@ -105,3 +180,241 @@ def test_measure_words_search(
         'Execution time of a puzzle tool exceeds '
         f'maximum allowed "{_max_allowed_time}" time.'
     )
+
+
+@pytest.mark.parametrize('executor_kind', ('process', 'thread', 'inline'))
+def test_measure_executor_words_search(
+    board: LetterCoordinates, executor_kind: str
+) -> None:
+    """Test the performance of every executor on the same words search.
+
+    Basically words should be matched within less that 0.5 seconds
+    in a 50x50 grid of letters.
+    """
+    execution_start_time: float = time.time()
+    start_words_search_puzzle(
+        HiddenWords(board, iter(real_words())),
+        executor=create_executor(executor_kind),
+    )
+    execution_time: float = time.time() - execution_start_time
+    assert execution_time < _max_allowed_time, (
+        f'Execution time of "{executor_kind}" executor exceeds '
+        f'maximum allowed "{_max_allowed_time}" time.'
+    )
+
+
+def test_measure_tiled_search() -> None:
+    """Test the performance of a tiled search of a seeded grid.
+
+    Basically words should be matched within less that 0.5 seconds
+    in 64x64 tiles of a lazily generated 120x120 grid of letters.
+    """
+    execution_start_time: float = time.time()
+    with RandomWordsGrid(
+        GridSize(height=120, width=120), seed=1
+    ) as grid:  # type: Grid
+        start_tiled_search_puzzle(
+            grid, real_words(), tile_size=64, executor_kind='inline'
+        )
+    execution_time: float = time.time() - execution_start_time
+    assert execution_time < _max_allowed_time, (
+        'Execution time of a tiled search exceeds '
+        f'maximum allowed "{_max_allowed_time}" time.'
+    )
+
+
+@pytest.mark.parametrize(
+    'puzzle_type',
+    (SearchWordPuzzle, BoundedSearchWordPuzzle, BitMaskSearchPuzzle),
+)
+def test_measure_puzzle_search(
+    board: LetterCoordinates, puzzle_type: Type[SearchPuzzle]
+) -> None:
+    """Test the performance of every search puzzle engine.
+
+    Basically words should be matched within less that 0.5 seconds
+    in a 50x50 grid of letters.
+    """
+    execution_time = measure_puzzle(puzzle_type(board), real_words())
+    assert execution_time < _max_allowed_time, (
+        f'Execution time of "{puzzle_type.__name__}" puzzle exceeds '
+        f'maximum allowed "{_max_allowed_time}" time.'
+    )
+
+
+@pytest.mark.parametrize('puzzle_type', (BitMaskSearchPuzzle,))
+def test_measure_optimized_puzzle_search(
+    large_board: LetterCoordinates, puzzle_type: Type[SearchPuzzle]
+) -> None:
+    """Test an optimized puzzle makes fewer probes than the plain word puzzle.
+
+    Both puzzles search the same words in a 60x60 grid of letters.
+    """
+    words = ('on', 'the', 'eat', 'seat')
+    optimized_probes, plain_probes = compare_puzzles(
+        puzzle_type(large_board), SearchWordPuzzle(large_board), words
+    )
+    assert optimized_probes < plain_probes, (
+        f'"{puzzle_type.__name__}" puzzle search makes {optimized_probes} '
+        f'probes but plain word puzzle search makes {plain_probes} probes.'
+    )
+
+
+def test_measure_bounded_puzzle_search(large_board: LetterCoordinates) -> None:
+    """Test a direction-pruned puzzle makes fewer probes than directions
+    walked from every cell of the first letter of a word.
+
+    A walk of every direction makes at least one probe, a pruned puzzle
+    skips directions a word does not fit in and rejects most of the rest
+    with a single probe of the last letter.
+    """
+    words = real_words()
+    puzzle = BoundedSearchWordPuzzle(large_board)
+    directions: int = len(SearchWordPuzzle.MOVEMENT_COORDINATES) * sum(
+        len(large_board[word[0]]) for word in words
+    )
+    bounded_probes, _ = compare_puzzles(
+        puzzle, SearchWordPuzzle(large_board), words
+    )
+    assert bounded_probes < directions, (
+        f'Direction-pruned puzzle search makes {bounded_probes} probes '
+        f'for {directions} directions of the first letters of words.'
+    )
+
+
+def test_measure_rarest_letter_puzzle_search(
+    skewed_board: LetterCoordinates,
+) -> None:
+    """Test a search anchored on the rarest letter of a word makes fewer
+    probes than a search started from the first letter of a word.
+
+    Words starting with common letters are searched in a 60x60 grid of
+    mostly common letters.
+    """
+    words = ('teak', 'neatly', 'taxi', 'tiny', 'often')
+    rarest_letter_probes, first_letter_probes = compare_puzzles(
+        SearchWordPuzzle(skewed_board),
+        BoundedSearchWordPuzzle(skewed_board),
+        words,
+    )
+    assert rarest_letter_probes < first_letter_probes, (
+        f'Rarest letter puzzle search makes {rarest_letter_probes} probes '
+        f'but first letter puzzle search makes {first_letter_probes} probes.'
+    )
+
+
+def test_measure_axial_puzzle_search(large_board: LetterCoordinates) -> None:
+    """Test a puzzle walking 4 axes makes fewer probes than a puzzle
+    walking 8 directions for palindromes.
+
+    Both puzzles search the same words in a 60x60 grid of letters.
+    """
+    words = ('level', 'noon', 'ara', 'ses', 'tit')
+    axial_probes, plain_probes = compare_puzzles(
+        AxialSearchWordPuzzle(large_board),
+        SearchWordPuzzle(large_board),
+        words,
+    )
+    assert axial_probes < plain_probes, (
+        f'Axial puzzle search makes {axial_probes} probes '
+        f'but plain word puzzle search makes {plain_probes} probes.'
+    )
+
+
+@pytest.mark.parametrize(
+    'puzzle_type',
+    (
+        SearchWordPuzzle,
+        BoundedSearchWordPuzzle,
+        AxialSearchWordPuzzle,
+        BitMaskSearchPuzzle,
+        NGramSearchPuzzle,
+        SuffixArraySearchPuzzle,
+    ),
+)
+def test_measure_puzzle_exists(
+    large_board: LetterCoordinates, puzzle_type: Type[SearchPuzzle]
+) -> None:
+    """Test the performance of a word presence check.
+
+    Basically presence of a word should be checked within less that
+    0.5 seconds in a 60x60 grid of letters.
+    """
+    puzzle = puzzle_type(large_board)
+    execution_start_time: float = time.time()
+    for word in ('on', 'the', 'eat', 'seat'):  # type: str
+        puzzle.exists(word)
+    execution_time: float = time.time() - execution_start_time
+    assert execution_time < _max_allowed_time, (
+        f'Presence check time of "{puzzle_type.__name__}" puzzle exceeds '
+        f'maximum allowed "{_max_allowed_time}" time.'
+    )
+
+
+def test_measure_suffix_array_puzzle_search(
+    large_board: LetterCoordinates,
+) -> None:
+    """Test a puzzle of a suffix array makes fewer probes than a plain word
+    puzzle once its index is built.
+
+    Both puzzles search the same words in a 60x60 grid of letters.
+    """
+    puzzle = SuffixArraySearchPuzzle(large_board)
+    puzzle.build()
+    suffix_probes, plain_probes = compare_puzzles(
+        puzzle, SearchWordPuzzle(large_board), real_words()
+    )
+    assert suffix_probes < plain_probes, (
+        f'Suffix array puzzle search makes {suffix_probes} probes '
+        f'but plain word puzzle search makes {plain_probes} probes.'
+    )
+
+
+def test_measure_ngram_puzzle_search(large_board: LetterCoordinates) -> None:
+    """Test a puzzle of an n-gram index makes fewer probes than a plain word
+    puzzle once its index is built.
+
+    Both puzzles search the same words in a 60x60 grid of letters.
+    """
+    puzzle = NGramSearchPuzzle(large_board)
+    puzzle.build()
+    ngram_probes, plain_probes = compare_puzzles(
+        puzzle, SearchWordPuzzle(large_board), real_words()
+    )
+    assert ngram_probes < plain_probes, (
+        f'N-gram puzzle search makes {ngram_probes} probes '
+        f'but plain word puzzle search makes {plain_probes} probes.'
+    )
+
+
+@pytest.mark.skipif(
+    'puzzle.puzzles' not in compiled_modules(),
+    reason='search engines are not compiled',
+)
+def test_measure_compiled_puzzle_search(
+    large_board: LetterCoordinates,
+) -> None:
+    """Test a compiled search puzzle outperforms its pure Python sources.
+
+    Pure Python sources of engines are shipped along with a compiled build,
+    both puzzles search the same words in a 60x60 grid of letters. The best
+    time of a few runs is compared as both make the same probes.
+    """
+    spec = spec_from_file_location(
+        'puzzle._pure_puzzles', Path(puzzles.__file__).with_name('puzzles.py')
+    )
+    pure_puzzles = module_from_spec(spec)
+    spec.loader.exec_module(pure_puzzles)
+    words = real_words() * 40
+    pure_time = measure_puzzle(
+        pure_puzzles.SearchWordPuzzle(large_board), words
+    )
+    compiled_time = measure_puzzle(SearchWordPuzzle(large_board), words)
+    logger.info(
+        f'Compiled puzzle search is {pure_time / compiled_time:.2f}x faster '
+        'than pure Python one'
+    )
+    assert compiled_time < pure_time, (
+        f'Compiled puzzle search takes {compiled_time} seconds '
+        f'but pure Python puzzle search takes {pure_time} seconds.'
+    )
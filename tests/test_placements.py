@@ -0,0 +1,93 @@
+"""
+A test suite contains a set of test cases for the puzzle
+word placements interfaces.
+"""
+from typing import List
+
+import pytest
+
+from puzzle.grids import Grid
+from puzzle.placements import PlantedWordsGrid
+from puzzle.properties import GridSize, WordPlacement
+from puzzle.puzzles import SearchWordPuzzle
+
+pytestmark = pytest.mark.unittest
+
+
+def test_planted_words_grid() -> None:
+    """Test every placement of a planted word is found in a grid by a search
+    puzzle, so placements are a ground truth of a search."""
+    words = ('foo', 'bar', 'puzzle', 'words', 'grid', 'letters') * 3
+    with PlantedWordsGrid(
+        GridSize(20, 20), words, seed=7
+    ) as grid:  # type: PlantedWordsGrid
+        puzzle = SearchWordPuzzle(grid.content.to_coordinates())
+        placements = grid.placements
+    assert len(placements) == len(words), 'Not every word is planted'
+    for placement in placements:  # type: WordPlacement
+        actual = puzzle.coordinates(placement.word)
+        assert str(placement) in actual, (
+            f'Expected: {placement} placement of "{placement.word}" word '
+            f'within found coordinates: {actual}'
+        )
+
+
+def test_planted_words_grid_is_reproduced() -> None:
+    """Test a grid of planted words is reproduced exactly by the same seed."""
+    grids: List[str] = []
+    for seed in (1, 1, 2):  # type: int
+        with PlantedWordsGrid(
+            GridSize(8, 8), ('foo', 'bar'), seed=seed
+        ) as grid:  # type: Grid
+            grids.append(str(grid.content))
+    first, second, third = grids
+    assert first == second != third, (
+        f'Expected grids of the same seed to be equal: {first} != {second} '
+        f'and grids of different seeds to differ: {first} == {third}'
+    )
+
+
+def test_planted_words_grid_skips_long_words() -> None:
+    """Test a word longer than a grid is not planted."""
+    with PlantedWordsGrid(
+        GridSize(3, 3), ('foo', 'toolong'), seed=1
+    ) as grid:  # type: PlantedWordsGrid
+        actual = [placement.word for placement in grid.placements]
+        rows = grid.region(top=0, left=0, height=5, width=5)
+    assert actual == ['foo'], f'Expected: {["foo"]} != Actual: {actual}'
+    assert len(rows) == 3 and all(len(row) == 3 for row in rows)
+
+
+@pytest.mark.parametrize(
+    'grid_size, words',
+    ((GridSize(3, 1), ('a', 'b')), (GridSize(1, 3), ('ab', 'c', 'ba'))),
+)
+def test_planted_words_grid_narrow(
+    grid_size: GridSize, words: List[str]
+) -> None:
+    """Test words are planted in a grid of a single column or row."""
+    with PlantedWordsGrid(
+        grid_size, words, seed=0
+    ) as grid:  # type: PlantedWordsGrid
+        actual = [placement.word for placement in grid.placements]
+    assert list(words) == actual, f'Expected: {words} != Actual: {actual}'
+
+
+@pytest.mark.parametrize(
+    'grid_size, words',
+    (
+        (GridSize(0, 5), ('foo',)),
+        (GridSize(5, 5), ('Foo',)),
+        (GridSize(5, 5), ('',)),
+    ),
+)
+def test_invalid_planted_words_grid(
+    grid_size: GridSize, words: List[str]
+) -> None:
+    """Test a grid of invalid size or words fails to be generated.
+
+    ValueError should be raised in case of invalid grid size or words.
+    """
+    with pytest.raises(ValueError):
+        with PlantedWordsGrid(grid_size, words) as grid:  # type: Grid
+            str(grid.content)
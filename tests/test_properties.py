@@ -4,7 +4,7 @@ properties interfaces.
 """
 import pytest
 
-from puzzle.properties import Coordinate, GridSize
+from puzzle.properties import Coordinate, GridSize, WordPlacement
 
 pytestmark = pytest.mark.unittest
 
@@ -94,3 +94,11 @@ def test_invalid_grid_size() -> None:
     """
     with pytest.raises(TypeError):
         GridSize(height='Foo', width='Bar')
+
+
+def test_word_placement_as_str() -> None:
+    """Test a word placement is formatted as coordinates of found words."""
+    placement = WordPlacement('foo', Coordinate(0, 2), Coordinate(2, 0))
+    expected = 'Start at: (X0, Y2), End at: (X2, Y0)'
+    actual = str(placement)
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
@@ -1,10 +1,25 @@
 """A test suite contains a set of test cases for the puzzles interfaces."""
-from typing import List
+import re
+from itertools import product
+from typing import FrozenSet, Iterator, List, Tuple, Type
 
 import pytest
 
+from puzzle.bitmasks import BitMaskSearchPuzzle
+from puzzle.costs import AutoSearchPuzzle
+from puzzle.grids import CompactRows, GridContent
+from puzzle.indexes import (
+    DictionarySearchPuzzle,
+    NGramSearchPuzzle,
+    SuffixArraySearchPuzzle,
+)
 from puzzle.properties import Coordinate, LetterCoordinates
-from puzzle.puzzles import SearchWordPuzzle
+from puzzle.puzzles import (
+    AxialSearchWordPuzzle,
+    BoundedSearchWordPuzzle,
+    SearchPuzzle,
+    SearchWordPuzzle,
+)
 
 pytestmark = pytest.mark.unittest
 
@@ -73,6 +88,10 @@ _board_of_letters: LetterCoordinates = {
 }
 
 
+@pytest.mark.parametrize(
+    'puzzle_type',
+    (SearchWordPuzzle, BoundedSearchWordPuzzle, BitMaskSearchPuzzle),
+)
 @pytest.mark.parametrize(
     'word, coordinates',
     (
@@ -118,13 +137,13 @@ _board_of_letters: LetterCoordinates = {
     ),
 )
 def test_puzzle_search_word_coordinates(
-    word: str, coordinates: LetterCoordinates
+    puzzle_type: Type[SearchPuzzle], word: str, coordinates: LetterCoordinates
 ) -> None:
     """Test the combination of given words are found in a board of letters.
 
     The word with starting/ending coordinates are expected to be generated.
     """
-    puzzle = SearchWordPuzzle(_board_of_letters)
+    puzzle = puzzle_type(_board_of_letters)
     actual_coordinates = puzzle.coordinates(word)
     assert coordinates == actual_coordinates, (
         f'Expected: {coordinates} coordinates '
@@ -132,19 +151,41 @@ def test_puzzle_search_word_coordinates(
     )
 
 
-def test_puzzle_invalid_board_of_letters() -> None:
+@pytest.mark.parametrize(
+    'puzzle_type',
+    (
+        SearchWordPuzzle,
+        BoundedSearchWordPuzzle,
+        BitMaskSearchPuzzle,
+        NGramSearchPuzzle,
+        SuffixArraySearchPuzzle,
+    ),
+)
+def test_puzzle_invalid_board_of_letters(
+    puzzle_type: Type[SearchPuzzle],
+) -> None:
     """Test that board of letters is empty.
 
     ValueError should be raised in case if empty board of letters.
     """
-    puzzle = SearchWordPuzzle(board={})
+    puzzle = puzzle_type(board={})
     with pytest.raises(ValueError):
         puzzle.coordinates('foo')
 
 
-def test_puzzle_word_not_in_board() -> None:
+@pytest.mark.parametrize(
+    'puzzle_type',
+    (
+        SearchWordPuzzle,
+        BoundedSearchWordPuzzle,
+        BitMaskSearchPuzzle,
+        NGramSearchPuzzle,
+        SuffixArraySearchPuzzle,
+    ),
+)
+def test_puzzle_word_not_in_board(puzzle_type: Type[SearchPuzzle]) -> None:
     """Test that a given word is absent in a board of letters."""
-    puzzle = SearchWordPuzzle(
+    puzzle = puzzle_type(
         board={
             'a': [
                 Coordinate(x_axis=0, y_axis=0),
@@ -179,3 +220,366 @@ def test_puzzle_name() -> None:
         f'Expected: {expected_name} puzzle name '
         f'!= Actual: {actual_name} puzzle name'
     )
+
+
+@pytest.mark.parametrize(
+    'puzzle_type', (BoundedSearchWordPuzzle, BitMaskSearchPuzzle)
+)
+@pytest.mark.parametrize('word', ('a', 'ab', 'abc', 'cab', 'abcd'))
+def test_puzzle_matches_search_word_puzzle(
+    puzzle_type: Type[SearchPuzzle], word: str
+) -> None:
+    """Test an optimized puzzle finds the same coordinates as a plain one.
+
+    A grid of a small alphabet is used to get plenty of matches near edges.
+    """
+    board: LetterCoordinates = {
+        letter: [
+            Coordinate(index // 9, index % 9)
+            for index in range(12 * 9)
+            if 'abcd'[(index * 7 + index // 5) % 4] == letter
+        ]
+        for letter in 'abcd'
+    }
+    expected = SearchWordPuzzle(board).coordinates(word)
+    actual = puzzle_type(board).coordinates(word)
+    assert expected == actual, (
+        f'Expected: {expected} coordinates '
+        f'for "{word}" word but got {actual}'
+    )
+
+
+@pytest.mark.parametrize('word', ('aab', 'aba', 'baa', 'abab', 'aaa'))
+@pytest.mark.parametrize('limit', (0, 1, 3))
+def test_puzzle_search_rarest_letter_coordinates(word: str, limit: int) -> None:
+    """Test a search anchored on the rarest letter keeps the order of
+    coordinates of a search started from the first letter.
+
+    A grid of mostly "a" letters is used, so "b" letter is an anchor.
+    """
+    board: LetterCoordinates = GridContent(
+        [
+            ''.join(
+                'ab'[(row * 5 + column * 3) % 7 == 0] for column in range(8)
+            )
+            for row in range(10)
+        ]
+    ).to_coordinates()
+    expected = BitMaskSearchPuzzle(board).coordinates(word, limit)
+    actual = SearchWordPuzzle(board).coordinates(word, limit)
+    assert expected == actual, (
+        f'Expected: {expected} coordinates '
+        f'for "{word}" word but got {actual}'
+    )
+
+
+class _MatchCountingPuzzle(SearchWordPuzzle):
+    """The class represents a search puzzle counting matched coordinates."""
+
+    def __init__(self, board: LetterCoordinates) -> None:
+        super().__init__(board)
+        self.matched: int = 0
+
+    def _anchored_matches(
+        self, positions: Tuple[FrozenSet[str], ...], anchor: int
+    ) -> Iterator[Tuple[Tuple[int, int, int, int], str]]:
+        """Count every matched coordinates of a word."""
+        for found in super()._anchored_matches(positions, anchor):
+            self.matched += 1
+            yield found
+
+
+def test_puzzle_search_limited_rarest_letter_stops() -> None:
+    """Test a limited search stops once a limit of coordinates is found.
+
+    A search of a word with a rarer letter than its first one is not
+    anchored on the rarest letter when it is limited.
+    """
+    puzzle = _MatchCountingPuzzle(
+        GridContent(['abab', 'aaaa', 'abab', 'aaaa']).to_coordinates()
+    )
+    coordinates = puzzle.coordinates('ab', limit=1)
+    expected = 1
+    assert expected == puzzle.matched == len(coordinates), (
+        f'Expected: {expected} != Actual: {puzzle.matched} matched '
+        f'and {coordinates} coordinates'
+    )
+
+
+_abcd_rows: List[str] = [
+    ''.join('abcd'[(row * 9 + column) * 7 % 11 % 4] for column in range(9))
+    for row in range(12)
+]
+
+
+@pytest.mark.parametrize('word', ('ab', 'abc', 'cab', 'abcd', 'dcb'))
+@pytest.mark.parametrize('limit', (0, 1, 3))
+def test_axial_puzzle_matches_search_word_puzzle(word: str, limit: int) -> None:
+    """Test a puzzle walking 4 axes finds the same coordinates in the same
+    order as a puzzle walking 8 directions."""
+    board = GridContent(_abcd_rows).to_coordinates()
+    expected = SearchWordPuzzle(board).coordinates(word, limit)
+    actual = AxialSearchWordPuzzle(board).coordinates(word, limit)
+    assert expected == actual, (
+        f'Expected: {expected} coordinates '
+        f'for "{word}" word but got {actual}'
+    )
+
+
+@pytest.mark.parametrize(
+    'puzzle_type',
+    (
+        SearchWordPuzzle,
+        BoundedSearchWordPuzzle,
+        BitMaskSearchPuzzle,
+        AxialSearchWordPuzzle,
+    ),
+)
+@pytest.mark.parametrize('packed', (False, True))
+@pytest.mark.parametrize('word', ('abc', 'dcb', 'a?c', 'zoo'))
+def test_puzzle_search_compact_rows(
+    puzzle_type: Type[SearchPuzzle], packed: bool, word: str
+) -> None:
+    """Test a puzzle finds the same coordinates in a grid of compact rows
+    as in a grid of plain rows."""
+    expected = puzzle_type(
+        GridContent(_abcd_rows).to_coordinates()
+    ).coordinates(word)
+    content = GridContent(CompactRows(_abcd_rows, packed=packed))
+    actual = puzzle_type(content.to_coordinates()).coordinates(word)
+    assert expected == actual, (
+        f'Expected: {expected} coordinates '
+        f'for "{word}" word but got {actual}'
+    )
+
+
+@pytest.mark.parametrize('word', ('a', 'aa', 'aba', 'bcb', 'abba'))
+def test_axial_puzzle_reports_palindrome_once(word: str) -> None:
+    """Test every placement of a palindrome is reported once."""
+    board = GridContent(_abcd_rows).to_coordinates()
+    placements = {
+        frozenset(coordinates[10:].split(', End at: '))
+        for coordinates in SearchWordPuzzle(board).coordinates(word)
+    }
+    actual = AxialSearchWordPuzzle(board).coordinates(word)
+    assert len(placements) == len(actual) and placements == {
+        frozenset(coordinates[10:].split(', End at: '))
+        for coordinates in actual
+    }, f'Expected: {placements} placements of "{word}" but got {actual}'
+
+
+@pytest.mark.parametrize('word', ('abc', 'bcb', 'zoo'))
+def test_axial_puzzle_word_exists(word: str) -> None:
+    """Test a puzzle walking 4 axes checks a word presence."""
+    board = GridContent(_abcd_rows).to_coordinates()
+    expected = SearchWordPuzzle(board).exists(word)
+    actual = AxialSearchWordPuzzle(board).exists(word)
+    assert (
+        expected == actual
+    ), f'Expected "{word}" word presence: {expected} != Actual: {actual}'
+
+
+@pytest.mark.parametrize(
+    'puzzle_type',
+    (SearchWordPuzzle, BoundedSearchWordPuzzle, BitMaskSearchPuzzle),
+)
+@pytest.mark.parametrize('limit', (1, 2, 5, 100))
+def test_puzzle_search_limited_coordinates(
+    puzzle_type: Type[SearchPuzzle], limit: int
+) -> None:
+    """Test the search is stopped once a limit of coordinates is found.
+
+    The first found coordinates are expected to be generated.
+    """
+    puzzle = puzzle_type(_board_of_letters)
+    expected = puzzle.coordinates('is')[:limit]
+    actual = puzzle.coordinates('is', limit=limit)
+    assert expected == actual, (
+        f'Expected: {expected} coordinates ' f'for "is" word but got {actual}'
+    )
+
+
+@pytest.mark.parametrize(
+    'puzzle_type',
+    (SearchWordPuzzle, BoundedSearchWordPuzzle, BitMaskSearchPuzzle),
+)
+@pytest.mark.parametrize(
+    'word, exists',
+    (('name', True), ('is', True), ('zoo', False), ('nn', False)),
+)
+def test_puzzle_word_exists(
+    puzzle_type: Type[SearchPuzzle], word: str, exists: bool
+) -> None:
+    """Test the presence of a given word in a board of letters."""
+    actual = puzzle_type(_board_of_letters).exists(word)
+    assert (
+        exists == actual
+    ), f'Expected "{word}" word presence: {exists} != Actual: {actual}'
+
+
+@pytest.mark.parametrize(
+    'puzzle_type',
+    (SearchWordPuzzle, BoundedSearchWordPuzzle, BitMaskSearchPuzzle),
+)
+@pytest.mark.parametrize(
+    'pattern', ('a?c', '[ab]c', '[^a-c]a', 'b*', 'a*d', '?*?', 'c[bd]*a')
+)
+def test_puzzle_search_pattern_coordinates(
+    puzzle_type: Type[SearchPuzzle], pattern: str
+) -> None:
+    """Test a pattern matches the same coordinates as all of its words.
+
+    A grid of 4x4 letters is used, so every word of up to 4 letters is
+    searched to collect expected coordinates.
+    """
+    board: LetterCoordinates = {
+        letter: [
+            Coordinate(index // 4, index % 4)
+            for index in range(4 * 4)
+            if 'abcd'[(index * 7 + index // 5) % 4] == letter
+        ]
+        for letter in 'abcd'
+    }
+    expression = pattern.replace('?', '.').replace('*', '.*')
+    expected = {
+        coordinates
+        for length in range(1, 5)
+        for letters in product('abcd', repeat=length)
+        if re.fullmatch(pattern=expression, string=''.join(letters))
+        for coordinates in SearchWordPuzzle(board).coordinates(''.join(letters))
+    }
+    actual = puzzle_type(board).coordinates(pattern)
+    assert expected == set(actual), (
+        f'Expected: {expected} coordinates '
+        f'for "{pattern}" pattern but got {actual}'
+    )
+
+
+@pytest.mark.parametrize(
+    'puzzle_type',
+    (SearchWordPuzzle, BoundedSearchWordPuzzle, BitMaskSearchPuzzle),
+)
+def test_puzzle_search_limited_pattern_coordinates(
+    puzzle_type: Type[SearchPuzzle],
+) -> None:
+    """Test a pattern search is stopped once a limit is found."""
+    puzzle = puzzle_type(_board_of_letters)
+    expected = puzzle.coordinates('n?me')[:1]
+    actual = puzzle.coordinates('n?me', limit=1)
+    assert expected == actual and puzzle.exists('n?m*'), (
+        f'Expected: {expected} coordinates '
+        f'for "n?me" pattern but got {actual}'
+    )
+
+
+@pytest.mark.parametrize('pattern', ('*', '**', 'a[', '[]?', 'a[b-]', 'A?'))
+def test_puzzle_invalid_pattern(pattern: str) -> None:
+    """Test a search fails when an invalid pattern is passed."""
+    with pytest.raises(ValueError):
+        SearchWordPuzzle(_board_of_letters).coordinates(pattern)
+
+
+@pytest.mark.parametrize(
+    'puzzle_type, expected',
+    (
+        (SearchWordPuzzle, 231),
+        (BoundedSearchWordPuzzle, 179),
+        (AxialSearchWordPuzzle, 263),
+        (BitMaskSearchPuzzle, 28),
+        (NGramSearchPuzzle, 85),
+        (SuffixArraySearchPuzzle, 45),
+    ),
+)
+def test_puzzle_probe_count(
+    puzzle_type: Type[SearchPuzzle], expected: int
+) -> None:
+    """Test every engine counts the same probes of every search of a word."""
+    puzzle = puzzle_type(GridContent(_abcd_rows).to_coordinates())
+    actual = [puzzle.probe_count('abcd'), puzzle.probe_count('abcd')]
+    assert [expected] * 2 == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_puzzle_probe_count_is_not_implemented() -> None:
+    """Test an engine without counted probes fails to count them.
+
+    NotImplementedError should be raised for an engine of no probes.
+    """
+
+    class _ListPuzzle(SearchPuzzle):
+        """The class represents a search puzzle of a list of words."""
+
+        def coordinates(self, item: str, limit: int = 0) -> List[str]:
+            """Return no coordinates of a word."""
+            return []
+
+        @property
+        def name(self) -> str:
+            """Return name of a search puzzle."""
+            return '_ListPuzzle'
+
+    with pytest.raises(NotImplementedError):
+        _ListPuzzle().probe_count('abcd')
+
+
+@pytest.mark.parametrize(
+    'puzzle_type',
+    (
+        SearchWordPuzzle,
+        BoundedSearchWordPuzzle,
+        AxialSearchWordPuzzle,
+        BitMaskSearchPuzzle,
+        AutoSearchPuzzle,
+        NGramSearchPuzzle,
+        SuffixArraySearchPuzzle,
+        DictionarySearchPuzzle,
+    ),
+)
+def test_puzzle_search_many_matches_coordinates(
+    puzzle_type: Type[SearchPuzzle],
+) -> None:
+    """Test a prepared puzzle searches a batch of words the same way as it
+    searches every word one by one."""
+    words = ('ab', 'dcb', 'a?c', 'zoo', 'ab')
+    board = GridContent(_abcd_rows).to_coordinates()
+    expected = [
+        (word, puzzle_type(board).coordinates(word, limit=2)) for word in words
+    ]
+    puzzle = puzzle_type(board)
+    puzzle.prepare()
+    actual = list(puzzle.search_many(words, limit=2))
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+@pytest.mark.parametrize(
+    'puzzle_type',
+    (
+        SearchWordPuzzle,
+        BitMaskSearchPuzzle,
+        NGramSearchPuzzle,
+        SuffixArraySearchPuzzle,
+    ),
+)
+def test_puzzle_invalid_board_of_letters_is_not_prepared(
+    puzzle_type: Type[SearchPuzzle],
+) -> None:
+    """Test indexes of an empty board of letters are not built."""
+    with pytest.raises(ValueError):
+        puzzle_type({}).prepare()
+
+
+@pytest.mark.parametrize(
+    'puzzle_type, expected',
+    (
+        (SearchWordPuzzle, False),
+        (BoundedSearchWordPuzzle, True),
+        (BitMaskSearchPuzzle, True),
+        (NGramSearchPuzzle, True),
+        (SuffixArraySearchPuzzle, False),
+    ),
+)
+def test_puzzle_supports_early_exit(
+    puzzle_type: Type[SearchPuzzle], expected: bool
+) -> None:
+    """Test engines stopping a limited search early are flagged."""
+    actual = puzzle_type.SUPPORTS_EARLY_EXIT
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
@@ -0,0 +1,173 @@
+"""A test suite contains a set of test cases for the puzzle servers."""
+import socket
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from puzzle.engines import search_engine
+from puzzle.servers import (
+    Address,
+    SearchPuzzleClient,
+    SearchPuzzleServer,
+    ServerLimits,
+    _WORKER_PUZZLES,
+    _load_worker_cache,
+    _search_cached_word,
+)
+
+pytestmark = pytest.mark.unittest
+
+_rows: List[str] = ['foox', 'abcd', 'raba']
+
+
+@pytest.fixture(params=('unix', 'tcp'))
+def address(request: pytest.FixtureRequest, tmp_path: Path) -> Address:
+    """Return a Unix domain socket or a localhost TCP socket address."""
+    if request.param == 'unix':
+        return str(tmp_path / 'puzzle.sock')
+    return '127.0.0.1', 0
+
+
+@pytest.fixture()
+def server(address: Address) -> SearchPuzzleServer:
+    """Return a running search puzzle server.
+
+    The server is shut down gracefully when leaving the fixture.
+    """
+    with SearchPuzzleServer(
+        address, words=('foo',), limits=ServerLimits(max_concurrency=2)
+    ) as puzzle_server:  # type: SearchPuzzleServer
+        thread = threading.Thread(target=puzzle_server.serve_forever)
+        thread.start()
+        yield puzzle_server
+        puzzle_server.shutdown()
+        thread.join()
+
+
+def test_server_search(server: SearchPuzzleServer) -> None:
+    """Test the server searches given words in a given grid."""
+    expected: Dict[str, List[str]] = {
+        'foo': ['Start at: (X0, Y0), End at: (X0, Y2)'],
+        'bar': ['Start at: (X2, Y2), End at: (X2, Y0)'],
+        'zoo': [],
+    }
+    client = SearchPuzzleClient(server.address)
+    for _ in range(2):  # type: int
+        actual = client.search(rows=_rows, words=('foo', 'bar', 'zoo'))
+        assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_worker_keeps_recent_puzzles() -> None:
+    """Test a worker keeps prepared puzzles of recently searched grids.
+
+    A worker should search a word of a known grid by its key only and ask
+    for rows of a grid it is not aware of (or has already evicted).
+    """
+    _load_worker_cache(cache_size=1)
+    rows = tuple(_rows)
+    expected = ['Start at: (X0, Y0), End at: (X0, Y2)']
+    assert _search_cached_word(('foo', None, 'foo')) is None
+    for task in (('foo', rows, 'foo'), ('foo', None, 'foo')):
+        actual = _search_cached_word(task)
+        assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+    _search_cached_word(('bar', ('bar',), 'bar'))
+    assert _search_cached_word(('foo', None, 'foo')) is None
+
+
+def test_server_search_random_words(server: SearchPuzzleServer) -> None:
+    """Test the server searches random words from its own dictionary."""
+    expected: Dict[str, List[str]] = {
+        'foo': ['Start at: (X0, Y0), End at: (X0, Y2)']
+    }
+    actual = SearchPuzzleClient(server.address).search(
+        rows=_rows, words_limit=3
+    )
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+@pytest.mark.parametrize(
+    'rows, words',
+    ((_rows, ('Foo',)), ((), ('foo',)), (_rows, ('',))),
+)
+def test_server_invalid_request(
+    server: SearchPuzzleServer, rows: List[str], words: List[str]
+) -> None:
+    """Test the server rejects an invalid search request.
+
+    ValueError should be raised by a client in case of rejected request.
+    """
+    with pytest.raises(ValueError):
+        SearchPuzzleClient(server.address).search(rows=rows, words=words)
+
+
+@pytest.mark.parametrize(
+    'request_line',
+    (
+        b'{"rows": ["foox", "abcd"], "words": "foo"}\n',
+        b'{"rows": "foox", "words": ["foo"]}\n',
+    ),
+)
+def test_server_invalid_payload(
+    server: SearchPuzzleServer, request_line: bytes
+) -> None:
+    """Test the server rejects words or rows of a request other than list."""
+    expected = 'error'
+    actual = server._respond(request_line)['status']
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_server_engine() -> None:
+    """Test workers of the server prepare puzzles of a given engine."""
+    _load_worker_cache(
+        cache_size=1, puzzle_type=search_engine('bitmask').puzzle_type
+    )
+    _search_cached_word(('bar', tuple(_rows), 'bar'))
+    expected = 'BitMaskSearchPuzzle'
+    actual = type(_WORKER_PUZZLES['bar']).__name__
+    _load_worker_cache(cache_size=32)
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_server_unknown_engine() -> None:
+    """Test the server is not created with an unknown engine.
+
+    ValueError should be raised in case of unknown engine.
+    """
+    with pytest.raises(ValueError):
+        SearchPuzzleServer(('127.0.0.1', 0), engine='foo')
+
+
+def test_server_is_not_started() -> None:
+    """Test the server is not able to serve requests before it is started.
+
+    ValueError should be raised in case of not started server.
+    """
+    with pytest.raises(ValueError):
+        SearchPuzzleServer(('127.0.0.1', 0)).serve_forever()
+
+
+def test_server_keeps_other_file(tmp_path: Path) -> None:
+    """Test the server is not started over a file other than socket.
+
+    ValueError should be raised and a file should be kept as it is.
+    """
+    path = tmp_path / 'puzzle.sock'
+    path.write_text('foo')
+    with pytest.raises(ValueError):
+        SearchPuzzleServer(str(path)).start()
+    assert path.read_text() == 'foo', 'Expected: foo file is kept'
+
+
+def test_server_replaces_stale_socket(tmp_path: Path) -> None:
+    """Test the server is started over a stale socket of a socket path."""
+    path = str(tmp_path / 'puzzle.sock')
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(path)
+    with SearchPuzzleServer(
+        path, limits=ServerLimits(max_concurrency=1)
+    ) as server:  # type: SearchPuzzleServer
+        expected: Address = path
+        actual = server.address
+        assert expected == actual, f'Expected: {expected} != Actual: {actual}'
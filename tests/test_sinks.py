@@ -0,0 +1,101 @@
+"""A test suite contains a set of test cases for the puzzle sinks."""
+from io import StringIO
+from typing import List, Tuple
+
+import pytest
+
+from puzzle.sinks import CallbackSink, CsvSink, JsonLinesSink, LogSink, Sink
+
+pytestmark = pytest.mark.unittest
+
+_coordinates: List[str] = [
+    'Start at: (X0, Y0), End at: (X0, Y2)',
+    'Start at: (X1, Y0), End at: (X1, Y2)',
+]
+
+
+def test_json_lines_sink() -> None:
+    """Test the sink writes a JSON line for every found coordinates."""
+    stream = StringIO()
+    with JsonLinesSink(stream) as sink:  # type: Sink
+        sink.write('foo', _coordinates)
+        sink.write('bar', [])
+    expected = (
+        '{"word": "foo", "coordinates": "Start at: (X0, Y0), End at: (X0, Y2)"}\n'
+        '{"word": "foo", "coordinates": "Start at: (X1, Y0), End at: (X1, Y2)"}\n'
+    )
+    assert (
+        expected == stream.getvalue()
+    ), f'Expected: {expected} != Actual: {stream.getvalue()}'
+
+
+def test_json_lines_sink_time_out() -> None:
+    """Test the sink writes a JSON line of a timed out word."""
+    stream = StringIO()
+    with JsonLinesSink(stream) as sink:  # type: Sink
+        sink.time_out('foo')
+    expected = '{"word": "foo", "status": "timed-out"}\n'
+    assert (
+        expected == stream.getvalue()
+    ), f'Expected: {expected} != Actual: {stream.getvalue()}'
+
+
+def test_csv_sink() -> None:
+    """Test the sink writes a CSV row for every found coordinates."""
+    stream = StringIO()
+    with CsvSink(stream) as sink:  # type: Sink
+        sink.write('foo', _coordinates)
+    expected = (
+        'word,coordinates\r\n'
+        'foo,"Start at: (X0, Y0), End at: (X0, Y2)"\r\n'
+        'foo,"Start at: (X1, Y0), End at: (X1, Y2)"\r\n'
+    )
+    assert (
+        expected == stream.getvalue()
+    ), f'Expected: {expected} != Actual: {stream.getvalue()}'
+
+
+def test_csv_sink_time_out() -> None:
+    """Test the sink writes a CSV row of a timed out word."""
+    stream = StringIO()
+    with CsvSink(stream) as sink:  # type: Sink
+        sink.time_out('foo')
+    expected = 'word,coordinates\r\nfoo,timed-out\r\n'
+    assert (
+        expected == stream.getvalue()
+    ), f'Expected: {expected} != Actual: {stream.getvalue()}'
+
+
+def test_buffered_sink() -> None:
+    """Test the sink writes buffered results in bulk.
+
+    Results are written once a buffer is full or a sink is flushed.
+    """
+    stream = StringIO()
+    sink = JsonLinesSink(stream, buffer_size=3)
+    sink.write('foo', _coordinates)
+    assert not stream.getvalue(), f'Unexpected "{stream.getvalue()}" output'
+    sink.write('bar', _coordinates)
+    assert len(stream.getvalue().splitlines()) == 4, stream.getvalue()
+    sink.write('baz', _coordinates[:1])
+    sink.flush()
+    assert len(stream.getvalue().splitlines()) == 5, stream.getvalue()
+
+
+def test_callback_sink() -> None:
+    """Test the sink calls back for every found coordinates."""
+    actual: List[Tuple[str, str]] = []
+    with CallbackSink(
+        lambda word, coordinates: actual.append((word, coordinates))
+    ) as sink:  # type: Sink
+        sink.write('foo', _coordinates)
+        sink.write('bar', [])
+    expected = [('foo', coordinate) for coordinate in _coordinates]
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_log_sink() -> None:
+    """Test the sink logs found and absent words."""
+    with LogSink() as sink:  # type: Sink
+        sink.write('foo', _coordinates)
+        sink.write('bar', [])
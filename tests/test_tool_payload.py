@@ -3,9 +3,18 @@ from pathlib import Path
 
 import pytest
 
-from puzzle.__main__ import (
+from puzzle.__main__ import _batch_grids
+from puzzle.options import (
+    _dictionary_words,
     _random_words,
+    _validate_puzzle_all_words,
+    _validate_puzzle_executor,
     _validate_puzzle_grid_size,
+    _validate_puzzle_manifest_path,
+    _validate_puzzle_max_memory,
+    _validate_puzzle_output_format,
+    _validate_puzzle_pattern,
+    _validate_puzzle_timeouts,
     _validate_puzzle_word,
     _validate_puzzle_words_path,
 )
@@ -51,6 +60,24 @@ def test_invalid_puzzle_word(word: str) -> None:
         _validate_puzzle_word(word)
 
 
+@pytest.mark.parametrize(
+    'pattern', ('f?o', 'fo*', '[bc]at', '[^a-e]?', 'f[a-cx]*o')
+)
+def test_valid_puzzle_pattern(pattern: str) -> None:
+    """Test the puzzle tool is able to handle valid pattern of words."""
+    _validate_puzzle_pattern(pattern)
+
+
+@pytest.mark.parametrize('pattern', ('', '*', '**', 'F?', '[]a', 'a[b', '[a-]'))
+def test_invalid_puzzle_pattern(pattern: str) -> None:
+    """Test the puzzle tool fails when invalid pattern parameter is passed.
+
+    ValueError should be raised in case of invalid puzzle tool parameter.
+    """
+    with pytest.raises(ValueError):
+        _validate_puzzle_pattern(pattern)
+
+
 def test_invalid_puzzle_words_path() -> None:
     """Test the puzzle tool fails when invalid words path file
     parameter is passed.
@@ -71,3 +98,133 @@ def test_random_words() -> None:
         f'Expected N words: {expected_amount_words} '
         f'!= Actual N words: {actual_amount_words}'
     )
+
+
+@pytest.mark.parametrize('limit, expected', ((5, 5), (100, 20)))
+def test_unique_random_words(limit: int, expected: int) -> None:
+    """Test the puzzle random words are sampled without replacement.
+
+    At most all distinct words of a test file of words are invoked.
+    """
+    words = tuple(_random_words(_test_path, limit, unique=True))
+    actual = len(set(words))
+    assert (
+        expected == actual == len(words)
+    ), f'Expected N unique words: {expected} != Actual words: {words}'
+
+
+@pytest.mark.parametrize(
+    'path', (Path('grids.txt'), Path('grids.json'), Path('grids'))
+)
+def test_invalid_puzzle_manifest_path(path: Path) -> None:
+    """Test the puzzle tool fails when invalid batch manifest file
+    parameter is passed.
+
+    ValueError should be raised in case of invalid puzzle tool parameter.
+    """
+    with pytest.raises(ValueError):
+        _validate_puzzle_manifest_path(path)
+
+
+def test_batch_grids(tmp_path: Path) -> None:
+    """Test the puzzle batch grids are invoked from a manifest file."""
+    manifest = tmp_path / 'grids.jsonl'
+    manifest.write_text(
+        '{"id": "first", "rows": ["ab", "cd"]}\n\n{"id": 2, "rows": ["e"]}\n'
+    )
+    _validate_puzzle_manifest_path(manifest)
+    expected_grids = [('first', ['ab', 'cd']), ('2', ['e'])]
+    actual_grids = list(_batch_grids(manifest))
+    assert expected_grids == actual_grids, (
+        f'Expected grids: {expected_grids} ' f'!= Actual grids: {actual_grids}'
+    )
+
+
+@pytest.mark.parametrize('output_format', ('', 'json', 'CSV', 'xml'))
+def test_invalid_puzzle_output_format(output_format: str) -> None:
+    """Test the puzzle tool fails when invalid output format parameter
+    is passed.
+
+    ValueError should be raised in case of invalid puzzle tool parameter.
+    """
+    with pytest.raises(ValueError):
+        _validate_puzzle_output_format(output_format)
+
+
+@pytest.mark.parametrize('output_format', ('log', 'jsonl', 'csv'))
+def test_valid_puzzle_output_format(output_format: str) -> None:
+    """Test the puzzle tool is able to handle valid output format."""
+    _validate_puzzle_output_format(output_format)
+
+
+@pytest.mark.parametrize('executor', ('', 'processes', 'Thread', 'fiber'))
+def test_invalid_puzzle_executor(executor: str) -> None:
+    """Test the puzzle tool fails when invalid executor parameter is passed.
+
+    ValueError should be raised in case of invalid puzzle tool parameter.
+    """
+    with pytest.raises(ValueError):
+        _validate_puzzle_executor(executor)
+
+
+@pytest.mark.parametrize('executor', ('auto', 'process', 'thread', 'inline'))
+def test_valid_puzzle_executor(executor: str) -> None:
+    """Test the puzzle tool is able to handle valid executor."""
+    _validate_puzzle_executor(executor)
+
+
+@pytest.mark.parametrize('max_memory', ('', '0', '-1G', '1.5G', '4X', 'G'))
+def test_invalid_puzzle_max_memory(max_memory: str) -> None:
+    """Test the puzzle tool fails when invalid memory budget is passed.
+
+    ValueError should be raised in case of invalid puzzle tool parameter.
+    """
+    with pytest.raises(ValueError):
+        _validate_puzzle_max_memory(max_memory)
+
+
+@pytest.mark.parametrize('max_memory', ('1024', '512M', '4G', '2gb'))
+def test_valid_puzzle_max_memory(max_memory: str) -> None:
+    """Test the puzzle tool is able to handle valid memory budget."""
+    _validate_puzzle_max_memory(max_memory)
+
+
+@pytest.mark.parametrize(
+    'word, min_length, top', (('foo', 1, 0), ('', 0, 0), ('', 1, -1))
+)
+def test_invalid_puzzle_all_words(word: str, min_length: int, top: int) -> None:
+    """Test the puzzle tool fails when invalid all words options are passed.
+
+    ValueError should be raised in case of invalid puzzle tool parameter.
+    """
+    with pytest.raises(ValueError):
+        _validate_puzzle_all_words(word, min_length, top)
+
+
+@pytest.mark.parametrize(
+    'timeout, word_timeout, max_worker_tasks',
+    ((-1, 0, 0), (0, -0.5, 0), (0, 0, -1)),
+)
+def test_invalid_puzzle_timeouts(
+    timeout: float, word_timeout: float, max_worker_tasks: int
+) -> None:
+    """Test the puzzle tool fails when invalid timeouts are passed.
+
+    ValueError should be raised in case of invalid puzzle tool parameter.
+    """
+    with pytest.raises(ValueError):
+        _validate_puzzle_timeouts(timeout, word_timeout, max_worker_tasks)
+
+
+def test_valid_puzzle_timeouts() -> None:
+    """Test the puzzle tool is able to handle valid timeouts."""
+    _validate_puzzle_timeouts(30, 0.5, 100)
+
+
+def test_dictionary_words(tmp_path: Path) -> None:
+    """Test distinct words of a dictionary are read in the order of a file."""
+    path = tmp_path / 'words.txt'
+    path.write_text('foo\nbar\nfoo\nbaz\n')
+    expected = ['foo', 'bar', 'baz']
+    actual = _dictionary_words(path)
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
@@ -0,0 +1,598 @@
+"""A test suite contains a set of test cases for the puzzle tools."""
+import json
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from io import StringIO
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import pytest
+
+from puzzle.costs import AutoSearchPuzzle, SearchCostModel
+from puzzle.executors import create_executor
+from puzzle.grids import (
+    Grid,
+    GridContent,
+    MappedGrid,
+    ProceduralGrid,
+    RandomWordsGrid,
+)
+from puzzle.indexes import DictionarySearchPuzzle
+from puzzle.properties import GridSize, LetterCoordinates
+from puzzle.puzzles import SearchWordPuzzle, is_word_pattern
+from puzzle.sinks import CallbackSink
+from puzzle.tools import (
+    BatchGrid,
+    SearchBounds,
+    start_all_words_search_puzzle,
+    start_batch_search_puzzle,
+    start_tiled_search_puzzle,
+    start_word_search_puzzle,
+    start_words_search_puzzle,
+)
+from puzzle.words import HiddenWord, HiddenWords
+
+pytestmark = pytest.mark.unittest
+
+_batch_grids: Sequence[BatchGrid] = (
+    ('first', ['foox', 'abcd', 'raba']),
+    ('second', ['zzz', 'zzz']),
+    ('third', ['rab']),
+)
+
+_board: LetterCoordinates = GridContent(
+    ['foox', 'abcd', 'raba']
+).to_coordinates()
+
+
+class _PreparedPuzzle(SearchWordPuzzle):
+    """The class represents a search puzzle counting its preparations."""
+
+    preparations: List[int] = []
+
+    def prepare(self) -> None:
+        """Count a preparation of a board."""
+        self.preparations.append(id(self._board))
+        super().prepare()
+
+
+def test_word_search_puzzle() -> None:
+    """Test the word is searched and its coordinates are returned."""
+    expected = ['Start at: (X2, Y2), End at: (X2, Y0)']
+    actual = start_word_search_puzzle(HiddenWord(_board, 'bar'))
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+@pytest.mark.parametrize('executor_kind', ('process', 'thread', 'inline'))
+def test_words_search_puzzle_sink(executor_kind: str) -> None:
+    """Test the words search streams found coordinates to a sink."""
+    actual: List[Tuple[str, str]] = []
+    start_words_search_puzzle(
+        HiddenWords(_board, iter(('foo', 'zoo', 'bar'))),
+        CallbackSink(
+            lambda word, coordinate: actual.append((word, coordinate))
+        ),
+        executor=create_executor(executor_kind),
+    )
+    expected = [
+        ('bar', 'Start at: (X2, Y2), End at: (X2, Y0)'),
+        ('foo', 'Start at: (X0, Y0), End at: (X0, Y2)'),
+    ]
+    assert expected == sorted(
+        actual
+    ), f'Expected: {expected} != Actual: {actual}'
+
+
+@pytest.mark.parametrize('executor_kind', ('thread', 'inline'))
+def test_words_search_puzzle_prepared_once(executor_kind: str) -> None:
+    """Test the words search prepares a puzzle of a board once per worker."""
+    _PreparedPuzzle.preparations.clear()
+    returned = start_words_search_puzzle(
+        HiddenWords(_board, iter(('foo', 'zoo', 'bar', 'b?r'))),
+        CallbackSink(lambda *_: None),
+        executor=create_executor(executor_kind, workers=1),
+        puzzle_type=_PreparedPuzzle,
+    )
+    expected = 1
+    actual = len(_PreparedPuzzle.preparations)
+    assert (
+        expected == actual and not returned
+    ), f'Expected: {expected} != Actual: {actual}'
+
+
+class _ConcurrentPuzzle(SearchWordPuzzle):
+    """The class represents a search puzzle prepared along with another."""
+
+    barrier: threading.Barrier = threading.Barrier(2, timeout=10)
+
+    def prepare(self) -> None:
+        """Wait for a puzzle of another search to be prepared."""
+        self.barrier.wait()
+        super().prepare()
+
+
+def _searched_words(rows: List[str]) -> Dict[str, List[str]]:
+    """Return found coordinates of words in a board of rows.
+
+    Args:
+        rows: (list) rows of a board.
+
+    Returns:
+        dict: found coordinates of every word.
+    """
+    actual: Dict[str, List[str]] = {}
+    start_words_search_puzzle(
+        HiddenWords(
+            GridContent(rows).to_coordinates(), iter(('foo', 'zzz', 'bar'))
+        ),
+        CallbackSink(
+            lambda word, coordinate: actual.setdefault(word, []).append(
+                coordinate
+            )
+        ),
+        executor=create_executor('inline'),
+        puzzle_type=_ConcurrentPuzzle,
+    )
+    return actual
+
+
+@pytest.mark.parametrize('executor_kind', ('process', 'inline'))
+def test_words_search_puzzle_type(executor_kind: str) -> None:
+    """Test the words search picks an engine of every word within workers."""
+    actual: List[Tuple[str, str]] = []
+    start_words_search_puzzle(
+        HiddenWords(_board, iter(('foo', 'zoo', 'bar'))),
+        CallbackSink(
+            lambda word, coordinate: actual.append((word, coordinate))
+        ),
+        executor=create_executor(executor_kind),
+        puzzle_type=partial(
+            AutoSearchPuzzle, cost_model=SearchCostModel(mask_cost=0.0)
+        ),
+    )
+    expected = [
+        ('bar', 'Start at: (X2, Y2), End at: (X2, Y0)'),
+        ('foo', 'Start at: (X0, Y0), End at: (X0, Y2)'),
+    ]
+    assert expected == sorted(
+        actual
+    ), f'Expected: {expected} != Actual: {actual}'
+
+
+_searched: List[str] = []
+
+
+class _CountingPuzzle(SearchWordPuzzle):
+    """The class represents a search puzzle keeping searched words."""
+
+    def coordinates(self, item: str, limit: int = 0) -> List[str]:
+        """Keep a searched word and return its coordinates."""
+        _searched.append(item)
+        return super().coordinates(item, limit)
+
+
+class _PlainWordsPuzzle(SearchWordPuzzle):
+    """The class represents a search puzzle of plain words only."""
+
+    SUPPORTS_PATTERNS = False
+
+    def coordinates(self, item: str, limit: int = 0) -> List[str]:
+        """Return coordinates of a plain word only."""
+        if is_word_pattern(item):
+            raise ValueError(f'Unexpected "{item}" pattern')
+        return super().coordinates(item, limit)
+
+
+class _StallingPuzzle(SearchWordPuzzle):
+    """The class represents a search puzzle stalling on `zoo` word."""
+
+    def coordinates(self, item: str, limit: int = 0) -> List[str]:
+        """Stall on `zoo` word and return coordinates of a word."""
+        if item == 'zoo':
+            time.sleep(5)
+        return super().coordinates(item, limit)
+
+
+class _SlowPreparedPuzzle(SearchWordPuzzle):
+    """The class represents a search puzzle slowly prepared."""
+
+    def prepare(self) -> None:
+        """Prepare a board slower than a word timeout."""
+        time.sleep(0.5)
+        super().prepare()
+
+
+class _TimedOutSink(CallbackSink):
+    """The class represents a sink keeping timed out words."""
+
+    def __init__(self, callback: Callable[[str, str], None]) -> None:
+        super().__init__(callback)
+        self.timed_out: List[str] = []
+
+    def time_out(self, word: str) -> None:
+        """Keep a timed out word."""
+        self.timed_out.append(word)
+
+
+def test_concurrent_words_search_puzzles() -> None:
+    """Test concurrent words searches keep their boards apart."""
+    expected = [
+        {'foo': ['Start at: (X0, Y0), End at: (X0, Y2)']},
+        {
+            'zzz': [
+                'Start at: (X0, Y0), End at: (X0, Y2)',
+                'Start at: (X0, Y2), End at: (X0, Y0)',
+            ]
+        },
+    ]
+    with ThreadPoolExecutor(2) as executor:  # type: ThreadPoolExecutor
+        actual = list(
+            executor.map(_searched_words, (['foox', 'abcd'], ['zzz', 'abc']))
+        )
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+@pytest.mark.parametrize(
+    'executor_kind, timeout, word_timeout',
+    (
+        ('process', 0, 0.5),
+        ('inline', 0, 0.5),
+        ('process', 1, 0),
+        ('thread', 1, 0),
+        ('inline', 1, 0),
+    ),
+)
+def test_words_search_puzzle_timeout(
+    executor_kind: str, timeout: float, word_timeout: float
+) -> None:
+    """Test a stalled word is reported as timed out along with results."""
+    actual: List[Tuple[str, str]] = []
+    sink = _TimedOutSink(
+        lambda word, coordinate: actual.append((word, coordinate))
+    )
+    start: float = time.monotonic()
+    returned = start_words_search_puzzle(
+        HiddenWords(_board, iter(('foo', 'bar', 'zoo', 'zoo'))),
+        sink,
+        executor=create_executor(executor_kind, workers=2),
+        puzzle_type=_StallingPuzzle,
+        bounds=SearchBounds(timeout=timeout, word_timeout=word_timeout),
+    )
+    seconds: float = time.monotonic() - start
+    expected = [
+        ('bar', 'Start at: (X2, Y2), End at: (X2, Y0)'),
+        ('foo', 'Start at: (X0, Y0), End at: (X0, Y2)'),
+    ]
+    assert expected == sorted(actual) and seconds < 4, (
+        f'Expected: {expected} within 4 seconds '
+        f'!= Actual: {actual} within {seconds} seconds'
+    )
+    assert (
+        ['zoo', 'zoo'] == sink.timed_out == returned
+    ), f'Expected: {["zoo", "zoo"]} != Actual: {sink.timed_out} and {returned}'
+
+
+def test_words_search_puzzle_word_timeout_prepared() -> None:
+    """Test a preparation of a puzzle is not bound by a word timeout."""
+    actual: List[Tuple[str, str]] = []
+    returned = start_words_search_puzzle(
+        HiddenWords(_board, iter(('foo', 'bar'))),
+        CallbackSink(
+            lambda word, coordinate: actual.append((word, coordinate))
+        ),
+        executor=create_executor('inline'),
+        puzzle_type=_SlowPreparedPuzzle,
+        bounds=SearchBounds(word_timeout=0.2),
+    )
+    expected = [
+        ('bar', 'Start at: (X2, Y2), End at: (X2, Y0)'),
+        ('foo', 'Start at: (X0, Y0), End at: (X0, Y2)'),
+    ]
+    assert expected == sorted(actual) and not returned, (
+        f'Expected: {expected} != Actual: {actual} ' f'and {returned} timed out'
+    )
+
+
+def test_words_search_puzzle_passed_deadline() -> None:
+    """Test words are not searched once a deadline of a search passes."""
+    _searched.clear()
+    actual = start_words_search_puzzle(
+        HiddenWords(_board, iter(('foo', 'bar'))),
+        executor=create_executor('inline'),
+        puzzle_type=_CountingPuzzle,
+        bounds=SearchBounds(timeout=1e-9),
+    )
+    assert ['foo', 'bar'] == sorted(actual, reverse=True) and not _searched, (
+        f'Expected: {["foo", "bar"]} timed out and none searched '
+        f'!= Actual: {actual} timed out and {_searched} searched'
+    )
+
+
+def test_word_search_puzzle_pattern_fallback() -> None:
+    """Test a pattern is searched by a plain search puzzle if an engine
+    does not support patterns."""
+    expected = start_word_search_puzzle(HiddenWord(_board, 'b?r'))
+    actual = start_word_search_puzzle(
+        HiddenWord(_board, 'b?r'), puzzle_type=_PlainWordsPuzzle
+    )
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+@pytest.mark.parametrize('executor_kind', ('process', 'thread', 'inline'))
+@pytest.mark.parametrize(
+    'words',
+    (
+        ('ab', 'ba', 'ab', 'cab', 'bac', 'dcb', 'ab'),
+        ('a', 'a', 'abcd', 'dcba', 'zoo', 'ooz', 'abba', 'abba'),
+    ),
+)
+def test_words_search_puzzle_repeated_words(
+    executor_kind: str, words: Tuple[str, ...]
+) -> None:
+    """Test repeated and reversed words are reported for every copy in the
+    same order as a plain search."""
+    board = GridContent(
+        [
+            ''.join(
+                'abcd'[(row * 9 + column) * 7 % 11 % 4] for column in range(9)
+            )
+            for row in range(12)
+        ]
+    ).to_coordinates()
+    actual: List[Tuple[str, str]] = []
+    start_words_search_puzzle(
+        HiddenWords(board, iter(words)),
+        CallbackSink(
+            lambda word, coordinate: actual.append((word, coordinate))
+        ),
+        executor=create_executor(executor_kind),
+    )
+    expected = [
+        (word, coordinate)
+        for word in words
+        for coordinate in SearchWordPuzzle(board).coordinates(word)
+    ]
+    assert sorted(expected, key=lambda found: found[0]) == sorted(
+        actual, key=lambda found: found[0]
+    ), f'Expected: {expected} != Actual: {actual}'
+
+
+def test_words_search_puzzle_searches_unique_words() -> None:
+    """Test repeated and reversed words are searched once."""
+    _searched.clear()
+    start_words_search_puzzle(
+        HiddenWords(_board, iter(('foo', 'oof', 'foo', 'bar', 'rab', 'ab'))),
+        executor=create_executor('inline'),
+        puzzle_type=_CountingPuzzle,
+    )
+    expected = ['foo', 'bar', 'ab']
+    assert expected == _searched, f'Expected: {expected} != Actual: {_searched}'
+
+
+@pytest.mark.parametrize('limit', (1, 2, 3))
+def test_words_search_puzzle_limit(limit: int) -> None:
+    """Test the words search is stopped once a limit of coordinates is found.
+
+    Coordinates over a limit are not streamed to a sink.
+    """
+    actual: List[Tuple[str, str]] = []
+    start_words_search_puzzle(
+        HiddenWords(_board, iter(('ab', 'ba', 'foo', 'bar'))),
+        CallbackSink(
+            lambda word, coordinate: actual.append((word, coordinate))
+        ),
+        bounds=SearchBounds(limit=limit),
+    )
+    assert limit == len(actual), f'Expected {limit} coordinates: {actual}'
+
+
+@pytest.mark.parametrize('executor_kind', ('process', 'thread', 'inline'))
+def test_batch_search_puzzle(executor_kind: str) -> None:
+    """Test the batch of grids is searched for a set of words.
+
+    Only found words are streamed as JSON lines in the order of grids.
+    """
+    output = StringIO()
+    start_batch_search_puzzle(
+        grids=iter(_batch_grids),
+        words=('foo', 'bar'),
+        output=output,
+        executor_kind=executor_kind,
+    )
+    actual: List[dict] = [
+        json.loads(line) for line in output.getvalue().splitlines()
+    ]
+    expected: List[dict] = [
+        {
+            'grid': 'first',
+            'word': 'foo',
+            'coordinates': ['Start at: (X0, Y0), End at: (X0, Y2)'],
+        },
+        {
+            'grid': 'first',
+            'word': 'bar',
+            'coordinates': ['Start at: (X2, Y2), End at: (X2, Y0)'],
+        },
+        {
+            'grid': 'third',
+            'word': 'bar',
+            'coordinates': ['Start at: (X0, Y2), End at: (X0, Y0)'],
+        },
+    ]
+    assert (
+        expected == actual
+    ), f'Expected batch results: {expected} != Actual: {actual}'
+
+
+def test_batch_search_puzzle_engine() -> None:
+    """Test the batch of grids is searched with a given search engine."""
+    expected = StringIO()
+    start_batch_search_puzzle(
+        grids=iter(_batch_grids),
+        words=('foo', 'bar', 'zoo'),
+        output=expected,
+        executor_kind='inline',
+    )
+    actual = StringIO()
+    start_batch_search_puzzle(
+        grids=iter(_batch_grids),
+        words=('foo', 'bar', 'zoo'),
+        output=actual,
+        executor_kind='inline',
+        puzzle_type=DictionarySearchPuzzle,
+    )
+    assert (
+        expected.getvalue() == actual.getvalue()
+    ), f'Expected: {expected.getvalue()} != Actual: {actual.getvalue()}'
+
+
+def test_empty_batch_search_puzzle() -> None:
+    """Test nothing is streamed for an empty batch of grids."""
+    output = StringIO()
+    start_batch_search_puzzle(grids=iter(()), words=('foo',), output=output)
+    assert not output.getvalue(), f'Unexpected "{output.getvalue()}" output'
+
+
+_abc_weights: List[float] = [
+    float(letter in 'abc') for letter in 'abcdefghijklmnopqrstuvwxyz'
+]
+
+
+@pytest.mark.parametrize('executor_kind', ('process', 'thread', 'inline'))
+@pytest.mark.parametrize('tile_size', (1, 7, 64))
+def test_tiled_search_puzzle(executor_kind: str, tile_size: int) -> None:
+    """Test tiles of a grid are searched for the same coordinates as
+    a whole grid with no duplicates at tile boundaries."""
+    words = ('ab', 'cab', 'abca', 'c')
+    actual: List[Tuple[str, str]] = []
+    with RandomWordsGrid(
+        GridSize(20, 30), _abc_weights, seed=7
+    ) as grid:  # type: Grid
+        start_tiled_search_puzzle(
+            grid,
+            words,
+            CallbackSink(
+                lambda word, coordinate: actual.append((word, coordinate))
+            ),
+            tile_size,
+            executor_kind,
+        )
+        puzzle = SearchWordPuzzle(grid.content.to_coordinates())
+    expected = Counter(
+        (word, coordinate)
+        for word in words
+        for coordinate in puzzle.coordinates(word)
+    )
+    assert expected == Counter(
+        actual
+    ), f'Expected: {expected} != Actual: {Counter(actual)}'
+
+
+def test_tiled_search_procedural_grid() -> None:
+    """Test tiles of a procedural grid are searched by workers sharing
+    a seed of a grid only."""
+    words = ('ab', 'ba', 'x')
+    actual: List[Tuple[str, str]] = []
+    with ProceduralGrid(GridSize(30, 30), seed=3) as grid:  # type: Grid
+        start_tiled_search_puzzle(
+            grid,
+            words,
+            CallbackSink(
+                lambda word, coordinate: actual.append((word, coordinate))
+            ),
+            tile_size=8,
+            executor_kind='process',
+        )
+        puzzle = SearchWordPuzzle(grid.content.to_coordinates())
+    expected = Counter(
+        (word, coordinate)
+        for word in words
+        for coordinate in puzzle.coordinates(word)
+    )
+    assert expected == Counter(
+        actual
+    ), f'Expected: {expected} != Actual: {Counter(actual)}'
+
+
+def test_tiled_search_mapped_grid(tmp_path: Path) -> None:
+    """Test tiles of a memory-mapped grid are searched."""
+    path = tmp_path / 'grid.txt'
+    path.write_text('foox\nabcd\nraba\n')
+    actual: List[Tuple[str, str]] = []
+    with MappedGrid(path) as grid:  # type: Grid
+        start_tiled_search_puzzle(
+            grid,
+            ('foo', 'bar'),
+            CallbackSink(
+                lambda word, coordinate: actual.append((word, coordinate))
+            ),
+            tile_size=2,
+            executor_kind='process',
+        )
+    expected = [
+        ('foo', 'Start at: (X0, Y0), End at: (X0, Y2)'),
+        ('bar', 'Start at: (X2, Y2), End at: (X2, Y0)'),
+    ]
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+@pytest.mark.parametrize(
+    'words, tile_size', ((('foo',), 0), ((), 2), (('foo', ''), 2))
+)
+def test_invalid_tiled_search_puzzle(
+    words: Sequence[str], tile_size: int
+) -> None:
+    """Test tiles are not searched for invalid words or tile size.
+
+    ValueError should be raised in case of invalid parameters.
+    """
+    with pytest.raises(ValueError):
+        with RandomWordsGrid(GridSize(2, 2), seed=1) as grid:  # type: Grid
+            start_tiled_search_puzzle(grid, words, tile_size=tile_size)
+
+
+def test_all_words_search_puzzle() -> None:
+    """Test every dictionary word of a grid is streamed in a single pass
+    with the same coordinates as a search of every word."""
+    words = ('foo', 'bar', 'ab', 'zoo', 'o', 'aba')
+    actual: List[Tuple[str, str]] = []
+    found = start_all_words_search_puzzle(
+        _board,
+        words,
+        CallbackSink(
+            lambda word, coordinate: actual.append((word, coordinate))
+        ),
+    )
+    puzzle = SearchWordPuzzle(_board)
+    expected = sorted(
+        (word, coordinate)
+        for word in words
+        for coordinate in puzzle.coordinates(word)
+    )
+    assert expected == sorted(
+        actual
+    ), f'Expected: {expected} != Actual: {actual}'
+    assert sorted(found) == ['ab', 'aba', 'bar', 'foo', 'o']
+
+
+@pytest.mark.parametrize(
+    'min_length, top, expected',
+    ((1, 1, ['foox']), (3, 0, ['foox', 'bar', 'aba']), (5, 0, [])),
+)
+def test_all_words_search_puzzle_ranking(
+    min_length: int, top: int, expected: List[str]
+) -> None:
+    """Test only the longest words or words of a minimum length are kept."""
+    actual = start_all_words_search_puzzle(
+        _board,
+        ('ab', 'foox', 'o', 'bar', 'aba'),
+        CallbackSink(lambda word, coordinate: None),
+        min_length,
+        top,
+    )
+    assert sorted(expected) == sorted(
+        actual
+    ), f'Expected: {expected} != Actual: {actual}'
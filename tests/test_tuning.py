@@ -0,0 +1,118 @@
+"""A test suite contains a set of test cases for the puzzle search engines
+tuning."""
+from dataclasses import astuple
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+from puzzle import tuning
+from puzzle.costs import SearchCostModel
+from puzzle.properties import GridSize
+from puzzle.tuning import (
+    calibrate,
+    compiled_modules,
+    load_cost_model,
+    plan_executor,
+    save_cost_model,
+)
+
+pytestmark = pytest.mark.unittest
+
+
+def test_calibrate() -> None:
+    """Test every cost of search engines is measured on a machine."""
+    cost_model = calibrate(GridSize(60, 60), repeat=1)
+    assert all(
+        cost >= 0 for cost in astuple(cost_model)
+    ), f'Expected: non-negative costs != Actual: {cost_model}'
+    assert cost_model.walk_cost > 0, f'Actual: {cost_model} costs'
+
+
+def test_save_cost_model(tmp_path: Path) -> None:
+    """Test stored costs of search engines are loaded back."""
+    path = tmp_path / 'nested' / 'calibration.json'
+    expected = SearchCostModel(walk_cost=1.0, mask_cost=2.0)
+    save_cost_model(expected, path)
+    actual = load_cost_model(path)
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+@pytest.mark.parametrize('content', ('', '{"walk_cost": "fast"}', '[1]'))
+def test_load_invalid_cost_model(tmp_path: Path, content: str) -> None:
+    """Test default costs are loaded if stored costs are invalid."""
+    path = tmp_path / 'calibration.json'
+    path.write_text(content)
+    expected = SearchCostModel()
+    actual = load_cost_model(path)
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_load_missing_cost_model(tmp_path: Path) -> None:
+    """Test default costs are loaded if a machine is not calibrated."""
+    expected = SearchCostModel()
+    actual = load_cost_model(tmp_path / 'calibration.json')
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+@pytest.mark.parametrize(
+    'cells, words, cost_model, expected',
+    (
+        (100, ('foo',) * 8, SearchCostModel(), ('inline', 1)),
+        (10**6, ('foo',), SearchCostModel(), ('inline', 1)),
+        (2500, ('foo', 'bar') * 4, SearchCostModel(), ('inline', 1)),
+        (10**4, ('foo',) * 4000, SearchCostModel(), ('process', 4)),
+        (
+            10**6,
+            ('foo',) * 8,
+            SearchCostModel(walk_cost=1.0, mask_cost=1.0, dispatch_cost=0.0),
+            ('process', 4),
+        ),
+    ),
+)
+def test_plan_executor(
+    monkeypatch: pytest.MonkeyPatch,
+    cells: int,
+    words: tuple,
+    cost_model: SearchCostModel,
+    expected: tuple,
+) -> None:
+    """Test words are searched in parallel only if it pays off."""
+    monkeypatch.setattr(tuning.os, 'cpu_count', lambda: 4)
+    monkeypatch.setattr(tuning, 'is_free_threaded', lambda: False)
+    actual = plan_executor(cells, words, cost_model)
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+@pytest.mark.parametrize(
+    'executor_kind, expected',
+    (('inline', ('inline', 1)), ('thread', ('thread', 2))),
+)
+def test_plan_explicit_executor(
+    monkeypatch: pytest.MonkeyPatch, executor_kind: str, expected: tuple
+) -> None:
+    """Test an explicit kind of an executor is kept."""
+    monkeypatch.setattr(tuning.os, 'cpu_count', lambda: 4)
+    actual = plan_executor(
+        100, ('foo', 'bar'), SearchCostModel(), executor_kind
+    )
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'
+
+
+def test_compiled_modules() -> None:
+    """Test modules are reported compiled only if they are not imported from
+    Python sources."""
+    expected = [
+        name
+        for name in (
+            'puzzle.grids',
+            'puzzle.placements',
+            'puzzle.puzzles',
+            'puzzle.bitmasks',
+            'puzzle.costs',
+            'puzzle.indexes',
+        )
+        if not str(import_module(name).__file__).endswith('.py')
+    ]
+    actual = compiled_modules()
+    assert expected == actual, f'Expected: {expected} != Actual: {actual}'